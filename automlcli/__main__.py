@@ -11,9 +11,10 @@ else:
     LEVEL = logging.INFO
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(os.path.join(__file__, os.pardir))))
-logging.basicConfig(
-    format="%(asctime)s - %(levelname)s - %(name)s - %(message)s", level=LEVEL
-)
+
+from automlcli.settings import LOG_FORMAT  # noqa: E402
+
+logging.basicConfig(format=LOG_FORMAT, level=LEVEL)
 
 from automlcli.commands import main  # noqa: E402
 
@@ -0,0 +1,134 @@
+import copy
+import json
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+from urllib.parse import urlparse
+
+import joblib
+import minato
+
+from automlcli import __version__
+from automlcli.exceptions import ConfigurationError
+from automlcli.models import Model, ModelEnsemble
+from automlcli.prefetch import cached_path, prefetch
+from automlcli.profiling import profile_stage
+from automlcli.util import ext_match
+
+ARTIFACT_VERSION = 1
+METADATA_FILENAME = "metadata.json"
+MODEL_FILENAME = "model.pkl"
+ESTIMATOR_FILENAME = "estimator.joblib"
+
+
+def _join(path: Union[str, Path], filename: str) -> str:
+    return str(path).rstrip("/") + "/" + filename
+
+
+def is_legacy_artifact(path: Union[str, Path]) -> bool:
+    return ext_match(path, ["pkl", "pickle"])
+
+
+def get_artifact_files(path: Union[str, Path]) -> List[str]:
+    if is_legacy_artifact(path):
+        return [str(path)]
+    return [
+        _join(path, filename)
+        for filename in (METADATA_FILENAME, MODEL_FILENAME, ESTIMATOR_FILENAME)
+    ]
+
+
+@profile_stage("save_model")
+def save_model(model: Model, path: Union[str, Path]) -> None:
+    """
+    Save a model into `path`. A path with `.pkl` / `.pickle` extension is
+    written as a single pickle file. Otherwise `path` is treated as a
+    directory containing a small metadata JSON, the pickled model without
+    its estimator and heavy attributes, and the estimator dumped by joblib
+    so that its numpy arrays can be memory-mapped on load.
+    """
+    if is_legacy_artifact(path):
+        with minato.open(path, "wb") as fp:
+            pickle.dump(model, fp)
+        return
+
+    if urlparse(str(path)).scheme in ("", "file", "osfs"):
+        os.makedirs(urlparse(str(path)).path, exist_ok=True)
+
+    estimator_attribute = model.ESTIMATOR_ATTRIBUTE
+    model_state = copy.copy(model)
+    setattr(model_state, estimator_attribute, None)
+    for attribute in model.ARTIFACT_EXCLUDED_ATTRIBUTES:
+        setattr(model_state, attribute, None)
+
+    with minato.open(_join(path, ESTIMATOR_FILENAME), "wb") as fp:
+        joblib.dump(getattr(model, estimator_attribute), fp)
+
+    with minato.open(_join(path, MODEL_FILENAME), "wb") as fp:
+        pickle.dump(model_state, fp)
+
+    model_class = type(model)
+    metadata: Dict[str, Any] = {
+        "version": ARTIFACT_VERSION,
+        "automlcli_version": __version__,
+        "model_class": f"{model_class.__module__}.{model_class.__qualname__}",
+        "estimator_attribute": estimator_attribute,
+    }
+    with minato.open(_join(path, METADATA_FILENAME), "w") as fp:
+        json.dump(metadata, fp, indent=2)
+
+
+@profile_stage("load_model")
+def load_model(path: Union[str, Path], mmap: bool = True) -> Model:
+    """
+    Load a model saved by `save_model`. When `mmap` is true, the estimator
+    arrays are memory-mapped in read-only mode, so set `mmap=False` if the
+    estimator is going to be updated in place.
+    """
+    prefetch(*get_artifact_files(path))
+
+    if is_legacy_artifact(path):
+        with open(cached_path(path), "rb") as fp:
+            return pickle.load(fp)  # type: ignore
+
+    with open(cached_path(_join(path, METADATA_FILENAME))) as fp:
+        metadata = json.load(fp)
+
+    if metadata["version"] > ARTIFACT_VERSION:
+        raise ValueError(
+            f"Unsupported artifact version: {metadata['version']} "
+            f"(supported version <= {ARTIFACT_VERSION})"
+        )
+
+    with open(cached_path(_join(path, MODEL_FILENAME)), "rb") as fp:
+        model = pickle.load(fp)  # type: Model
+
+    estimator_path = cached_path(_join(path, ESTIMATOR_FILENAME))
+    estimator = joblib.load(estimator_path, mmap_mode="r" if mmap else None)
+    setattr(model, metadata["estimator_attribute"], estimator)
+
+    return model
+
+
+def load_ensemble(
+    paths: Sequence[Union[str, Path]],
+    names: Optional[Sequence[str]] = None,
+    method: Optional[str] = None,
+) -> ModelEnsemble:
+    """
+    Load models concurrently into a `ModelEnsemble`. Models are named by
+    `names`, or `model0`, `model1`, ... in the order of `paths`.
+    """
+    if names is None:
+        names = [f"model{i}" for i in range(len(paths))]
+    if len(names) != len(paths) or len(set(names)) != len(names):
+        raise ConfigurationError(
+            f"Expected {len(paths)} unique model names, got {names}"
+        )
+
+    prefetch(*(file for path in paths for file in get_artifact_files(path)))
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        models = list(executor.map(load_model, paths))
+    return ModelEnsemble(dict(zip(names, models)), method)
@@ -0,0 +1,128 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy
+
+from automlcli.prefetch import cached_path
+from automlcli.settings import DATA_CACHE_DIR, DATA_CACHE_MAX_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+def _load_array(path: Path) -> numpy.ndarray:
+    try:
+        return numpy.load(path, mmap_mode="r")  # type: ignore
+    except ValueError:
+        # Python objects in the dtype
+        return numpy.load(path, allow_pickle=True)  # type: ignore
+
+
+class ArrayCache:
+    """
+    On-disk cache of preprocessed arrays. Each entry is a directory of `.npy`
+    files which are opened with `mmap_mode="r"`, so a cache hit costs only a
+    few file opens. Arrays of object dtype (e.g. string labels) cannot be
+    memory-mapped, so they are pickled and loaded into memory. Entries are
+    evicted in least-recently-used order once the total size exceeds
+    `max_size` bytes.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path] = DATA_CACHE_DIR,
+        max_size: int = DATA_CACHE_MAX_SIZE,
+    ) -> None:
+        self._cache_dir = Path(cache_dir)
+        self._max_size = max_size
+
+    @staticmethod
+    def make_key(
+        file_path: Union[str, Path, Sequence[Union[str, Path]]],
+        params: Dict[str, Any],
+    ) -> str:
+        """
+        Make a key from `params` and the name, size and mtime of the file, or
+        of each shard if a list of files is given.
+        """
+        file_paths = [file_path] if isinstance(file_path, (str, Path)) else file_path
+        files = []
+        for path in file_paths:
+            stat = os.stat(cached_path(path))
+            files.append(
+                {"file": str(path), "size": stat.st_size, "mtime": stat.st_mtime_ns}
+            )
+        fingerprint = {"files": files, "params": params}
+        content = json.dumps(fingerprint, sort_keys=True, default=str)
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, numpy.ndarray]]:
+        entry_dir = self._cache_dir / key
+        if not entry_dir.is_dir():
+            return None
+
+        os.utime(entry_dir)
+        arrays = {path.stem: _load_array(path) for path in entry_dir.glob("*.npy")}
+        logger.debug("Cache hit: %s", key)
+        return arrays
+
+    def put(self, key: str, arrays: Dict[str, numpy.ndarray]) -> None:
+        entry_dir = self._cache_dir / key
+        if entry_dir.exists():
+            return
+
+        os.makedirs(self._cache_dir, exist_ok=True)
+        tempdir = tempfile.mkdtemp(dir=self._cache_dir, prefix=".tmp-")
+        try:
+            for name, array in arrays.items():
+                numpy.save(os.path.join(tempdir, f"{name}.npy"), array)
+            os.rename(tempdir, entry_dir)
+        except OSError:
+            # Another process may have stored the same entry concurrently.
+            shutil.rmtree(tempdir, ignore_errors=True)
+            return
+
+        self.evict()
+
+    def evict(self) -> None:
+        entries: List[Tuple[float, int, Path]] = []
+        for entry_dir in self._cache_dir.iterdir():
+            if not entry_dir.is_dir() or entry_dir.name.startswith("."):
+                continue
+            size = sum(path.stat().st_size for path in entry_dir.glob("*.npy"))
+            entries.append((entry_dir.stat().st_mtime, size, entry_dir))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_dir in sorted(entries):
+            if total_size <= self._max_size:
+                break
+            logger.debug("Evict cache entry: %s", entry_dir.name)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_size -= size
+
+
+_cache_enabled = True
+_array_cache: Optional[ArrayCache] = None
+
+
+def set_cache_enabled(enabled: bool) -> None:
+    global _cache_enabled
+    _cache_enabled = enabled
+
+
+def get_array_cache() -> Optional[ArrayCache]:
+    global _array_cache
+    if not _cache_enabled:
+        return None
+    if _array_cache is None:
+        _array_cache = ArrayCache()
+    return _array_cache
+
+
+def is_cache_enabled() -> bool:
+    return _cache_enabled
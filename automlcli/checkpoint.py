@@ -0,0 +1,63 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import List, Optional, Union
+
+
+class SearchState:
+    """
+    Elapsed time of an AutoML search which may span several resumed runs,
+    stored in `workdir/search_state.json`. A run is assumed to have made
+    progress until the last modification of any of `progress_files`, so the
+    elapsed time of a killed run is recovered without a clean shutdown.
+    """
+
+    FILENAME = "search_state.json"
+
+    def __init__(
+        self,
+        workdir: Union[str, Path],
+        progress_files: List[Union[str, Path]],
+    ) -> None:
+        self._state_file = Path(workdir) / self.FILENAME
+        self._progress_files = [Path(path) for path in progress_files]
+
+    def _last_progress(self) -> Optional[float]:
+        mtimes: List[float] = []
+        for path in self._progress_files:
+            if path.is_dir():
+                mtimes.extend(child.stat().st_mtime for child in path.iterdir())
+            if path.exists():
+                mtimes.append(path.stat().st_mtime)
+        return max(mtimes, default=None)
+
+    def elapsed(self) -> float:
+        if not self._state_file.is_file():
+            return 0.0
+
+        with open(self._state_file) as fp:
+            state = json.load(fp)
+
+        elapsed = float(state["elapsed"])
+        last_progress = self._last_progress()
+        if last_progress is not None:
+            elapsed += max(0.0, last_progress - state["started_at"])
+        return elapsed
+
+    def start(self, resume: bool = False) -> float:
+        """
+        Record the start of a run and return the time already spent by
+        previous runs (always zero unless `resume` is given).
+        """
+        elapsed = self.elapsed() if resume else 0.0
+        state = {"elapsed": elapsed, "started_at": time.time()}
+        temp_file = self._state_file.with_suffix(".tmp")
+        with open(temp_file, "w") as fp:
+            json.dump(state, fp)
+        os.replace(temp_file, self._state_file)
+        return elapsed
+
+
+def remaining_budget(budget: float, elapsed: float) -> float:
+    return max(0.0, budget - elapsed)
@@ -4,8 +4,10 @@ from typing import Optional
 import colt
 
 from automlcli import __version__
+from automlcli.cache import set_cache_enabled
 from automlcli.commands.subcommand import Subcommand
 from automlcli.plugins import import_plugins
+from automlcli.profiling import PROFILE_REPORTS, enable_profiling
 
 
 def create_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
@@ -28,6 +30,30 @@ def create_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
                 default=[],
                 help="additional modules to include",
             )
+        subcommand.parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="do not use the preprocessed data cache",
+        )
+        subcommand.parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="record wall time, cpu time and peak memory of each stage",
+        )
+        subcommand.parser.add_argument(
+            "--profile-dir",
+            type=str,
+            default=None,
+            help="directory in which to save timings.json "
+            "(defaults to the training output or the current directory)",
+        )
+        subcommand.parser.add_argument(
+            "--profiler",
+            type=str,
+            choices=PROFILE_REPORTS,
+            default=None,
+            help="also save a function-level profile report",
+        )
 
     return parser
 
@@ -42,7 +68,19 @@ def main(prog: Optional[str] = None) -> None:
     if func is None:
         parser.parse_args(["--help"])
 
+    set_cache_enabled(not args.no_cache)
+
     if hasattr(args, "module"):
         colt.import_modules(args.module)
 
-    func(args)
+    if not args.profile:
+        func(args)
+        return
+
+    profiler = enable_profiling(args.profile_dir, args.profiler)
+    try:
+        with profiler.stage("total"):
+            func(args)
+    finally:
+        if profiler.output_dir is not None or not profiler.saved:
+            profiler.save(profiler.output_dir or ".")
@@ -1,14 +1,16 @@
 import argparse
 import json
 import logging
-import pickle
+from typing import Any, Dict
 
 import minato
-from sklearn.metrics import get_scorer
-from sklearn.model_selection import cross_validate
+import numpy
 
+from automlcli.artifacts import get_artifact_files, load_model
 from automlcli.commands.subcommand import Subcommand
-from automlcli.models import Model
+from automlcli.evaluation import cross_evaluate, evaluate
+from automlcli.prefetch import prefetch
+from automlcli.shards import expand_data_path
 
 logger = logging.getLogger(__name__)
 
@@ -23,12 +25,13 @@ class EvaluateCommand(Subcommand):
         self.parser.add_argument(
             "model",
             type=str,
-            help="path to an automl configuration file",
+            help="path to a trained model",
         )
         self.parser.add_argument(
             "data",
             type=str,
-            help="path to a training data file",
+            nargs="+",
+            help="path to data files, glob patterns or directories",
         )
         self.parser.add_argument(
             "--scoring",
@@ -43,6 +46,12 @@ class EvaluateCommand(Subcommand):
             default=None,
             help="cross validation strategy",
         )
+        self.parser.add_argument(
+            "--n-jobs",
+            type=int,
+            default=-1,
+            help="number of jobs to run cross validation in parallel",
+        )
         self.parser.add_argument(
             "--output-file",
             type=str,
@@ -51,34 +60,36 @@ class EvaluateCommand(Subcommand):
         )
 
     def run(self, args: argparse.Namespace) -> None:
+        # Data files are downloaded while the model is loaded.
+        prefetch(*get_artifact_files(args.model), *expand_data_path(args.data))
+
         logger.info("Load model from %s", args.model)
-        with minato.open(args.model, "rb") as fp:
-            model = pickle.load(fp)  # type: Model
+        model = load_model(args.model)
 
         estimator = model.estimator
         logger.info("Estimator: %s", estimator)
 
-        logger.info("Load data from %s", args.data)
+        logger.info("Load data from %s", " ".join(args.data))
         X, y = model.load_data(args.data)
         if y is None:
-            raise ValueError(f"Target column not found: {args.data}")
+            raise ValueError(f"Target column not found: {' '.join(args.data)}")
 
         logger.info("Evaluate model")
         scoring = args.scoring or ["accuracy"]
-        scorers = {scoring: get_scorer(scoring) for scoring in scoring}
+        metrics: Dict[str, Any]
         if args.cv is None:
-            metrics = {
-                metric: scorer(estimator, X, y) for metric, scorer in scorers.items()
-            }
+            metrics = evaluate(estimator, X, y, scoring)
             for metric, score in metrics.items():
                 print(f"{metric:24s} : {score:.4f}")
         else:
-            metrics = cross_validate(
-                estimator, X, y, cv=args.cv, scoring=scoring, n_jobs=-1
+            metrics = cross_evaluate(
+                estimator, X, y, scoring, cv=args.cv, n_jobs=args.n_jobs
             )
             for metric, scores in metrics.items():
-                print(f"{metric:24s}: {scores.mean():.4f} +/- {scores.std():.4f}")
-                metrics[metric] = list(scores)
+                print(
+                    f"{metric:24s}: {numpy.mean(scores):.4f} "
+                    f"+/- {numpy.std(scores):.4f}"
+                )
 
         if args.output_file is not None:
             logger.info("Save predictions to %s", args.output_file)
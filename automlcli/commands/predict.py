@@ -1,16 +1,57 @@
 import argparse
+import functools
 import logging
-import pickle
+import posixpath
 import sys
+from contextlib import ExitStack
+from typing import Any, Dict, Iterable, List, Optional
 
-import minato
+import pandas
 
+from automlcli.artifacts import get_artifact_files, load_ensemble, load_model
 from automlcli.commands.subcommand import Subcommand
-from automlcli.models import Model
+from automlcli.compression import COMPRESSION_SUFFIXES, COMPRESSIONS, get_compression
+from automlcli.exceptions import ConfigurationError
+from automlcli.io import PredictionWriter, open_prediction_writer
+from automlcli.models import Model, ModelEnsemble
+from automlcli.parallel import (
+    ModelSource,
+    parallel_predict,
+    parallel_predict_shards,
+    predict_shard,
+    split_dataframe,
+)
+from automlcli.prefetch import prefetch
+from automlcli.shards import expand_data_path, get_shard_names
 
 logger = logging.getLogger(__name__)
 
 
+def _write_predictions(
+    predictions: Iterable[pandas.DataFrame],
+    writers: List[PredictionWriter],
+) -> None:
+    for chunk in predictions:
+        for writer in writers:
+            writer.write(chunk)
+
+
+def _get_output_shard(
+    output_dir: str,
+    shard_name: str,
+    file_format: str,
+    compression: Optional[str],
+) -> str:
+    # e.g. dt=2021-01-01/part-0.csv.gz -> {output_dir}/dt=2021-01-01/part-0.csv
+    if get_compression(shard_name) is not None:
+        shard_name = posixpath.splitext(shard_name)[0]
+    output_file = f"{output_dir.rstrip('/')}/{posixpath.splitext(shard_name)[0]}"
+    output_file += f".{file_format}"
+    if compression is not None:
+        output_file += COMPRESSION_SUFFIXES[compression]
+    return output_file
+
+
 @Subcommand.register(
     name="predict",
     description="make predition by the trained model",
@@ -21,25 +62,104 @@ class PredictCommand(Subcommand):
         self.parser.add_argument(
             "model",
             type=str,
-            help="path to an automl configuration file",
+            help="path to a trained model",
         )
         self.parser.add_argument(
-            "data",
+            "--model",
+            type=str,
+            action="append",
+            dest="models",
+            default=[],
+            help="path to another trained model to predict the same data with",
+        )
+        self.parser.add_argument(
+            "--model-name",
             type=str,
-            help="path to a training data file",
+            action="append",
+            dest="model_names",
+            default=None,
+            help="name of each model used as the suffix of its prediction columns",
+        )
+        self.parser.add_argument(
+            "--ensemble",
+            type=str,
+            choices=ModelEnsemble.METHODS,
+            default=None,
+            help="add a column combining the predictions of multiple models",
         )
         self.parser.add_argument(
+            "data",
+            type=str,
+            nargs="+",
+            help="path to data files, glob patterns or directories",
+        )
+        output_group = self.parser.add_mutually_exclusive_group()
+        output_group.add_argument(
             "--output-file",
             type=str,
             default=None,
             help="path to a output file of prediction",
         )
+        output_group.add_argument(
+            "--output-dir",
+            type=str,
+            default=None,
+            help="path to a directory to write one output file per input shard",
+        )
+        self.parser.add_argument(
+            "--output-format",
+            type=str,
+            choices=PredictionWriter.FORMATS,
+            default="csv",
+            help="format of output files in --output-dir",
+        )
+        self.parser.add_argument(
+            "--output-compression",
+            type=str,
+            choices=COMPRESSIONS,
+            default=None,
+            help="compression of the output file (inferred from its extension)",
+        )
+        self.parser.add_argument(
+            "--compression-level",
+            type=int,
+            default=None,
+            help="compression level of the output file",
+        )
         self.parser.add_argument(
             "--output-column",
             type=str,
             default=None,
             help="column name of prediction",
         )
+        self.parser.add_argument(
+            "--proba",
+            action="store_true",
+            help="add class probability columns",
+        )
+        self.parser.add_argument(
+            "--top-k",
+            type=int,
+            default=None,
+            help="add columns of the k most probable labels and their probabilities",
+        )
+        self.parser.add_argument(
+            "--decision-function",
+            action="store_true",
+            help="add decision score columns",
+        )
+        self.parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=None,
+            help="number of rows to read and predict at once (streaming mode)",
+        )
+        self.parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="number of worker processes to make predictions in parallel",
+        )
         self.parser.add_argument(
             "--quiet",
             action="store_true",
@@ -47,24 +167,149 @@ class PredictCommand(Subcommand):
         )
 
     def run(self, args: argparse.Namespace) -> None:
-        logger.info("Load model from %s", args.model)
-        with minato.open(args.model, "rb") as fp:
-            model = pickle.load(fp)  # type: Model
+        predict_options: Dict[str, Any] = {
+            "proba": args.proba,
+            "top_k": args.top_k,
+            "decision": args.decision_function,
+        }
+
+        data_files = expand_data_path(args.data)
+        model_paths = [args.model, *args.models]
+        if len(model_paths) == 1 and args.ensemble is not None:
+            raise ConfigurationError("--ensemble requires multiple models.")
 
-        logger.info("Make predictions for %s", args.data)
-        predictions = model.predict(
-            args.data,
-            prediction_column=args.output_column,
+        # Data files are downloaded while the models are loaded.
+        prefetch(
+            *(file for path in model_paths for file in get_artifact_files(path)),
+            *data_files,
         )
 
+        logger.info("Load model from %s", " ".join(model_paths))
+        model_source: ModelSource = args.model
+        if len(model_paths) > 1:
+            # The data is loaded once and predicted by all models.
+            model_source = functools.partial(
+                load_ensemble, model_paths, args.model_names, args.ensemble
+            )
+            model: Model = model_source()
+        else:
+            model = load_model(args.model)
+
+        if args.output_dir is not None:
+            self._predict_shards(args, model, model_source, data_files, predict_options)
+            return
+
+        logger.info("Make predictions for %s", " ".join(args.data))
+        predictions: Iterable[pandas.DataFrame]
+        if args.workers is not None and args.workers > 1:
+            logger.info("Parallel mode with %d workers", args.workers)
+            partitions: Iterable[pandas.DataFrame]
+            if args.chunk_size is None:
+                partitions = split_dataframe(
+                    model.load_dataframe(data_files, with_target=False),
+                    args.workers,
+                )
+            else:
+                partitions = model.iter_dataframes(
+                    data_files, args.chunk_size, with_target=False
+                )
+            predictions = parallel_predict(
+                model_source,
+                partitions,
+                args.workers,
+                prediction_column=args.output_column,
+                **predict_options,
+            )
+        elif args.chunk_size is None:
+            predictions = [
+                model.predict(
+                    data_files,
+                    prediction_column=args.output_column,
+                    **predict_options,
+                )
+            ]
+        else:
+            logger.info("Streaming mode with chunk size: %d", args.chunk_size)
+            predictions = model.predict_iter(
+                data_files,
+                args.chunk_size,
+                prediction_column=args.output_column,
+                **predict_options,
+            )
+
         index = model.index_column is not None
 
-        if not args.quiet:
-            predictions.to_csv(sys.stdout, index=index)
+        with ExitStack() as stack:
+            writers: List[PredictionWriter] = []
+            if not args.quiet:
+                writers.append(PredictionWriter(sys.stdout, "csv", index))
+
+            if args.output_file is not None:
+                logger.info("Save predictions to %s", args.output_file)
+                writer = stack.enter_context(
+                    open_prediction_writer(
+                        args.output_file,
+                        index,
+                        args.output_compression,
+                        args.compression_level,
+                    )
+                )
+                writers.append(writer)
+
+            _write_predictions(predictions, writers)
+
+        logger.info("Done!")
+
+    def _predict_shards(
+        self,
+        args: argparse.Namespace,
+        model: Model,
+        model_source: ModelSource,
+        data_files: List[str],
+        predict_options: Dict[str, Any],
+    ) -> None:
+        shards = [
+            (
+                data_file,
+                _get_output_shard(
+                    args.output_dir,
+                    shard_name,
+                    args.output_format,
+                    args.output_compression,
+                ),
+            )
+            for data_file, shard_name in zip(data_files, get_shard_names(data_files))
+        ]
+        write_options = {
+            "compression": args.output_compression,
+            "compression_level": args.compression_level,
+        }
+
+        logger.info("Save predictions of %d shards to %s", len(shards), args.output_dir)
+        if args.workers is not None and args.workers > 1:
+            logger.info("Parallel mode with %d workers", args.workers)
+            output_files: Iterable[str] = parallel_predict_shards(
+                model_source,
+                shards,
+                args.workers,
+                prediction_column=args.output_column,
+                write_options=write_options,
+                **predict_options,
+            )
+        else:
+            output_files = (
+                predict_shard(
+                    model,
+                    data_file,
+                    output_file,
+                    prediction_column=args.output_column,
+                    write_options=write_options,
+                    **predict_options,
+                )
+                for data_file, output_file in shards
+            )
 
-        if args.output_file is not None:
-            logger.info("Save predictions to %s", args.output_file)
-            with minato.open(args.output_file, "wb") as fp:
-                predictions.to_csv(fp, index=index)
+        for output_file in output_files:
+            logger.info("Saved %s", output_file)
 
         logger.info("Done!")
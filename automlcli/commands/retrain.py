@@ -1,11 +1,10 @@
 import argparse
 import logging
-import pickle
-
-import minato
 
+from automlcli.artifacts import get_artifact_files, load_model, save_model
 from automlcli.commands.subcommand import Subcommand
-from automlcli.models import Model
+from automlcli.prefetch import prefetch
+from automlcli.shards import expand_data_path
 
 logger = logging.getLogger(__name__)
 
@@ -20,12 +19,13 @@ class RetrainCommand(Subcommand):
         self.parser.add_argument(
             "model",
             type=str,
-            help="path to an automl configuration file",
+            help="path to a trained model",
         )
         self.parser.add_argument(
             "data",
             type=str,
-            help="path to a training data file",
+            nargs="+",
+            help="path to data files, glob patterns or directories",
         )
         self.parser.add_argument(
             "output",
@@ -33,16 +33,46 @@ class RetrainCommand(Subcommand):
             default=None,
             help="path to a output file of retrained model",
         )
+        self.parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="update the model with chunks of data if it supports partial_fit "
+            "or warm starting, otherwise fall back to a full refit",
+        )
+        self.parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=10000,
+            help="number of rows in a chunk for incremental retraining",
+        )
+        self.parser.add_argument(
+            "--rounds-per-chunk",
+            type=int,
+            default=None,
+            help="number of boosting rounds added for each chunk in incremental "
+            "retraining of LightGBM / XGBoost models, which are refitted "
+            "from scratch without it",
+        )
 
     def run(self, args: argparse.Namespace) -> None:
+        # Data files are downloaded while the model is loaded.
+        prefetch(*get_artifact_files(args.model), *expand_data_path(args.data))
+
         logger.info("Load model from %s", args.model)
-        with minato.open(args.model, "rb") as fp:
-            model = pickle.load(fp)  # type: Model
+        model = load_model(args.model, mmap=False)
 
-        logger.info("Retrain model with %s", args.data)
-        model.retrain(args.data)
+        logger.info("Retrain model with %s", " ".join(args.data))
+        if args.incremental and model.retrain_incrementally(
+            args.data, args.chunk_size, args.rounds_per_chunk
+        ):
+            logger.info("Model was retrained incrementally")
+        else:
+            if args.incremental:
+                logger.info("Estimator does not support incremental retraining")
+            model.retrain(args.data)
+            logger.info("Model was retrained from scratch")
 
-        with minato.open(args.output, "wb") as fp:
-            pickle.dump(model, fp)
+        logger.info("Save retrained model to %s", args.output)
+        save_model(model, args.output)
 
         logger.info("Done!")
@@ -0,0 +1,90 @@
+import argparse
+import logging
+
+from automlcli.artifacts import load_model
+from automlcli.commands.subcommand import Subcommand
+from automlcli.serving import MicroBatcher, create_server
+
+logger = logging.getLogger(__name__)
+
+
+@Subcommand.register(
+    name="serve",
+    description="serve predictions of the trained model over HTTP",
+    help="serve predictions of the trained model over HTTP",
+)
+class ServeCommand(Subcommand):
+    def set_arguments(self) -> None:
+        self.parser.add_argument(
+            "model",
+            type=str,
+            help="path to a trained model",
+        )
+        self.parser.add_argument(
+            "--host",
+            type=str,
+            default="127.0.0.1",
+            help="host name to listen on",
+        )
+        self.parser.add_argument(
+            "--port",
+            type=int,
+            default=8080,
+            help="port number to listen on",
+        )
+        self.parser.add_argument(
+            "--unix-socket",
+            type=str,
+            default=None,
+            help="path to a unix domain socket to listen on instead of host/port",
+        )
+        self.parser.add_argument(
+            "--output-column",
+            type=str,
+            default=None,
+            help="column name of prediction",
+        )
+        self.parser.add_argument(
+            "--max-batch-size",
+            type=int,
+            default=256,
+            help="maximum number of rows in a micro-batch",
+        )
+        self.parser.add_argument(
+            "--max-wait-ms",
+            type=float,
+            default=5.0,
+            help="maximum time in milliseconds to wait for filling a micro-batch",
+        )
+
+    def run(self, args: argparse.Namespace) -> None:
+        logger.info("Load model from %s", args.model)
+        model = load_model(args.model)
+
+        batcher = MicroBatcher(
+            lambda df: model.predict_dataframe(df, args.output_column),
+            max_batch_size=args.max_batch_size,
+            max_wait=args.max_wait_ms / 1000,
+        )
+        server = create_server(
+            model,
+            batcher,
+            host=args.host,
+            port=args.port,
+            unix_socket=args.unix_socket,
+        )
+
+        batcher.start()
+        try:
+            if args.unix_socket is not None:
+                logger.info("Serving on %s", args.unix_socket)
+            else:
+                logger.info("Serving on http://%s:%d", args.host, args.port)
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            batcher.stop()
+
+        logger.info("Done!")
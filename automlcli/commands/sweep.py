@@ -0,0 +1,283 @@
+import argparse
+import inspect
+import itertools
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, cast
+from urllib.parse import urlparse
+
+import minato
+import pandas
+from omegaconf import OmegaConf
+
+from automlcli.commands.subcommand import Subcommand
+from automlcli.commands.train import train
+from automlcli.configs import load_yaml
+from automlcli.exceptions import ConfigurationError
+from automlcli.models.model import Model
+from automlcli.prefetch import cached_path, prefetch
+from automlcli.resources import limit_threads
+from automlcli.shards import DataPath, expand_data_path
+
+logger = logging.getLogger(__name__)
+
+
+def expand_sweep(spec: Dict[str, Any]) -> List[List[str]]:
+    """
+    Expand a sweep specification into a list of override sets. `grid` maps
+    config keys to lists of values and produces their cartesian product, and
+    `overrides` is a list of explicit override sets.
+    """
+    override_sets: List[List[str]] = []
+
+    grid = spec.get("grid", {})
+    if grid:
+        keys = list(grid)
+        for values in itertools.product(*(grid[key] for key in keys)):
+            override_sets.append(
+                [f"{key}={json.dumps(value)}" for key, value in zip(keys, values)]
+            )
+
+    for overrides in spec.get("overrides", []):
+        if isinstance(overrides, dict):
+            overrides = [f"{k}={json.dumps(v)}" for k, v in overrides.items()]
+        override_sets.append(list(overrides))
+
+    if not override_sets:
+        raise ConfigurationError("Sweep spec must contain `grid` or `overrides`.")
+
+    return override_sets
+
+
+def _run_job(
+    job_id: str,
+    config_file: str,
+    overrides: List[str],
+    train_file: Optional[DataPath],
+    validation_file: Optional[DataPath],
+    serialization_dir: str,
+    force: bool,
+    cpus: int,
+) -> Dict[str, Any]:
+    result: Dict[str, Any] = {"job": job_id, "overrides": overrides}
+    limit_threads(cpus)
+    try:
+        result["metrics"] = train(
+            config_file,
+            overrides=overrides,
+            train_file=train_file,
+            validation_file=validation_file,
+            serialization_dir=serialization_dir,
+            force=force,
+        )
+        result["status"] = "completed"
+    except Exception as e:  # noqa: B902
+        logger.exception("Job %s failed", job_id)
+        result["status"] = "failed"
+        result["error"] = repr(e)
+    return result
+
+
+def _accepts_n_jobs(model_config: Dict[str, Any]) -> bool:
+    try:
+        model_class = Model.by_name(model_config["type"])
+    except Exception:  # noqa: B902
+        return False
+    parameters = inspect.signature(model_class).parameters.values()
+    return any(
+        param.name == "n_jobs" or param.kind == param.VAR_KEYWORD
+        for param in parameters
+    )
+
+
+def _with_cpu_quota(
+    config_file: str,
+    overrides: List[str],
+    cpus_per_job: int,
+) -> Tuple[List[str], int]:
+    """
+    Return the overrides of a job and the number of cpus it uses. The job
+    uses `n_jobs` of its model config if given (-1 for all cpus), and
+    otherwise `n_jobs` is set to `cpus_per_job` if the model accepts it.
+    """
+    config = load_yaml(cached_path(config_file), overrides)
+    prefix = ""
+    if isinstance(config.get("automlcli"), dict):
+        config = config["automlcli"]
+        prefix = "automlcli."
+
+    resources = config.get("resources") or {}
+    if resources.get("cpus") is not None:
+        # Resource limits override n_jobs of the model.
+        return overrides, int(resources["cpus"])
+
+    model_config = config.get("model") or {}
+    n_jobs = model_config.get("n_jobs")
+    if n_jobs is not None:
+        n_jobs = int(n_jobs)
+        return overrides, n_jobs if n_jobs > 0 else (os.cpu_count() or 1)
+
+    if _accepts_n_jobs(model_config):
+        overrides = overrides + [f"{prefix}model.n_jobs={cpus_per_job}"]
+    return overrides, cpus_per_job
+
+
+@Subcommand.register(
+    name="sweep",
+    description="train models over a grid or list of config overrides in parallel",
+    help="train models over a grid or list of config overrides in parallel",
+)
+class SweepCommand(Subcommand):
+    def set_arguments(self) -> None:
+        self.parser.add_argument(
+            "config",
+            type=str,
+            help="path to an automl configuration file",
+        )
+        self.parser.add_argument(
+            "sweep",
+            type=str,
+            help="path to a sweep specification file with `grid` or `overrides`",
+        )
+        self.parser.add_argument(
+            "-s",
+            "--serialization-dir",
+            type=str,
+            required=True,
+            help="directory in which to save the models and the leaderboard",
+        )
+        self.parser.add_argument(
+            "--train",
+            type=str,
+            nargs="+",
+            default=None,
+            help="path to training data files, glob patterns or directories",
+        )
+        self.parser.add_argument(
+            "--validation",
+            type=str,
+            nargs="+",
+            default=None,
+            help="path to validation data files, glob patterns or directories",
+        )
+        self.parser.add_argument(
+            "--overrides",
+            action="append",
+            default=[],
+            help="arguments to override config values of all jobs",
+        )
+        self.parser.add_argument(
+            "--cpus-per-job",
+            type=int,
+            default=1,
+            help="number of cpus assigned to each job "
+            "(used as model.n_jobs unless it is set in the config)",
+        )
+        self.parser.add_argument(
+            "--max-workers",
+            type=int,
+            default=None,
+            help="number of jobs to run concurrently",
+        )
+        self.parser.add_argument(
+            "--sort-by",
+            type=str,
+            default=None,
+            help="metric name to sort the leaderboard by",
+        )
+        self.parser.add_argument(
+            "--ascending",
+            action="store_true",
+            help="sort the leaderboard in ascending order",
+        )
+        self.parser.add_argument(
+            "-f",
+            "--force",
+            action="store_true",
+            required=False,
+            help="overwrite the output directories if they exist",
+        )
+
+    def run(self, args: argparse.Namespace) -> None:
+        # Download shared inputs once, before the jobs are started.
+        train_files = expand_data_path(args.train) or None
+        validation_files = expand_data_path(args.validation) or None
+        prefetch(
+            args.sweep,
+            args.config,
+            *(train_files or []),
+            *(validation_files or []),
+        )
+
+        logger.info("Load sweep spec from %s", args.sweep)
+        spec = OmegaConf.to_container(OmegaConf.load(cached_path(args.sweep)))
+        if not isinstance(spec, dict):
+            raise ConfigurationError(f"Sweep spec should be a dict: {args.sweep}")
+
+        override_sets = expand_sweep(cast(Dict[str, Any], spec))
+
+        # Job processes do not share the downloads of this process, so they
+        # are completed here instead of being fetched again by every job.
+        prefetch(
+            args.config,
+            *(train_files or []),
+            *(validation_files or []),
+            wait=True,
+        )
+
+        jobs = [
+            _with_cpu_quota(args.config, args.overrides + overrides, args.cpus_per_job)
+            for overrides in override_sets
+        ]
+        # Workers are sized for the largest job so that concurrent jobs do
+        # not oversubscribe the cpus.
+        max_cpus = max(cpus for _, cpus in jobs)
+        max_workers = args.max_workers or max(1, (os.cpu_count() or 1) // max_cpus)
+        serialization_dir = args.serialization_dir.rstrip("/")
+        logger.info(
+            "Run %d jobs with %d workers (up to %d cpus per job)",
+            len(jobs),
+            max_workers,
+            max_cpus,
+        )
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _run_job,
+                    f"job-{i:03d}",
+                    args.config,
+                    overrides,
+                    train_files,
+                    validation_files,
+                    f"{serialization_dir}/job-{i:03d}",
+                    args.force,
+                    cpus,
+                )
+                for i, (overrides, cpus) in enumerate(jobs)
+            ]
+            results = [future.result() for future in futures]
+
+        leaderboard = pandas.json_normalize(results)
+        leaderboard.columns = [
+            column.replace("metrics.", "", 1) for column in leaderboard.columns
+        ]
+        if args.sort_by is not None:
+            if args.sort_by in leaderboard.columns:
+                leaderboard = leaderboard.sort_values(
+                    args.sort_by, ascending=args.ascending
+                )
+            else:
+                logger.warning("Metric not found in leaderboard: %s", args.sort_by)
+
+        if urlparse(serialization_dir).scheme in ("", "file", "osfs"):
+            os.makedirs(urlparse(serialization_dir).path, exist_ok=True)
+        with minato.open(f"{serialization_dir}/leaderboard.json", "w") as fp:
+            json.dump(results, fp, indent=2)
+        with minato.open(f"{serialization_dir}/leaderboard.csv", "w") as fp:
+            leaderboard.to_csv(fp, index=False)
+
+        print(leaderboard.to_string(index=False))
+        logger.info("Done!")
@@ -1,49 +1,38 @@
 import argparse
 import json
 import logging
-import pickle
 import sys
-from contextlib import contextmanager
-from typing import Any, Dict, Iterator
+from contextlib import ExitStack, contextmanager
+from types import ModuleType
+from typing import Any, Dict, Iterator, List, Optional
 
-import minato
 import yaml
-from flatten_dict import flatten
-
-try:
-    import mlflow
-
-    # Patch mlflow.log_params to log nested params.
-    _mlflow_log_param = mlflow.log_param
-    _mlflow_log_params = mlflow.log_params
-
-    def _log_params(params: Dict[str, Any]) -> None:
-        flattened_params = flatten(params, reducer="dot")
-        _mlflow_log_params(flattened_params)
-
-    def _log_param(key: str, value: Any) -> None:
-        if isinstance(value, dict):
-            flattened_params = flatten(value, reducer="dot")
-            flattened_params = {f"{key}.k": v for k, v in flattened_params.items()}
-            _log_params(flattened_params)
-        else:
-            _mlflow_log_param(key, value)
-
-    mlflow.log_param = _log_param
-    mlflow.log_params = _log_params
-except ImportError:
-    mlflow = None
 
+from automlcli.artifacts import save_model
 from automlcli.commands.subcommand import Subcommand
 from automlcli.configs import ConfigBuilder, load_yaml
 from automlcli.exceptions import ConfigurationError
+from automlcli.prefetch import cached_path, prefetch
+from automlcli.profiling import get_profiler
+from automlcli.resources import train_with_limits
+from automlcli.shards import DataPath, expand_data_path
+from automlcli.tracking import MlflowLogger
 from automlcli.util import create_workdir
 
 logger = logging.getLogger(__name__)
 
 
+def _import_mlflow() -> Optional[ModuleType]:
+    try:
+        import mlflow
+    except ImportError:
+        return None
+    return mlflow
+
+
 @contextmanager
 def _mlflow_start_run(*args: Any, **kwargs: Any) -> Iterator[Any]:
+    mlflow = _import_mlflow()
     if mlflow is not None:
         with mlflow.start_run(*args, **kwargs) as run:
             yield run
@@ -51,6 +40,119 @@ def _mlflow_start_run(*args: Any, **kwargs: Any) -> Iterator[Any]:
         yield None
 
 
+def train(
+    config_file: str,
+    overrides: Optional[List[str]] = None,
+    train_file: Optional[DataPath] = None,
+    validation_file: Optional[DataPath] = None,
+    serialization_dir: Optional[str] = None,
+    force: bool = False,
+    resume: bool = False,
+) -> Dict[str, float]:
+    # Data files given as arguments are downloaded while the config is built.
+    prefetch(
+        config_file,
+        *expand_data_path(train_file),
+        *expand_data_path(validation_file),
+    )
+
+    logger.info("Load config from %s", config_file)
+    config = load_yaml(cached_path(config_file), overrides)
+
+    logger.info("Configuration: %s", str(config))
+    builder = ConfigBuilder.build(config)
+    model = builder.model
+    train_file = train_file or builder.train_file
+    validation_file = validation_file or builder.validation_file
+    prefetch(*expand_data_path(train_file), *expand_data_path(validation_file))
+
+    if not train_file:
+        raise ConfigurationError("train file is required.")
+
+    logger.info("Start training...")
+    logger.info("Training data: %s", str(train_file))
+    logger.info("Validation data: %s", str(validation_file))
+
+    params = {
+        "command": " ".join(sys.argv),
+        "config_file": config_file,
+        "train_file": train_file,
+        "validation_file": validation_file,
+        "serialization_dir": serialization_dir,
+        "config": config,
+    }
+
+    if resume and serialization_dir is None:
+        raise ConfigurationError("serialization dir is required to resume training.")
+
+    mlflow = _import_mlflow()
+    with _mlflow_start_run() as run, ExitStack() as stack:
+        if serialization_dir is None and mlflow is None:
+            serialization_dir = "./output"
+
+        # Params, metrics and artifacts are logged in the background, and
+        # pending ones are waited for until the deadline when the run ends.
+        mlflow_logger: Optional[MlflowLogger] = None
+        if run is not None:
+            mlflow_logger = MlflowLogger(run.info.run_id)
+            stack.callback(mlflow_logger.close)
+
+        with create_workdir(
+            serialization_dir,
+            exist_ok=force or resume,
+            restore=resume,
+        ) as workdir:
+            workdir = workdir.absolute()
+            try:
+                with open(workdir / "config.yaml", "w") as f:
+                    yaml.dump(config, f)
+
+                with open(workdir / "params.json", "w") as f:
+                    json.dump(params, f, indent=2)
+
+                if mlflow_logger is not None:
+                    logger.info("Log params to mlflow")
+                    mlflow_logger.log_params(params)
+
+                model, metrics = train_with_limits(
+                    model,
+                    builder.resources,
+                    train_file,
+                    validation_file,
+                    workdir,
+                    resume=resume,
+                )
+
+                if mlflow_logger is not None:
+                    logger.info("Log metrics to mlflow")
+                    mlflow_logger.log_metrics(metrics)
+
+                logger.info("Training completed")
+                logger.info("Training metrics: %s", json.dumps(metrics, indent=2))
+
+                with open(workdir / "metrics.json", "w") as metrics_file:
+                    json.dump(metrics, metrics_file)
+
+                save_model(model, workdir / "model")
+            finally:
+                profiler = get_profiler()
+                if profiler is not None:
+                    if profiler.output_dir is None:
+                        profiler.save(workdir)
+                        # Saved into the serialization dir once more at exit,
+                        # with the `upload` and `total` stages which are still
+                        # running here.
+                        profiler.output_dir = serialization_dir
+                    if mlflow_logger is not None:
+                        mlflow_logger.log_metrics(profiler.get_metrics())
+
+                if mlflow_logger is not None:
+                    logger.info("Log artifacts to mlflow")
+                    mlflow_logger.log_artifacts(workdir)
+
+    return metrics
+
+
 @Subcommand.register(
     name="train",
     description="train a automl model and export the trained model",
@@ -66,8 +168,8 @@ class TrainCommand(Subcommand):
         self.parser.add_argument(
             "train",
             type=str,
-            nargs="?",
-            help="path to a training data file",
+            nargs="*",
+            help="path to training data files, glob patterns or directories",
         )
         self.parser.add_argument(
             "--overrides",
@@ -85,8 +187,9 @@ class TrainCommand(Subcommand):
         self.parser.add_argument(
             "--validation",
             type=str,
+            nargs="+",
             default=None,
-            help="path to a validation data file",
+            help="path to validation data files, glob patterns or directories",
         )
         self.parser.add_argument(
             "-f",
@@ -95,71 +198,21 @@ class TrainCommand(Subcommand):
             required=False,
             help="overwrite the output directory if it exists",
         )
+        self.parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="resume an interrupted search from the checkpoints "
+            "in the output directory",
+        )
 
     def run(self, args: argparse.Namespace) -> None:
-        logger.info("Load config from %s", args.config)
-        config = load_yaml(minato.cached_path(args.config), args.overrides)
-
-        logger.info("Configuration: %s", str(config))
-        builder = ConfigBuilder.build(config)
-        model = builder.model
-        train_file = args.train or builder.train_file
-        validation_file = args.validation or builder.validation_file
-
-        if not train_file:
-            raise ConfigurationError("train file is required.")
-
-        logger.info("Start training...")
-        logger.info("Training data: %s", str(train_file))
-        logger.info("Validation data: %s", str(validation_file))
-
-        params = {
-            "command": " ".join(sys.argv),
-            "config_file": args.config,
-            "train_file": train_file,
-            "validation_file": validation_file,
-            "serialization_dir": args.serialization_dir,
-            "config": config,
-        }
-
-        with _mlflow_start_run():
-            serialization_dir = args.serialization_dir
-            if args.serialization_dir is None and mlflow is None:
-                serialization_dir = "./output"
-
-            with create_workdir(
-                serialization_dir,
-                exist_ok=args.force,
-            ) as workdir:
-                workdir = workdir.absolute()
-                try:
-                    with open(workdir / "config.yaml", "w") as f:
-                        yaml.dump(config, f)
-
-                    with open(workdir / "params.json", "w") as f:
-                        json.dump(params, f, indent=2)
-
-                    if mlflow is not None:
-                        logger.info("Log params to mlflow")
-                        mlflow.log_params(params)
-
-                    metrics = model.train(train_file, validation_file, workdir)
-
-                    if mlflow is not None:
-                        logger.info("Log metrics to mlflow")
-                        mlflow.log_metrics(metrics)
-
-                    logger.info("Training completed")
-                    logger.info("Training metrics: %s", json.dumps(metrics, indent=2))
-
-                    with open(workdir / "metrics.json", "w") as metrics_file:
-                        json.dump(metrics, metrics_file)
-
-                    with open(workdir / "model.pkl", "wb") as model_file:
-                        pickle.dump(model, model_file)
-                finally:
-                    if mlflow is not None:
-                        logger.info("Log metrics to mlflow")
-                        mlflow.log_artifacts(str(workdir))
-
+        train(
+            args.config,
+            overrides=args.overrides,
+            train_file=args.train or None,
+            validation_file=args.validation,
+            serialization_dir=args.serialization_dir,
+            force=args.force,
+            resume=args.resume,
+        )
         logger.info("Done!")
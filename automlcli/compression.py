@@ -0,0 +1,166 @@
+import gzip
+import io
+import logging
+import shutil
+import subprocess
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, List, Optional, Union
+
+from automlcli.util import import_optional_module, is_module_available
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIONS = ("gzip", "zstd")
+COMPRESSION_EXTENSIONS = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+}
+
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def get_compression(file_path: Union[str, Path]) -> Optional[str]:
+    """
+    Infer the compression of a file from its extension (e.g. `train.csv.zst`).
+    """
+    return COMPRESSION_EXTENSIONS.get(Path(str(file_path)).suffix.lower())
+
+
+def _check_process(process: "subprocess.Popen[bytes]", command: List[str]) -> None:
+    returncode = process.wait()
+    if returncode != 0:
+        raise OSError(f"{command[0]} exited with status {returncode}")
+
+
+@contextmanager
+def _read_from_process(command: List[str]) -> Iterator[IO[bytes]]:
+    process = subprocess.Popen(command, stdout=subprocess.PIPE)
+    assert process.stdout is not None
+    try:
+        yield process.stdout
+    except BaseException:
+        process.kill()
+        raise
+    finally:
+        process.stdout.close()
+    _check_process(process, command)
+
+
+@contextmanager
+def open_decompressed(
+    file_path: Union[str, Path],
+    compression: str,
+) -> Iterator[IO[bytes]]:
+    """
+    Open a local compressed file as a stream of decompressed bytes. gzip is
+    decoded by `pigz` if it is installed, which runs reading, decompression
+    and checksumming on separate threads. zstd is decoded by `zstandard`, or
+    by the `zstd` command if the package is not installed.
+    """
+    if compression == "gzip":
+        pigz = shutil.which("pigz")
+        if pigz is not None:
+            with _read_from_process([pigz, "-dc", str(file_path)]) as stream:
+                yield stream
+        else:
+            with gzip.open(file_path, "rb") as stream:
+                yield stream  # type: ignore
+    elif compression == "zstd":
+        if is_module_available("zstandard") or shutil.which("zstd") is None:
+            zstandard = import_optional_module("zstandard")
+            with open(file_path, "rb") as fp:
+                with zstandard.ZstdDecompressor().stream_reader(fp) as stream:
+                    yield stream
+        else:
+            command = [str(shutil.which("zstd")), "-dcq", str(file_path)]
+            with _read_from_process(command) as stream:
+                yield stream
+    else:
+        raise ValueError(f"compression must be one of {COMPRESSIONS}: {compression}")
+
+
+@contextmanager
+def _write_through_process(
+    command: List[str],
+    output: IO[bytes],
+) -> Iterator[IO[bytes]]:
+    process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    assert process.stdin is not None and process.stdout is not None
+    stdout = process.stdout
+
+    # Drain the compressed output in the background so that the output file
+    # can be any (e.g. remote) file object.
+    def copy_output() -> None:
+        shutil.copyfileobj(stdout, output, _COPY_BUFFER_SIZE)
+
+    thread = threading.Thread(target=copy_output, daemon=True)
+    thread.start()
+    try:
+        yield process.stdin
+    except BaseException:
+        process.kill()
+        raise
+    finally:
+        process.stdin.close()
+        thread.join()
+        stdout.close()
+    _check_process(process, command)
+
+
+@contextmanager
+def open_compressed(
+    output: IO[bytes],
+    compression: str,
+    level: Optional[int] = None,
+) -> Iterator[IO[bytes]]:
+    """
+    Wrap a binary file object with a compressing writer. gzip is encoded by
+    `pigz` on all cores if it is installed, and zstd by `zstandard` with its
+    multi-threaded compressor.
+    """
+    if compression == "gzip":
+        level = 6 if level is None else level
+        pigz = shutil.which("pigz")
+        if pigz is not None:
+            with _write_through_process([pigz, "-c", f"-{level}"], output) as stream:
+                yield stream
+        else:
+            with gzip.GzipFile(fileobj=output, mode="wb", compresslevel=level) as gz:
+                yield gz  # type: ignore
+    elif compression == "zstd":
+        zstandard = import_optional_module("zstandard")
+        compressor = zstandard.ZstdCompressor(
+            level=3 if level is None else level, threads=-1
+        )
+        with compressor.stream_writer(output, closefd=False) as writer:
+            # Wrapped so that the writer is recognized as a binary file
+            # object (e.g. by `DataFrame.to_csv`).
+            stream = io.BufferedWriter(writer, _COPY_BUFFER_SIZE)
+            yield stream
+            stream.detach()
+    else:
+        raise ValueError(f"compression must be one of {COMPRESSIONS}: {compression}")
+
+
+@contextmanager
+def decompress_to_temporary_file(
+    file_path: Union[str, Path],
+    compression: str,
+) -> Iterator[Path]:
+    """
+    Decompress a file into a temporary file for formats which need random
+    access (e.g. parquet). The temporary file keeps the inner extension.
+    """
+    with tempfile.TemporaryDirectory() as tempdir:
+        temp_path = Path(tempdir) / Path(str(file_path)).stem
+        with open_decompressed(file_path, compression) as stream:
+            with open(temp_path, "wb") as fp:
+                shutil.copyfileobj(stream, fp, _COPY_BUFFER_SIZE)
+        yield temp_path
@@ -8,7 +8,9 @@ from omegaconf import OmegaConf
 
 from automlcli.exceptions import ConfigurationError
 from automlcli.models import Model
+from automlcli.resources import ResourceLimits
 from automlcli.settings import DEFAULT_COLT_SETTING
+from automlcli.shards import DataPath
 from automlcli.util import set_random_seed
 
 
@@ -54,16 +56,21 @@ class ConfigBuilder:
         model_config = config["model"]
         model = colt.build(model_config, cls=Model, **colt_config)  # type: Model
 
-        return cls(model, train_file, validation_file, test_file)
+        resources = ResourceLimits.from_config(config.get("resources"))
+        model.apply_resource_limits(resources)
+
+        return cls(model, train_file, validation_file, test_file, resources)
 
     def __init__(
         self,
         model: Model,
-        train_file: Optional[str] = None,
-        validation_file: Optional[str] = None,
-        test_file: Optional[str] = None,
+        train_file: Optional[DataPath] = None,
+        validation_file: Optional[DataPath] = None,
+        test_file: Optional[DataPath] = None,
+        resources: Optional[ResourceLimits] = None,
     ) -> None:
         self.model = model
         self.train_file = train_file
         self.validation_file = validation_file
         self.test_file = test_file
+        self.resources = resources or ResourceLimits()
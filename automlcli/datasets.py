@@ -0,0 +1,87 @@
+import logging
+import threading
+import weakref
+from typing import Callable, Dict, List, Optional
+
+import numpy
+
+from automlcli.cache import is_cache_enabled
+
+logger = logging.getLogger(__name__)
+
+Arrays = Dict[str, numpy.ndarray]
+
+
+def _readonly_view(array: numpy.ndarray) -> numpy.ndarray:
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+class DatasetRegistry:
+    """
+    In-process registry of loaded arrays. Every caller of `get_or_load` with
+    the same key receives read-only views of the same arrays, so a file is
+    parsed only once however many models are trained on it. The registry
+    holds weak references only, and an entry is released as soon as the last
+    view is garbage collected.
+    """
+
+    # Loads are serialized by a fixed number of locks striped over the keys.
+    NUM_LOAD_LOCKS = 64
+
+    def __init__(self) -> None:
+        self._arrays: "weakref.WeakValueDictionary[str, numpy.ndarray]"
+        self._arrays = weakref.WeakValueDictionary()
+        self._names: Dict[str, List[str]] = {}
+        self._load_locks = [threading.Lock() for _ in range(self.NUM_LOAD_LOCKS)]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(1 for key in list(self._names) if self._get(key) is not None)
+
+    def _get(self, key: str) -> Optional[Arrays]:
+        names = self._names.get(key)
+        if names is None:
+            return None
+        arrays: Arrays = {}
+        for name in names:
+            array = self._arrays.get(f"{key}/{name}")
+            if array is None:
+                del self._names[key]
+                return None
+            arrays[name] = array
+        return arrays
+
+    def get(self, key: str) -> Optional[Arrays]:
+        with self._lock:
+            arrays = self._get(key)
+        if arrays is None:
+            return None
+        return {name: _readonly_view(array) for name, array in arrays.items()}
+
+    def get_or_load(self, key: str, load: Callable[[], Arrays]) -> Arrays:
+        # Concurrent requests for the same key wait for a single load.
+        with self._load_locks[hash(key) % len(self._load_locks)]:
+            arrays = self.get(key)
+            if arrays is not None:
+                logger.debug("Dataset registry hit: %s", key)
+                return arrays
+
+            loaded = load()
+            with self._lock:
+                for name, array in loaded.items():
+                    self._arrays[f"{key}/{name}"] = array
+                self._names[key] = list(loaded)
+
+        return {name: _readonly_view(array) for name, array in loaded.items()}
+
+
+_dataset_registry = DatasetRegistry()
+
+
+def get_dataset_registry() -> Optional[DatasetRegistry]:
+    if not is_cache_enabled():
+        return None
+    return _dataset_registry
@@ -0,0 +1,179 @@
+import hashlib
+import pickle
+from typing import AbstractSet, Any, Dict, List, Optional, Sequence
+
+import numpy
+import pandas
+
+from automlcli.exceptions import ConfigurationError
+
+
+def _is_numeric(series: pandas.Series) -> bool:
+    return pandas.api.types.is_numeric_dtype(series.dtype)
+
+
+def _to_codes(values: pandas.Series, categories: pandas.Index) -> numpy.ndarray:
+    # Unknown and missing values get -1. Categorical inputs are recoded
+    # through their categories instead of value by value.
+    return pandas.Categorical(values, categories=categories).codes
+
+
+class ColumnEncoder:
+    """
+    Encodes non-numeric feature columns into numbers. The encoding of each
+    column is given in `columns`, and other non-numeric columns (strings,
+    categories, ...) are encoded with `default` unless it is `None`.
+
+    - `ordinal`: the code of the value among the fitted categories
+    - `hash`: the hash of the value modulo `hash_buckets`, which needs no
+      fitted state, so that columns of any cardinality can be encoded
+    - `frequency`: the relative frequency of the value in the fitted data
+
+    Unknown values are encoded as -1 (ordinal) or 0.0 (frequency). With
+    `max_categories`, only the most frequent categories are kept. The
+    encoder is fitted on the first data converted to arrays, i.e. the
+    training data, and stored with the model.
+    """
+
+    ENCODINGS = ("ordinal", "hash", "frequency")
+
+    def __init__(
+        self,
+        default: Optional[str] = "ordinal",
+        columns: Optional[Dict[str, str]] = None,
+        hash_buckets: int = 2 ** 20,
+        max_categories: Optional[int] = None,
+    ) -> None:
+        columns = columns or {}
+        for encoding in [default, *columns.values()]:
+            if encoding is not None and encoding not in self.ENCODINGS:
+                raise ConfigurationError(
+                    f"encoding must be one of {self.ENCODINGS}, but got {encoding}"
+                )
+        if hash_buckets <= 0:
+            raise ConfigurationError(f"hash_buckets must be positive: {hash_buckets}")
+
+        self._default = default
+        self._columns = columns
+        self._hash_buckets = hash_buckets
+        self._max_categories = max_categories
+
+        self._fitted = False
+        self._encodings: Dict[str, str] = {}
+        self._categories: Dict[str, pandas.Index] = {}
+        self._frequencies: Dict[str, numpy.ndarray] = {}
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "ColumnEncoder":
+        if config is None:
+            return cls()
+        if not isinstance(config, dict):
+            raise ConfigurationError(f"encoding should be a dict: {config}")
+
+        unknown_keys = set(config) - {
+            "default",
+            "columns",
+            "hash_buckets",
+            "max_categories",
+        }
+        if unknown_keys:
+            raise ConfigurationError(f"Unknown encoding keys: {sorted(unknown_keys)}")
+        return cls(**config)
+
+    @property
+    def fitted(self) -> bool:
+        return self._fitted
+
+    @property
+    def categorical_columns(self) -> AbstractSet[str]:
+        """
+        Columns which are known to be encoded, and are read with the pandas
+        category dtype to keep them compact in memory.
+        """
+        return set(self._columns) | set(self._encodings)
+
+    def reset(self) -> None:
+        self._fitted = False
+        self._encodings = {}
+        self._categories = {}
+        self._frequencies = {}
+
+    def fit(self, frames: Sequence[pandas.DataFrame], columns: List[str]) -> None:
+        self.reset()
+        for column in columns:
+            encoding = self._columns.get(column)
+            if encoding is None and not _is_numeric(frames[0][column]):
+                encoding = self._default
+            if encoding is None:
+                continue
+
+            self._encodings[column] = encoding
+            if encoding == "hash":
+                continue
+
+            counts = pandas.concat(
+                [df[column].value_counts(sort=False) for df in frames]
+            )
+            counts = counts.groupby(level=0, observed=True).sum()
+            counts = counts[counts > 0]
+            if self._max_categories is not None:
+                counts = counts.nlargest(self._max_categories, keep="first")
+            try:
+                counts = counts.sort_index()
+            except TypeError:
+                # Values of mixed types keep the order of their appearance.
+                pass
+
+            self._categories[column] = counts.index
+            if encoding == "frequency":
+                total = sum(len(df) for df in frames)
+                self._frequencies[column] = counts.to_numpy() / max(total, 1)
+
+        self._fitted = True
+
+    def transform(self, column: str, values: pandas.Series) -> numpy.ndarray:
+        encoding = self._encodings.get(column)
+        if encoding is None:
+            return values.to_numpy()
+        if encoding == "hash":
+            hashes = pandas.util.hash_pandas_object(values, index=False)
+            return (hashes.to_numpy() % numpy.uint64(self._hash_buckets)).astype(
+                numpy.int64
+            )
+
+        codes = _to_codes(values, self._categories[column])
+        if encoding == "ordinal":
+            return codes
+        # The extra trailing 0.0 is picked by the code -1 of unknown values.
+        return numpy.append(self._frequencies[column], 0.0)[codes]
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {
+            "encodings": self._encodings,
+            "categories": self._categories,
+            "frequencies": self._frequencies,
+        }
+
+    def fingerprint(self) -> str:
+        config = (
+            self._default,
+            self._columns,
+            self._hash_buckets,
+            self._max_categories,
+        )
+        state = self._get_state() if self._fitted else None
+        return hashlib.sha256(pickle.dumps((config, state))).hexdigest()
+
+    def dump_state(self) -> numpy.ndarray:
+        """
+        Return the fitted state as a byte array, so that it is cached and
+        shared together with the arrays it was fitted on.
+        """
+        return numpy.frombuffer(pickle.dumps(self._get_state()), dtype=numpy.uint8)
+
+    def load_state(self, state: numpy.ndarray) -> None:
+        loaded = pickle.loads(numpy.asarray(state).tobytes())
+        self._encodings = loaded["encodings"]
+        self._categories = loaded["categories"]
+        self._frequencies = loaded["frequencies"]
+        self._fitted = True
@@ -0,0 +1,79 @@
+import functools
+from typing import Any, Dict, List, Optional
+
+import numpy
+
+from automlcli.profiling import profile_stage
+
+
+class CachedPredictor:
+    """
+    Estimator wrapper which memoizes the outputs of prediction methods for
+    the last given input, so that multiple scorers evaluated on the same data
+    share a single `predict` / `predict_proba` / `decision_function` call.
+    """
+
+    CACHED_METHODS = (
+        "predict",
+        "predict_proba",
+        "predict_log_proba",
+        "decision_function",
+    )
+
+    def __init__(self, estimator: Any) -> None:
+        self._estimator = estimator
+        self._X: Optional[Any] = None
+        self._outputs: Dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._estimator, name)
+        if name not in self.CACHED_METHODS:
+            return attribute
+
+        @functools.wraps(attribute)
+        def cached_method(X: Any) -> Any:
+            if X is not self._X:
+                self._X = X
+                self._outputs = {}
+            if name not in self._outputs:
+                self._outputs[name] = attribute(X)
+            return self._outputs[name]
+
+        return cached_method
+
+
+def evaluate(
+    estimator: Any,
+    X: numpy.ndarray,
+    y: numpy.ndarray,
+    scoring: List[str],
+) -> Dict[str, float]:
+    from sklearn.metrics import get_scorer
+
+    predictor = CachedPredictor(estimator)
+
+    with profile_stage("score"):
+        return {metric: get_scorer(metric)(predictor, X, y) for metric in scoring}
+
+
+def cross_evaluate(
+    estimator: Any,
+    X: numpy.ndarray,
+    y: numpy.ndarray,
+    scoring: List[str],
+    cv: int,
+    n_jobs: Optional[int] = -1,
+) -> Dict[str, List[float]]:
+    """
+    Cross-validate the estimator. All metrics of a fold are computed from a
+    single prediction. Large X and y are shared with worker processes by the
+    automatic memory mapping of joblib instead of being pickled for each job.
+    """
+    from sklearn.model_selection import cross_validate
+
+    with profile_stage("cross_validate"):
+        results = cross_validate(estimator, X, y, cv=cv, scoring=scoring, n_jobs=n_jobs)
+
+    return {
+        metric: [float(score) for score in scores] for metric, scores in results.items()
+    }
@@ -4,3 +4,7 @@ class AutoMLCLIExeption(Exception):
 
 class ConfigurationError(AutoMLCLIExeption):
     """ConfigurationError"""
+
+
+class ResourceLimitExceeded(AutoMLCLIExeption):
+    """ResourceLimitExceeded"""
@@ -0,0 +1,105 @@
+from pathlib import Path
+from typing import IO, AbstractSet, Any, List, Union
+
+import numpy
+import pandas
+
+from automlcli.util import import_optional_module
+
+
+def _project(columns: List[str], excluded: AbstractSet[str]) -> List[str]:
+    return [column for column in columns if column not in excluded]
+
+
+def read_parquet(
+    file_path: Union[str, Path],
+    excluded: AbstractSet[str] = frozenset(),
+    categories: AbstractSet[str] = frozenset(),
+) -> pandas.DataFrame:
+    parquet = import_optional_module("pyarrow.parquet")
+    parquet_file = parquet.ParquetFile(str(file_path), memory_map=True)
+    columns = _project(parquet_file.schema_arrow.names, excluded)
+    table = parquet_file.read(columns=columns, use_pandas_metadata=True)
+    return table.to_pandas(categories=[c for c in columns if c in categories])
+
+
+def read_feather(
+    file_path: Union[str, Path],
+    excluded: AbstractSet[str] = frozenset(),
+    categories: AbstractSet[str] = frozenset(),
+) -> pandas.DataFrame:
+    pyarrow = import_optional_module("pyarrow")
+    ipc = import_optional_module("pyarrow.ipc")
+    feather = import_optional_module("pyarrow.feather")
+    with pyarrow.memory_map(str(file_path)) as source:
+        schema = ipc.open_file(source).schema
+    columns = _project(schema.names, excluded)
+    table = feather.read_table(str(file_path), columns=columns, memory_map=True)
+    return table.to_pandas(categories=[c for c in columns if c in categories])
+
+
+def read_npy(
+    file_path: Union[str, Path],
+    excluded: AbstractSet[str] = frozenset(),
+) -> pandas.DataFrame:
+    array = numpy.load(file_path, mmap_mode="r")
+    if array.dtype.names is None:
+        raise ValueError(f"npy file must contain a structured array: {file_path}")
+    columns = _project(list(array.dtype.names), excluded)
+    return pandas.DataFrame({column: array[column] for column in columns})
+
+
+def read_npz(
+    file_path: Union[str, Path],
+    excluded: AbstractSet[str] = frozenset(),
+) -> pandas.DataFrame:
+    with numpy.load(file_path) as npz:
+        columns = _project(list(npz.files), excluded)
+        return pandas.DataFrame({column: npz[column] for column in columns})
+
+
+class TableWriter:
+    """
+    Write dataframes into a single Parquet or Arrow IPC (feather) file, one
+    row group / record batch per dataframe, so that chunked predictions are
+    never concatenated in memory. The schema is taken from the first
+    dataframe.
+    """
+
+    FORMATS = ("parquet", "feather")
+
+    def __init__(
+        self,
+        output: IO[bytes],
+        file_format: str,
+        index: bool = False,
+    ) -> None:
+        if file_format not in self.FORMATS:
+            raise ValueError(
+                f"file_format must be one of {self.FORMATS}: {file_format}"
+            )
+        self._output = output
+        self._file_format = file_format
+        self._index = index
+        self._schema: Any = None
+        self._writer: Any = None
+
+    def write(self, df: pandas.DataFrame) -> None:
+        pyarrow = import_optional_module("pyarrow")
+        table = pyarrow.Table.from_pandas(
+            df, schema=self._schema, preserve_index=self._index
+        )
+        if self._writer is None:
+            self._schema = table.schema
+            if self._file_format == "parquet":
+                parquet = import_optional_module("pyarrow.parquet")
+                self._writer = parquet.ParquetWriter(self._output, self._schema)
+            else:
+                ipc = import_optional_module("pyarrow.ipc")
+                self._writer = ipc.new_file(self._output, self._schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
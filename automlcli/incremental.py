@@ -0,0 +1,116 @@
+from typing import Any, Callable, Optional, Tuple
+
+import numpy
+
+Updater = Callable[[numpy.ndarray, numpy.ndarray], None]
+
+
+def _partial_fit_updater(estimator: Any) -> Updater:
+    def update(X: numpy.ndarray, y: numpy.ndarray) -> None:
+        if hasattr(estimator, "classes_"):
+            estimator.partial_fit(X, y, classes=estimator.classes_)
+        else:
+            estimator.partial_fit(X, y)
+
+    return update
+
+
+def _pad_missing_classes(
+    X: numpy.ndarray,
+    y: numpy.ndarray,
+    classes: numpy.ndarray,
+) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """
+    Add a zero-weighted row for each class missing from the chunk, and return
+    the padded chunk with its sample weights. Boosting classifiers encode the
+    labels again on every `fit`, so a chunk lacking a class would otherwise
+    change the class set of the booster.
+    """
+    unseen = numpy.setdiff1d(y, classes)
+    if len(unseen) > 0:
+        raise ValueError(
+            f"Classes not seen in the training data: {unseen.tolist()}, "
+            f"expected: {classes.tolist()}"
+        )
+
+    missing = numpy.setdiff1d(classes, y)
+    weight = numpy.ones(len(y))
+    if len(missing) > 0:
+        X = numpy.concatenate([X, numpy.repeat(X[:1], len(missing), axis=0)])
+        y = numpy.concatenate([y, missing.astype(y.dtype)])
+        weight = numpy.concatenate([weight, numpy.zeros(len(missing))])
+    return X, y, weight
+
+
+def _fit_rounds(
+    estimator: Any,
+    rounds: int,
+    X: numpy.ndarray,
+    y: numpy.ndarray,
+    **fit_params: Any,
+) -> None:
+    # `fit` would add another `n_estimators` rounds to the current booster.
+    n_estimators = estimator.get_params()["n_estimators"]
+    classes = getattr(estimator, "classes_", None)
+    if classes is not None:
+        X, y, fit_params["sample_weight"] = _pad_missing_classes(X, y, classes)
+
+    estimator.set_params(n_estimators=rounds)
+    try:
+        estimator.fit(X, y, **fit_params)
+    finally:
+        estimator.set_params(n_estimators=n_estimators)
+
+
+def get_incremental_updater(
+    estimator: Any,
+    rounds_per_chunk: Optional[int] = None,
+) -> Optional[Updater]:
+    """
+    Return a function which updates the fitted estimator in place with a new
+    chunk of data, or `None` if the estimator cannot be updated incrementally.
+    Supported estimators are the ones with `partial_fit`, pipelines whose
+    final step has `partial_fit`, and boosting models which can continue
+    training from their current booster (LightGBM / XGBoost). Boosting models
+    add `rounds_per_chunk` rounds for each chunk, and are not supported if it
+    is not given. Their classes are pinned to the ones of the first fit, and a
+    chunk with an unseen class raises `ValueError`. Wrappers which expose the underlying estimator as `model`
+    (e.g. FLAML) are unwrapped.
+    """
+    if hasattr(estimator, "partial_fit"):
+        return _partial_fit_updater(estimator)
+
+    steps = getattr(estimator, "steps", None)
+    if steps and hasattr(steps[-1][1], "partial_fit"):
+        transformer = estimator[:-1]
+        final_update = _partial_fit_updater(steps[-1][1])
+
+        def update_pipeline(X: numpy.ndarray, y: numpy.ndarray) -> None:
+            final_update(transformer.transform(X), y)
+
+        return update_pipeline
+
+    if hasattr(estimator, "booster_") or hasattr(estimator, "get_booster"):
+        if rounds_per_chunk is None:
+            return None
+        rounds = rounds_per_chunk
+
+    if hasattr(estimator, "booster_"):
+
+        def update_lightgbm(X: numpy.ndarray, y: numpy.ndarray) -> None:
+            _fit_rounds(estimator, rounds, X, y, init_model=estimator.booster_)
+
+        return update_lightgbm
+
+    if hasattr(estimator, "get_booster"):
+
+        def update_xgboost(X: numpy.ndarray, y: numpy.ndarray) -> None:
+            _fit_rounds(estimator, rounds, X, y, xgb_model=estimator.get_booster())
+
+        return update_xgboost
+
+    inner = getattr(estimator, "model", None)
+    if inner is not None and inner is not estimator:
+        return get_incremental_updater(inner, rounds_per_chunk)
+
+    return None
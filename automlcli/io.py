@@ -1,4 +1,13 @@
-from typing import IO, Any
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import IO, Any, Iterator, Optional, Union
+
+import minato
+import pandas
+
+from automlcli.compression import get_compression, open_compressed
+from automlcli.formats import TableWriter
+from automlcli.util import ext_match
 
 
 class TeeingIO:
@@ -16,3 +25,74 @@ class TeeingIO:
     def flush(self) -> None:
         self._stream.flush()
         self._out.flush()
+
+
+class PredictionWriter:
+    """
+    Write chunks of predictions into a file object as CSV, or as a Parquet /
+    Feather file with `TableWriter`. The CSV header is written only once.
+    """
+
+    FORMATS = ("csv",) + TableWriter.FORMATS
+
+    def __init__(
+        self,
+        output: IO[Any],
+        file_format: str = "csv",
+        index: bool = False,
+    ) -> None:
+        if file_format not in self.FORMATS:
+            raise ValueError(
+                f"file_format must be one of {self.FORMATS}: {file_format}"
+            )
+        self._output = output
+        self._index = index
+        self._header = True
+        self._table_writer: Optional[TableWriter] = None
+        if file_format != "csv":
+            self._table_writer = TableWriter(output, file_format, index)
+
+    def write(self, df: pandas.DataFrame) -> None:
+        if self._table_writer is not None:
+            self._table_writer.write(df)
+        else:
+            df.to_csv(self._output, index=self._index, header=self._header)
+            self._header = False
+
+    def close(self) -> None:
+        if self._table_writer is not None:
+            self._table_writer.close()
+
+
+def get_prediction_format(file_path: Union[str, Path]) -> str:
+    if ext_match(file_path, ["parquet"]):
+        return "parquet"
+    if ext_match(file_path, ["feather", "arrow", "ipc"]):
+        return "feather"
+    return "csv"
+
+
+@contextmanager
+def open_prediction_writer(
+    file_path: Union[str, Path],
+    index: bool = False,
+    compression: Optional[str] = None,
+    compression_level: Optional[int] = None,
+) -> Iterator[PredictionWriter]:
+    """
+    Open a (possibly remote) file to write predictions into. The format and,
+    unless `compression` is given, the compression are inferred from the
+    extension of `file_path`.
+    """
+    compression = compression or get_compression(file_path)
+    with ExitStack() as stack:
+        output = stack.enter_context(minato.open(file_path, "wb"))
+        if compression is not None:
+            output = stack.enter_context(
+                open_compressed(output, compression, compression_level)
+            )
+        writer = PredictionWriter(output, get_prediction_format(file_path), index)
+        try:
+            yield writer
+        finally:
+            writer.close()
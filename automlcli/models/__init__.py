@@ -1,3 +1,4 @@
+from automlcli.models.ensemble import ModelEnsemble  # noqa: F401
 from automlcli.models.flaml import FLAML  # noqa: F401
 from automlcli.models.model import Model  # noqa: F401
 from automlcli.models.tpot import Tpot  # noqa: F401
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, AbstractSet, Any, Dict, List, Optional, Set, Tuple
+
+import numpy
+import pandas
+
+from automlcli.exceptions import ConfigurationError
+from automlcli.models.model import Model
+from automlcli.profiling import profile_stage
+from automlcli.shards import DataPath
+
+if TYPE_CHECKING:
+    from sklearn.base import BaseEstimator
+
+
+def _vote(labels: List[numpy.ndarray]) -> numpy.ndarray:
+    # Majority vote over the label columns. Ties are broken in favour of the
+    # label predicted by the earliest model.
+    codes, uniques = pandas.factorize(numpy.column_stack(labels).ravel())
+    codes = codes.reshape(len(labels[0]), len(labels))
+    num_rows, num_models = codes.shape
+    rows = numpy.arange(num_rows)
+
+    scores = numpy.zeros((num_rows, len(uniques)), dtype=numpy.int64)
+    for j in range(num_models):
+        scores[rows, codes[:, j]] += num_models + 1
+    priority = numpy.zeros_like(scores)
+    for j in reversed(range(num_models)):
+        priority[rows, codes[:, j]] = num_models - j
+
+    return numpy.asarray(uniques)[(scores + priority).argmax(axis=1)]
+
+
+def _mean_proba(
+    probas: List[numpy.ndarray],
+    classes: List[numpy.ndarray],
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    # Average class probabilities over the union of the classes of models.
+    union = functools.reduce(numpy.union1d, classes)
+    total = numpy.zeros((len(probas[0]), len(union)))
+    for proba, model_classes in zip(probas, classes):
+        total[:, numpy.searchsorted(union, model_classes)] += proba
+    return union, total / len(probas)
+
+
+class ModelEnsemble(Model):
+    """
+    Makes predictions with several trained models in a single pass over the
+    data. The data is read and parsed once for all models (with the columns
+    used by any of them), and the estimators run concurrently in a thread
+    pool. Predictions of each model are written side by side as
+    `{column}_{name}` columns, and with `method`, the combined prediction
+    is added as `{column}`:
+
+    - `mean`: the class with the highest averaged probability for
+      classifiers, or the averaged prediction for regressors
+    - `vote`: the majority of the predicted labels
+    """
+
+    METHODS = ("mean", "vote")
+
+    def __init__(
+        self,
+        models: Dict[str, Model],
+        method: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        if not models:
+            raise ConfigurationError("At least one model is required.")
+        if method is not None and method not in self.METHODS:
+            raise ConfigurationError(
+                f"method must be one of {self.METHODS}, but got {method}"
+            )
+
+        first = next(iter(models.values()))
+        index_columns = {model.index_column for model in models.values()}
+        if len(index_columns) > 1:
+            raise ConfigurationError(
+                f"Models have different index columns: {index_columns}"
+            )
+        # A target column of one model would be a feature of another one.
+        target_columns = {model._target_column for model in models.values()}
+        if len(target_columns) > 1:
+            raise ConfigurationError(
+                f"Models have different target columns: {target_columns}"
+            )
+
+        super().__init__(first._target_column, first.index_column)
+        self._encoder = None
+        self._models = models
+        self._method = method
+        self._max_workers = max_workers or len(models)
+
+    @property
+    def models(self) -> Dict[str, Model]:
+        return self._models
+
+    @property
+    def estimator(self) -> BaseEstimator:
+        raise RuntimeError("ModelEnsemble has no single estimator.")
+
+    def _get_excluded_columns(self, with_target: bool = True) -> Set[str]:
+        # Only columns excluded by every model are skipped while reading.
+        excluded = [
+            model._get_excluded_columns(with_target) for model in self._models.values()
+        ]
+        return set.intersection(*excluded)
+
+    def _get_categorical_columns(self) -> AbstractSet[str]:
+        categories = [
+            set(model._get_categorical_columns()) for model in self._models.values()
+        ]
+        return set.intersection(*categories)
+
+    def predict(
+        self,
+        file_path: DataPath,
+        prediction_column: Optional[str] = None,
+        proba: bool = False,
+        top_k: Optional[int] = None,
+        decision: bool = False,
+    ) -> pandas.DataFrame:
+        df = self.load_dataframe(file_path, with_target=False)
+        return self.predict_dataframe(df, prediction_column, proba, top_k, decision)
+
+    def predict_dataframe(
+        self,
+        df: pandas.DataFrame,
+        prediction_column: Optional[str] = None,
+        proba: bool = False,
+        top_k: Optional[int] = None,
+        decision: bool = False,
+    ) -> pandas.DataFrame:
+        column = prediction_column or self._target_column
+        if self._index_column is not None:
+            index = pandas.Index(df[self._index_column])
+        else:
+            index = df.index
+
+        # Probabilities are needed for averaging if all models are classifiers.
+        soft = self._method == "mean" and all(
+            hasattr(model.estimator, "classes_") for model in self._models.values()
+        )
+
+        def predict_model(name: str) -> pandas.DataFrame:
+            model = self._models[name]
+            X, _ = model._dataframe_to_array(df)
+            return model._predict_array(
+                X, index, f"{column}_{name}", proba or soft, top_k, decision
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(self._models)),
+            thread_name_prefix="model",
+        ) as executor:
+            results = dict(zip(self._models, executor.map(predict_model, self._models)))
+
+        columns: Dict[str, Any] = {}
+        probas: List[numpy.ndarray] = []
+        classes: List[numpy.ndarray] = []
+        for name, predictions in results.items():
+            if soft:
+                model_classes = numpy.asarray(self._models[name].estimator.classes_)
+                proba_columns = [
+                    f"{column}_{name}_proba_{label}" for label in model_classes
+                ]
+                probas.append(predictions[proba_columns].to_numpy())
+                classes.append(model_classes)
+                if not proba:
+                    predictions = predictions.drop(columns=proba_columns)
+            for key, values in predictions.items():
+                columns[key] = values.to_numpy()
+
+        labels = [results[name][f"{column}_{name}"].to_numpy() for name in results]
+        with profile_stage("ensemble"):
+            if self._method == "vote":
+                columns[column] = _vote(labels)
+            elif soft:
+                union, mean_proba = _mean_proba(probas, classes)
+                columns[column] = union[mean_proba.argmax(axis=1)]
+                if proba:
+                    for i, label in enumerate(union):
+                        columns[f"{column}_proba_{label}"] = mean_proba[:, i]
+            elif self._method == "mean":
+                columns[column] = numpy.mean(
+                    [values.astype(float) for values in labels], axis=0
+                )
+
+        return pandas.DataFrame(columns, index=index)
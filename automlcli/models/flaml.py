@@ -1,29 +1,65 @@
 from __future__ import annotations
 
+import inspect
 import json
+import logging
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union
 
 import numpy
-from sklearn.base import BaseEstimator
-
-try:
-    import flaml
-except ImportError:
-    flaml = None
 
+from automlcli.checkpoint import SearchState, remaining_budget
 from automlcli.models.model import Model
+from automlcli.profiling import profile_stage
+from automlcli.resources import ResourceLimits
+from automlcli.shards import DataPath
+from automlcli.util import import_optional_module, is_module_available
+
+if TYPE_CHECKING:
+    from sklearn.base import BaseEstimator
+
+logger = logging.getLogger(__name__)
+
+
+def _get_fit_parameters() -> Set[str]:
+    # Arguments for resuming a search depend on the installed FLAML version:
+    # `starting_points` exists since 0.6.0 and `append_log` since 0.9.0.
+    flaml = import_optional_module("flaml")
+    return set(inspect.signature(flaml.AutoML.fit).parameters)
 
 
 @Model.register("flaml")
 class FLAML(Model):
-    def __init__(self, target_column: str, **kwargs: Any) -> None:
-        if flaml is None:
+    ESTIMATOR_ATTRIBUTE = "_flaml_best_model"
+    ARTIFACT_EXCLUDED_ATTRIBUTES = ("_flaml_log",)
+    CLASSIFICATION_TASKS = ("classification", "binary", "multiclass")
+
+    def __init__(
+        self,
+        target_column: str,
+        index_column: Optional[str] = None,
+        ignored_columns: Optional[List[str]] = None,
+        feature_dtype: str = "float64",
+        sampling: Optional[Dict[str, Any]] = None,
+        encoding: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        if not is_module_available("flaml"):
             raise ImportError(
                 "Failed to import flaml. Make sure " "flaml is successfully installed"
             )
-        super().__init__(target_column)
+        super().__init__(
+            target_column,
+            index_column,
+            ignored_columns,
+            feature_dtype,
+            sampling,
+            encoding,
+        )
+        self._check_sampling(
+            kwargs.get("task", "classification") in self.CLASSIFICATION_TASKS
+        )
         self._target_column = target_column
         self._kwargs = kwargs
         self._flaml_log: Optional[str] = None
@@ -38,11 +74,45 @@ class FLAML(Model):
             raise RuntimeError("FLAML model is not trained.")
         return self._flaml_best_model
 
-    def train(
+    def search(
+        self,
+        train_file: DataPath,
+        validation_file: Optional[DataPath] = None,
+        workdir: Optional[Union[str, Path]] = None,
+        resume: bool = False,
+    ) -> Dict[str, float]:
+        return self._search(train_file, validation_file, workdir, resume)
+
+    def recover(
+        self,
+        train_file: DataPath,
+        validation_file: Optional[DataPath] = None,
+        workdir: Optional[Union[str, Path]] = None,
+    ) -> Dict[str, float]:
+        if workdir is None or not (Path(workdir) / "flaml.log").is_file():
+            raise RuntimeError("No FLAML search log found to recover from.")
+        return self._search(
+            train_file, validation_file, workdir, resume=True, refit_only=True
+        )
+
+    def apply_resource_limits(self, limits: ResourceLimits) -> None:
+        search_time = limits.search_time()
+        if search_time is not None:
+            time_budget = self._kwargs.get("time_budget")
+            if time_budget is None or time_budget < 0:
+                self._kwargs["time_budget"] = search_time
+            else:
+                self._kwargs["time_budget"] = min(time_budget, search_time)
+        if limits.cpus is not None:
+            self._kwargs["n_jobs"] = limits.cpus
+
+    def _search(
         self,
-        train_file: Union[str, Path],
-        validation_file: Optional[Union[str, Path]] = None,
+        train_file: DataPath,
+        validation_file: Optional[DataPath] = None,
         workdir: Optional[Union[str, Path]] = None,
+        resume: bool = False,
+        refit_only: bool = False,
     ) -> Dict[str, float]:
         X_train, y_train = self.load_data(train_file)
         assert y_train is not None
@@ -53,20 +123,33 @@ class FLAML(Model):
             X_val, y_val = self.load_data(validation_file)
             assert y_val is not None
 
+        flaml = import_optional_module("flaml")
         automl = flaml.AutoML()
 
-        with tempfile.NamedTemporaryFile() as temp_file:
-            automl.fit(
-                X_train=X_train,
-                y_train=y_train,
-                X_val=X_val,
-                y_val=y_val,
-                log_file_name=temp_file.name,
-                **self._kwargs,
-            )
+        with tempfile.TemporaryDirectory() as tempdir:
+            # The search log is written into the workdir as trials finish,
+            # so that an interrupted search can be resumed from it.
+            log_file = Path(workdir or tempdir) / "flaml.log"
+            state = SearchState(log_file.parent, [log_file])
+
+            kwargs = dict(self._kwargs)
+            resume = resume and log_file.is_file()
+            elapsed = state.start(resume)
+            if resume:
+                kwargs.update(self._get_resume_kwargs(log_file, elapsed, refit_only))
+
+            with profile_stage("fit"):
+                automl.fit(
+                    X_train=X_train,
+                    y_train=y_train,
+                    X_val=X_val,
+                    y_val=y_val,
+                    log_file_name=str(log_file),
+                    **kwargs,
+                )
 
-            temp_file.seek(0)
-            self._flaml_log = temp_file.read().decode()
+            with open(log_file) as fp:
+                self._flaml_log = fp.read()
             self._flaml_best_model = automl.model
             self._flaml_best_estimator = automl.best_estimator
             self._flaml_best_config = automl.best_config
@@ -77,13 +160,7 @@ class FLAML(Model):
         }
 
         if workdir is not None:
-            workdir = Path(workdir)
-            log_file = workdir / "flaml.log"
-            best_file = workdir / "best.json"
-
-            with open(log_file, "w") as fp:
-                fp.write(self._flaml_log)
-
+            best_file = Path(workdir) / "best.json"
             best = {
                 "best_estimator": self._flaml_best_estimator,
                 "best_config": self._flaml_best_config,
@@ -94,11 +171,96 @@ class FLAML(Model):
 
         return metrics
 
-    def retrain(self, train_file: Union[str, Path]) -> None:
+    def _get_resume_kwargs(
+        self,
+        log_file: Path,
+        elapsed: float,
+        refit_only: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Build `AutoML.fit` arguments which continue the search recorded in
+        `log_file`: the best config found so far for each learner is used as
+        a starting point, and only the remaining time budget is spent. When
+        the budget is exhausted or `refit_only` is given, only the best config
+        is refitted. Older FLAML versions without `starting_points` restart
+        the search with the remaining budget instead.
+        """
+        fit_parameters = _get_fit_parameters()
+        records = self._read_log_records(log_file)
+        kwargs: Dict[str, Any] = {}
+        if "append_log" in fit_parameters:
+            kwargs["append_log"] = True
+        best_records: Dict[str, Dict[str, Any]] = {}
+        for record in records:
+            learner = record["learner"]
+            best = best_records.get(learner)
+            if best is None or record["validation_loss"] < best["validation_loss"]:
+                best_records[learner] = record
+
+        if not best_records and refit_only:
+            raise RuntimeError(f"No trials found in {log_file}")
+        if "starting_points" not in fit_parameters:
+            if refit_only:
+                raise RuntimeError(
+                    "Refitting the best config needs starting_points of "
+                    "AutoML.fit, which requires flaml>=0.6.0"
+                )
+            logger.warning(
+                "Installed FLAML does not support starting_points, "
+                "so the search is restarted with the remaining budget"
+            )
+            best_records = {}
+
+        time_budget = self._kwargs.get("time_budget", -1)
+        if not refit_only and (time_budget is None or time_budget < 0):
+            remaining: Optional[float] = None
+        elif not refit_only:
+            remaining = remaining_budget(time_budget, elapsed)
+            logger.info("Resume FLAML search with %.1f seconds left", remaining)
+        else:
+            remaining = 0.0
+
+        if not best_records:
+            logger.info("No trials found in %s, restart the search", log_file)
+            if remaining is not None:
+                kwargs["time_budget"] = max(remaining, 1.0)
+        elif remaining is None or remaining > 0:
+            kwargs["starting_points"] = {
+                learner: record["config"] for learner, record in best_records.items()
+            }
+            if remaining is not None:
+                kwargs["time_budget"] = max(remaining, 1.0)
+        else:
+            best_record = min(
+                best_records.values(), key=lambda record: record["validation_loss"]
+            )
+            logger.info("Refit the best %s config", best_record["learner"])
+            kwargs["estimator_list"] = [best_record["learner"]]
+            kwargs["starting_points"] = {best_record["learner"]: best_record["config"]}
+            kwargs["time_budget"] = -1
+            kwargs["max_iter"] = 1
+        return kwargs
+
+    @staticmethod
+    def _read_log_records(log_file: Path) -> List[Dict[str, Any]]:
+        records = []
+        with open(log_file) as fp:
+            for line in fp:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # The last line may be truncated if the run was killed.
+                    continue
+                if "validation_loss" in record:
+                    records.append(record)
+        return records
+
+    def retrain(self, train_file: DataPath) -> None:
         X_train, y_train = self.load_data(train_file)
         if y_train is None:
             raise ValueError(
                 f"Target column ({self._target_column}) does "
                 f"not exists in {train_file}"
             )
-        self._flaml_best_model = self.estimator.fit(X_train, y_train)
+        with profile_stage("fit"):
+            self.estimator.fit(X_train, y_train)
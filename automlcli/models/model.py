@@ -1,27 +1,104 @@
 from __future__ import annotations
 
+import logging
+import tempfile
+import time
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import colt
-import minato
 import numpy
 import pandas
-from sklearn.base import BaseEstimator
 
+from automlcli import formats
+from automlcli.cache import ArrayCache, get_array_cache
+from automlcli.compression import (
+    decompress_to_temporary_file,
+    get_compression,
+    open_decompressed,
+)
+from automlcli.datasets import get_dataset_registry
+from automlcli.encoding import ColumnEncoder
+from automlcli.exceptions import ConfigurationError
+from automlcli.incremental import get_incremental_updater
+from automlcli.prefetch import cached_path, prefetch
+from automlcli.profiling import profile_stage
+from automlcli.sampling import Sampler
+from automlcli.shards import DataPath, expand_data_path, map_shards
 from automlcli.util import ext_match
 
+if TYPE_CHECKING:
+    from sklearn.base import BaseEstimator
+
+    from automlcli.resources import ResourceLimits
+
+
+logger = logging.getLogger(__name__)
+
+# Formats which cannot be read from a stream of decompressed bytes.
+RANDOM_ACCESS_FORMATS = ("parquet", "feather", "arrow", "ipc", "npy", "npz")
+
 
 class Model(colt.Registrable):  # type: ignore
+    FEATURE_DTYPES = ("float32", "float64", "auto")
+
+    # Attribute holding the fitted estimator, which is stored separately in
+    # model artifacts, and attributes which are not needed after training.
+    ESTIMATOR_ATTRIBUTE = "_estimator"
+    ARTIFACT_EXCLUDED_ATTRIBUTES: Tuple[str, ...] = ()
+
+    # Key of the encoder state which is cached with the arrays it was fitted on.
+    ENCODER_STATE_KEY = "encoder_state"
+
+    # Key of the feature columns which are cached with the arrays of training
+    # data they were recorded from.
+    FEATURE_COLUMNS_KEY = "feature_columns"
+
+    # Training sample written into the workdir when sampling is configured.
+    SAMPLE_FILENAME = "sample.pkl"
+
     def __init__(
         self,
         target_column: str,
         index_column: Optional[str] = None,
         ignored_columns: Optional[List[str]] = None,
+        feature_dtype: str = "float64",
+        sampling: Optional[Dict[str, Any]] = None,
+        encoding: Optional[Dict[str, Any]] = None,
     ) -> None:
+        if feature_dtype not in self.FEATURE_DTYPES:
+            raise ConfigurationError(
+                f"feature_dtype must be one of {self.FEATURE_DTYPES}, "
+                f"but got {feature_dtype}"
+            )
+
         self._target_column = target_column
         self._index_column = index_column
         self._ignored_columns = ignored_columns or []
+        self._feature_dtype = feature_dtype
+        self._sampler = Sampler.from_config(sampling)
+        self._encoder: Optional[ColumnEncoder] = ColumnEncoder.from_config(encoding)
+        self._feature_columns: Optional[List[str]] = None
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # Fill attributes which did not exist when the model was pickled.
+        state.setdefault("_feature_dtype", "float64")
+        state.setdefault("_sampler", None)
+        state.setdefault("_encoder", None)
+        state.setdefault("_feature_columns", None)
+        self.__dict__.update(state)
 
     @property
     def index_column(self) -> Optional[str]:
@@ -31,73 +108,568 @@ class Model(colt.Registrable):  # type: ignore
     def estimator(self) -> BaseEstimator:
         raise NotImplementedError
 
+    def _check_sampling(self, classification: bool) -> None:
+        if self._sampler is not None and self._sampler.stratify and not classification:
+            raise ConfigurationError(
+                "Stratified sampling is only supported for classification tasks."
+            )
+
+    def _get_categorical_columns(self) -> AbstractSet[str]:
+        if self._encoder is None:
+            return frozenset()
+        return self._encoder.categorical_columns
+
+    def _get_excluded_columns(self, with_target: bool = True) -> Set[str]:
+        excluded = set(self._ignored_columns)
+        if not with_target:
+            excluded.add(self._target_column)
+        return excluded
+
+    def _find_column_mismatch(
+        self, df: pandas.DataFrame
+    ) -> Tuple[List[str], List[str]]:
+        # Return the feature columns missing in `df` and its unexpected columns.
+        if self._feature_columns is None:
+            return [], []
+        known = set(self._feature_columns)
+        known.update(self._get_excluded_columns(with_target=False))
+        if self._index_column is not None:
+            known.add(self._index_column)
+        missing = [column for column in self._feature_columns if column not in df]
+        unexpected = [column for column in df.columns if column not in known]
+        return missing, unexpected
+
+    def check_columns(self, df: pandas.DataFrame) -> None:
+        """
+        Raise `ValueError` if `df` lacks some of the feature columns the model
+        was trained on, or has columns which the model does not know.
+        """
+        missing, unexpected = self._find_column_mismatch(df)
+        if missing or unexpected:
+            raise ValueError(
+                f"Columns do not match the training data: missing {missing}, "
+                f"unexpected {unexpected}"
+            )
+
     def load_dataframe(
+        self,
+        file_path: DataPath,
+        with_target: bool = True,
+    ) -> pandas.DataFrame:
+        """
+        Load a file, or the shards matched by a glob, a directory or a list
+        of files. Shards are read concurrently and concatenated at once.
+        """
+        files = expand_data_path(file_path)
+        frames = self._load_shards(files, with_target)
+        if len(frames) == 1:
+            return frames[0]
+        return pandas.concat(frames, ignore_index=True, copy=False)
+
+    def _load_shards(
+        self,
+        files: List[str],
+        with_target: bool = True,
+    ) -> List[pandas.DataFrame]:
+        if len(files) > 1:
+            logger.info("Load %d shards", len(files))
+            prefetch(*files)
+        return map_shards(lambda file: self._load_file(file, with_target), files)
+
+    def _load_file(
         self,
         file_path: Union[str, Path],
+        with_target: bool = True,
     ) -> pandas.DataFrame:
-        file_cache_path = minato.cached_path(file_path)
-        if ext_match(file_path, ["pkl", "pickle"]):
-            df = pandas.read_pickle(file_cache_path)
-        elif ext_match(file_path, ["csv"]):
-            df = pandas.read_csv(file_cache_path)
-        elif ext_match(file_path, ["tsv"]):
-            df = pandas.read_csv(file_cache_path, sep="\t")
-        elif ext_match(file_path, ["jsonl"]):
-            df = pandas.read_json(file_cache_path, orient="records", lines=True)
-        else:
-            raise ValueError(f"Not supported file format: {file_path}")
+        excluded = self._get_excluded_columns(with_target)
+        usecols = (lambda column: column not in excluded) if excluded else None
+        categories = self._get_categorical_columns()
+        dtype = {column: "category" for column in categories} or None
+
+        with profile_stage("fetch"):
+            file_cache_path = cached_path(file_path)
+
+        compression = get_compression(file_path)
+        with profile_stage("parse"), ExitStack() as stack:
+            source: Any = file_cache_path
+            if compression is not None and ext_match(file_path, RANDOM_ACCESS_FORMATS):
+                source = stack.enter_context(
+                    decompress_to_temporary_file(file_cache_path, compression)
+                )
+            elif compression is not None:
+                source = stack.enter_context(
+                    open_decompressed(file_cache_path, compression)
+                )
+
+            if ext_match(file_path, ["pkl", "pickle"]):
+                df = pandas.read_pickle(source)
+            elif ext_match(file_path, ["csv"]):
+                df = pandas.read_csv(source, usecols=usecols, dtype=dtype)
+            elif ext_match(file_path, ["tsv"]):
+                df = pandas.read_csv(source, sep="\t", usecols=usecols, dtype=dtype)
+            elif ext_match(file_path, ["jsonl"]):
+                df = pandas.read_json(source, orient="records", lines=True)
+            elif ext_match(file_path, ["parquet"]):
+                df = formats.read_parquet(source, excluded, categories)
+            elif ext_match(file_path, ["feather", "arrow", "ipc"]):
+                df = formats.read_feather(source, excluded, categories)
+            elif ext_match(file_path, ["npy"]):
+                df = formats.read_npy(source, excluded)
+            elif ext_match(file_path, ["npz"]):
+                df = formats.read_npz(source, excluded)
+            else:
+                raise ValueError(f"Not supported file format: {file_path}")
         return df
 
+    def iter_dataframes(
+        self,
+        file_path: DataPath,
+        chunk_size: int,
+        with_target: bool = True,
+    ) -> Iterator[pandas.DataFrame]:
+        """
+        Read chunks of at most `chunk_size` rows. Shards are read one after
+        another, and chunks do not span shards.
+        """
+        files = expand_data_path(file_path)
+        prefetch(*files)
+        for file in files:
+            yield from self._iter_file_dataframes(file, chunk_size, with_target)
+
+    def _iter_file_dataframes(
+        self,
+        file_path: Union[str, Path],
+        chunk_size: int,
+        with_target: bool = True,
+    ) -> Iterator[pandas.DataFrame]:
+        excluded = self._get_excluded_columns(with_target)
+        usecols = (lambda column: column not in excluded) if excluded else None
+        dtype = {column: "category" for column in self._get_categorical_columns()}
+
+        if not ext_match(file_path, ["csv", "tsv", "jsonl"]):
+            # Formats without a chunked reader are loaded at once and sliced.
+            df = self._load_file(file_path, with_target)
+            for start in range(0, len(df), chunk_size):
+                yield df.iloc[start : start + chunk_size]
+            return
+
+        with profile_stage("fetch"):
+            file_cache_path = cached_path(file_path)
+
+        compression = get_compression(file_path)
+        with ExitStack() as stack:
+            source: Any = file_cache_path
+            if compression is not None:
+                # Decompressed while being read, so the whole file is never
+                # held in memory.
+                source = stack.enter_context(
+                    open_decompressed(file_cache_path, compression)
+                )
+
+            if ext_match(file_path, ["csv"]):
+                reader = pandas.read_csv(
+                    source, usecols=usecols, dtype=dtype or None, chunksize=chunk_size
+                )
+            elif ext_match(file_path, ["tsv"]):
+                reader = pandas.read_csv(
+                    source,
+                    sep="\t",
+                    usecols=usecols,
+                    dtype=dtype or None,
+                    chunksize=chunk_size,
+                )
+            else:
+                reader = pandas.read_json(
+                    source, orient="records", lines=True, chunksize=chunk_size
+                )
+
+            with reader:
+                yield from reader
+
     def _dataframe_to_array(
         self, df: pandas.DataFrame
+    ) -> Tuple[numpy.ndarray, Optional[numpy.ndarray]]:
+        return self._dataframes_to_array([df])
+
+    @profile_stage("convert")
+    def _dataframes_to_array(
+        self, frames: List[pandas.DataFrame]
     ) -> Tuple[numpy.ndarray, Optional[numpy.ndarray]]:
         y: Optional[numpy.ndarray] = None
+        if all(self._target_column in df.columns for df in frames):
+            targets = [df[self._target_column].to_numpy() for df in frames]
+            y = targets[0] if len(targets) == 1 else numpy.concatenate(targets)
 
+        excluded = self._get_excluded_columns(with_target=False)
         if self._index_column is not None:
-            df = df.set_index(self._index_column)
+            excluded.add(self._index_column)
+
+        if self._feature_columns is None:
+            # Recorded from the training data, so that other inputs are
+            # converted in the same column order whatever order they have.
+            self._feature_columns = [
+                column for column in frames[0].columns if column not in excluded
+            ]
+        feature_columns = self._feature_columns
+        for df in frames:
+            missing, _ = self._find_column_mismatch(df)
+            if missing:
+                raise ValueError(f"Feature columns not found: {missing}")
 
-        if self._target_column in df.columns:
-            y = df.pop(self._target_column).to_numpy()
+        # Convert column by column (and shard by shard) into a single
+        # preallocated array instead of building an intermediate frame of the
+        # feature columns.
+        if self._encoder is None:
+            columns = [
+                [df[column].to_numpy() for column in feature_columns] for df in frames
+            ]
+        else:
+            if not self._encoder.fitted:
+                self._encoder.fit(frames, feature_columns)
+            columns = [
+                [
+                    self._encoder.transform(column, df[column])
+                    for column in feature_columns
+                ]
+                for df in frames
+            ]
+        if self._feature_dtype == "auto":
+            dtypes = [values.dtype for shard in columns for values in shard]
+            dtype = numpy.result_type(*dtypes) if dtypes else numpy.dtype(float)
+        else:
+            dtype = numpy.dtype(self._feature_dtype)
 
-        for column in self._ignored_columns:
-            df.pop(column)
+        X = numpy.empty((sum(len(df) for df in frames), len(feature_columns)), dtype)
+        start = 0
+        for df, shard in zip(frames, columns):
+            for i, values in enumerate(shard):
+                X[start : start + len(df), i] = values
+            start += len(df)
 
-        X = df.to_numpy(dtype=float)
         return X, y
 
+    def _get_array_cache_params(self) -> Dict[str, Any]:
+        model_class = type(self)
+        return {
+            "model": f"{model_class.__module__}.{model_class.__qualname__}",
+            "target_column": self._target_column,
+            "index_column": self._index_column,
+            "ignored_columns": self._ignored_columns,
+            "feature_dtype": self._feature_dtype,
+            "encoder": self._encoder.fingerprint() if self._encoder else None,
+            "feature_columns": self._feature_columns,
+        }
+
+    @profile_stage("load_data")
+    def _load_arrays(
+        self,
+        file_path: DataPath,
+        with_target: bool = True,
+    ) -> Dict[str, numpy.ndarray]:
+        """
+        Load feature / target / index arrays of `file_path`. Arrays are shared
+        between models in the same process through the dataset registry and
+        persisted in the on-disk array cache, so each file is parsed only once.
+        """
+        files = expand_data_path(file_path)
+        registry = get_dataset_registry()
+        if registry is None:
+            return self._read_arrays(files, with_target)
+
+        prefetch(*files)
+        params = self._get_array_cache_params()
+        params["with_target"] = with_target
+        key = ArrayCache.make_key(files, params)
+
+        def load() -> Dict[str, numpy.ndarray]:
+            cache = get_array_cache()
+            if cache is not None:
+                cached_arrays = cache.get(key)
+                if cached_arrays is not None:
+                    return cached_arrays
+
+            arrays = self._read_arrays(files, with_target)
+            if cache is not None:
+                cache.put(key, arrays)
+            return arrays
+
+        arrays = registry.get_or_load(key, load)
+        if self._encoder is not None and not self._encoder.fitted:
+            # The arrays came from the cache, so restore the encoder state
+            # fitted together with them.
+            self._encoder.load_state(arrays[self.ENCODER_STATE_KEY])
+        if self._feature_columns is None:
+            self._feature_columns = list(arrays[self.FEATURE_COLUMNS_KEY])
+        return arrays
+
+    def _read_arrays(
+        self,
+        files: List[str],
+        with_target: bool = True,
+    ) -> Dict[str, numpy.ndarray]:
+        # Shards are converted straight into the final arrays, without
+        # concatenating them into a single dataframe first.
+        frames = self._load_shards(files, with_target)
+        fitting_encoder = self._encoder is not None and not self._encoder.fitted
+        recording_columns = self._feature_columns is None
+
+        arrays: Dict[str, numpy.ndarray] = {}
+        if self._index_column is not None:
+            arrays["index"] = numpy.concatenate(
+                [df[self._index_column].to_numpy() for df in frames]
+            )
+
+        X, y = self._dataframes_to_array(frames)
+        arrays["X"] = X
+        if y is not None:
+            arrays["y"] = y
+        if fitting_encoder:
+            assert self._encoder is not None
+            arrays[self.ENCODER_STATE_KEY] = self._encoder.dump_state()
+        if recording_columns:
+            assert self._feature_columns is not None
+            arrays[self.FEATURE_COLUMNS_KEY] = numpy.array(
+                self._feature_columns, dtype=object
+            )
+
+        return arrays
+
     def load_data(
-        self, file_path: Union[str, Path]
+        self, file_path: DataPath
     ) -> Tuple[numpy.ndarray, Optional[numpy.ndarray]]:
-        df = self.load_dataframe(file_path)
-        X, y = self._dataframe_to_array(df)
-        return X, y
+        arrays = self._load_arrays(file_path)
+        return arrays["X"], arrays.get("y")
 
     def train(
         self,
-        train_file: Union[str, Path],
-        validation_file: Optional[Union[str, Path]] = None,
+        train_file: DataPath,
+        validation_file: Optional[DataPath] = None,
+        workdir: Optional[Union[str, Path]] = None,
+        resume: bool = False,
+    ) -> Dict[str, float]:
+        """
+        Run the search and fit the best model. If sampling is configured, the
+        search runs on a sample of `train_file`, which is kept in `workdir`
+        for resuming, and the best model is then refitted on the full data
+        with `retrain`.
+        """
+        # Refitted on the training data when it is converted to arrays.
+        self._feature_columns = None
+        if self._encoder is not None:
+            self._encoder.reset()
+
+        if self._sampler is None:
+            return self.search(train_file, validation_file, workdir, resume)
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            sample_file = Path(workdir or tempdir) / self.SAMPLE_FILENAME
+
+            start = time.perf_counter()
+            if resume and sample_file.is_file():
+                logger.info("Reuse the training sample in %s", sample_file)
+            else:
+                with profile_stage("sample"):
+                    frames = self.iter_dataframes(train_file, self._sampler.chunk_size)
+                    sample = self._sampler.sample(frames, self._target_column)
+                    sample.to_pickle(sample_file)
+            sample_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            metrics = self.search(sample_file, validation_file, workdir, resume)
+            search_time = time.perf_counter() - start
+
+        logger.info("Refit the best model on the full training data")
+        # The encoder was fitted on the sample, so it is fitted again on the
+        # full data, which may contain categories missing from the sample.
+        if self._encoder is not None:
+            self._encoder.reset()
+        start = time.perf_counter()
+        self.retrain(train_file)
+        refit_time = time.perf_counter() - start
+
+        metrics.update(
+            {
+                "sample_time": sample_time,
+                "search_time": search_time,
+                "refit_time": refit_time,
+            }
+        )
+        return metrics
+
+    def search(
+        self,
+        train_file: DataPath,
+        validation_file: Optional[DataPath] = None,
         workdir: Optional[Union[str, Path]] = None,
+        resume: bool = False,
     ) -> Dict[str, float]:
+        """
+        Search for the best model on `train_file` and fit it. Search state is
+        checkpointed into `workdir`, and with `resume` an interrupted search
+        found there is continued with the remaining budget.
+        """
         raise NotImplementedError
 
-    def retrain(self, train_file: Union[str, Path]) -> None:
+    def recover(
+        self,
+        train_file: DataPath,
+        validation_file: Optional[DataPath] = None,
+        workdir: Optional[Union[str, Path]] = None,
+    ) -> Dict[str, float]:
+        """
+        Fit the best model found by a search which was interrupted, e.g. by
+        a resource limit, from the checkpoints in `workdir`.
+        """
         raise NotImplementedError
 
+    def apply_resource_limits(self, limits: ResourceLimits) -> None:
+        """
+        Map resource limits onto the native options of the backend.
+        """
+
+    def retrain(self, train_file: DataPath) -> None:
+        raise NotImplementedError
+
+    def retrain_incrementally(
+        self,
+        train_file: DataPath,
+        chunk_size: int,
+        rounds_per_chunk: Optional[int] = None,
+    ) -> bool:
+        """
+        Update the fitted estimator in place by streaming `train_file` in
+        chunks. Return `False` without touching the estimator if it supports
+        neither `partial_fit` nor warm starting. Boosting models are warm
+        started only with `rounds_per_chunk`, the number of boosting rounds
+        added for each chunk.
+        """
+        update = get_incremental_updater(self.estimator, rounds_per_chunk)
+        if update is None:
+            return False
+
+        for df in self.iter_dataframes(train_file, chunk_size):
+            X, y = self._dataframe_to_array(df)
+            if y is None:
+                raise ValueError(
+                    f"Target column ({self._target_column}) does "
+                    f"not exists in {train_file}"
+                )
+            with profile_stage("fit"):
+                update(X, y)
+
+        return True
+
     def predict(
         self,
-        file_path: Union[str, Path],
+        file_path: DataPath,
         prediction_column: Optional[str] = None,
+        proba: bool = False,
+        top_k: Optional[int] = None,
+        decision: bool = False,
     ) -> pandas.DataFrame:
-        df = self.load_dataframe(file_path)
+        arrays = self._load_arrays(file_path, with_target=False)
+        index: Optional[pandas.Index] = None
+        if "index" in arrays:
+            index = pandas.Index(arrays["index"], name=self._index_column)
+        return self._predict_array(
+            arrays["X"], index, prediction_column, proba, top_k, decision
+        )
+
+    def predict_iter(
+        self,
+        file_path: DataPath,
+        chunk_size: int,
+        prediction_column: Optional[str] = None,
+        proba: bool = False,
+        top_k: Optional[int] = None,
+        decision: bool = False,
+    ) -> Iterator[pandas.DataFrame]:
+        for df in self.iter_dataframes(file_path, chunk_size, with_target=False):
+            yield self.predict_dataframe(df, prediction_column, proba, top_k, decision)
+
+    def predict_dataframe(
+        self,
+        df: pandas.DataFrame,
+        prediction_column: Optional[str] = None,
+        proba: bool = False,
+        top_k: Optional[int] = None,
+        decision: bool = False,
+    ) -> pandas.DataFrame:
+        if self._index_column is not None:
+            index = pandas.Index(df[self._index_column])
+        else:
+            index = df.index
         X, _ = self._dataframe_to_array(df)
+        return self._predict_array(X, index, prediction_column, proba, top_k, decision)
 
-        y_pred = cast(numpy.ndarray, self.estimator.predict(X))
+    def _get_estimator_method(self, name: str) -> Any:
+        method = getattr(self.estimator, name, None)
+        if method is None:
+            raise ConfigurationError(
+                f"{type(self.estimator).__name__} does not support {name}"
+            )
+        return method
 
+    def _get_classes(self) -> numpy.ndarray:
+        classes = getattr(self.estimator, "classes_", None)
+        if classes is None:
+            raise ConfigurationError(
+                f"{type(self.estimator).__name__} does not have classes_"
+            )
+        return numpy.asarray(classes)
+
+    def _predict_array(
+        self,
+        X: numpy.ndarray,
+        index: Optional[pandas.Index] = None,
+        prediction_column: Optional[str] = None,
+        proba: bool = False,
+        top_k: Optional[int] = None,
+        decision: bool = False,
+    ) -> pandas.DataFrame:
+        """
+        Make predictions for a batch. The label column always comes from
+        `predict`, and with `proba` / `top_k` / `decision`, class
+        probabilities, the k most probable labels and decision scores are
+        added as extra columns, all computed with array operations over the
+        whole batch.
+        """
         if prediction_column is not None:
             column = prediction_column
         else:
             column = self._target_column
 
-        df[column] = y_pred
+        columns: Dict[str, numpy.ndarray] = {}
+        with profile_stage("predict"):
+            # The label may differ from the most probable class, e.g. with
+            # a decision threshold, so it is not taken from the probabilities.
+            columns[column] = numpy.asarray(self.estimator.predict(X))
+
+            if proba or top_k is not None:
+                y_proba = numpy.asarray(self._get_estimator_method("predict_proba")(X))
+                classes = self._get_classes()
+
+            if proba:
+                for i, label in enumerate(classes):
+                    columns[f"{column}_proba_{label}"] = y_proba[:, i]
+
+            if top_k is not None:
+                k = min(top_k, len(classes))
+                # Stable sort of negated probabilities keeps ties in class order.
+                ranks = numpy.argsort(-y_proba, axis=1, kind="stable")[:, :k]
+                top_proba = numpy.take_along_axis(y_proba, ranks, axis=1)
+                for i in range(k):
+                    columns[f"{column}_top{i + 1}"] = classes[ranks[:, i]]
+                    columns[f"{column}_top{i + 1}_proba"] = top_proba[:, i]
+
+            if decision:
+                scores = numpy.asarray(
+                    self._get_estimator_method("decision_function")(X)
+                )
+                if scores.ndim == 1:
+                    columns[f"{column}_decision"] = scores
+                else:
+                    for i, label in enumerate(self._get_classes()):
+                        columns[f"{column}_decision_{label}"] = scores[:, i]
 
-        return df[[column]]
+        return pandas.DataFrame(columns, index=index)
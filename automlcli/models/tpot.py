@@ -1,20 +1,26 @@
+from __future__ import annotations
+
+import logging
 import pickle
 import re
 import sys
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
-
-from sklearn.base import BaseEstimator
-
-try:
-    import tpot
-except ImportError:
-    tpot = None
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
+from automlcli.checkpoint import SearchState
 from automlcli.exceptions import ConfigurationError
 from automlcli.io import TeeingIO
 from automlcli.models.model import Model
+from automlcli.profiling import profile_stage
+from automlcli.resources import ResourceLimits
+from automlcli.shards import DataPath
+from automlcli.util import import_optional_module, is_module_available
+
+if TYPE_CHECKING:
+    from sklearn.base import BaseEstimator
+
+logger = logging.getLogger(__name__)
 
 
 @Model.register("tpot")
@@ -25,17 +31,30 @@ class Tpot(Model):
         self,
         task: str,
         target_column: str,
+        index_column: Optional[str] = None,
+        ignored_columns: Optional[List[str]] = None,
+        feature_dtype: str = "float64",
         cv_after_training: bool = False,
+        sampling: Optional[Dict[str, Any]] = None,
+        encoding: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
     ) -> None:
-        if tpot is None:
+        if not is_module_available("tpot"):
             raise ImportError(
-                "Failed to import flaml. Make sure " "flaml is successfully installed"
+                "Failed to import tpot. Make sure " "tpot is successfully installed"
             )
         if task not in self.TPOT_TASKS:
             raise ConfigurationError("task must be 'classification' " "or 'regression'")
 
-        super().__init__(target_column)
+        super().__init__(
+            target_column,
+            index_column,
+            ignored_columns,
+            feature_dtype,
+            sampling,
+            encoding,
+        )
+        self._check_sampling(task == "classification")
         self._task = task
         self._kwargs = kwargs
         self._cv_after_trainnig = cv_after_training
@@ -54,34 +73,56 @@ class Tpot(Model):
             raise RuntimeError("Tpot model is not trained.")
         return self._estimator
 
-    def train(
+    def search(
         self,
-        train_file: Union[str, Path],
-        validation_file: Optional[Union[str, Path]] = None,
+        train_file: DataPath,
+        validation_file: Optional[DataPath] = None,
         workdir: Optional[Union[str, Path]] = None,
+        resume: bool = False,
     ) -> Dict[str, float]:
         X_train, y_train = self.load_data(train_file)
         assert y_train is not None
 
+        tpot = import_optional_module("tpot")
         with tempfile.TemporaryDirectory() as tempdir:
             workdir = Path(workdir or tempdir)
             log_file_name = workdir / "tpot.log"
             pipeline_file_name = workdir / "fitted_pipeline.pkl"
             pipeline_code_file_name = workdir / "pipeline.py"
+            checkpoint_dir = workdir / "checkpoints"
 
-            with open(log_file_name, "w") as log_file:
+            kwargs = dict(self._kwargs)
+            kwargs.setdefault("periodic_checkpoint_folder", str(checkpoint_dir))
+            state = SearchState(
+                workdir, [log_file_name, kwargs["periodic_checkpoint_folder"]]
+            )
+            resume = resume and log_file_name.is_file()
+            state.start(resume)
+            if resume:
+                # TPOT cannot restore its population from the periodic
+                # checkpoints, so the search starts over with the full budget.
+                logger.warning(
+                    "TPOT cannot resume an interrupted search. "
+                    "Restart the search with the full time and generation budgets."
+                )
+
+            with open(log_file_name, "a" if resume else "w") as log_file:
+                log_offset = log_file.tell()
                 teeing_log_file = TeeingIO(log_file, sys.stdout)
                 if self._task == "classification":
                     model = tpot.TPOTClassifier(
                         log_file=teeing_log_file,
-                        **self._kwargs,
+                        **kwargs,
                     )
                 else:
-                    model = tpot.TPOTRegressor(log_file=teeing_log_file, **self._kwargs)
+                    model = tpot.TPOTRegressor(log_file=teeing_log_file, **kwargs)
 
-                model.fit(X_train, y_train)
+                with profile_stage("fit"):
+                    model.fit(X_train, y_train)
 
             with open(log_file_name) as log_file:
+                # Only the restarted search produced the fitted pipeline.
+                log_file.seek(log_offset)
                 tpot_log = log_file.read()
 
             model.export(str(pipeline_code_file_name))
@@ -98,10 +139,22 @@ class Tpot(Model):
 
         return metrics
 
-    def retrain(self, train_file: Union[str, Path]) -> None:
+    def apply_resource_limits(self, limits: ResourceLimits) -> None:
+        if limits.enforced:
+            # A killed TPOT search leaves no population to recover from.
+            raise ConfigurationError(
+                "TPOT does not support wall_time and memory limits, because the "
+                "best pipeline cannot be recovered when the search is killed. "
+                "Use max_time_mins instead."
+            )
+        if limits.cpus is not None:
+            self._kwargs["n_jobs"] = limits.cpus
+
+    def retrain(self, train_file: DataPath) -> None:
         X_train, y_train = self.load_data(train_file)
         assert y_train is not None
-        self.estimator.fit(X_train, y_train)
+        with profile_stage("fit"):
+            self.estimator.fit(X_train, y_train)
 
     @staticmethod
     def _get_metrics_from_log(log: str) -> Dict[str, float]:
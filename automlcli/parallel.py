@@ -0,0 +1,168 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import pandas
+
+from automlcli.artifacts import load_model
+from automlcli.io import open_prediction_writer
+from automlcli.models import Model
+from automlcli.prefetch import is_remote
+
+# A model path, or a picklable function loading the model in each worker
+# (e.g. `functools.partial(load_ensemble, paths)`).
+ModelSource = Union[str, Path, Callable[[], Model]]
+
+_worker_model: Optional[Model] = None
+
+
+def _initialize_worker(model_source: ModelSource) -> None:
+    global _worker_model
+    if callable(model_source):
+        _worker_model = model_source()
+    else:
+        _worker_model = load_model(model_source)
+
+
+def _predict_partition(
+    df: pandas.DataFrame,
+    prediction_column: Optional[str],
+    predict_options: Dict[str, Any],
+) -> pandas.DataFrame:
+    if _worker_model is None:
+        raise RuntimeError("Worker model is not initialized.")
+    return _worker_model.predict_dataframe(df, prediction_column, **predict_options)
+
+
+def predict_shard(
+    model: Model,
+    input_file: str,
+    output_file: str,
+    prediction_column: Optional[str] = None,
+    write_options: Optional[Dict[str, Any]] = None,
+    **predict_options: Any,
+) -> str:
+    """
+    Make predictions for a single input shard and write them into
+    `output_file` with `open_prediction_writer(output_file, **write_options)`.
+    """
+    predictions = model.predict_dataframe(
+        model.load_dataframe(input_file, with_target=False),
+        prediction_column,
+        **predict_options,
+    )
+    if not is_remote(output_file):
+        os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+
+    index = model.index_column is not None
+    with open_prediction_writer(output_file, index, **(write_options or {})) as writer:
+        writer.write(predictions)
+    return output_file
+
+
+def _predict_shard_in_worker(
+    input_file: str,
+    output_file: str,
+    prediction_column: Optional[str],
+    write_options: Optional[Dict[str, Any]],
+    predict_options: Dict[str, Any],
+) -> str:
+    if _worker_model is None:
+        raise RuntimeError("Worker model is not initialized.")
+    return predict_shard(
+        _worker_model,
+        input_file,
+        output_file,
+        prediction_column,
+        write_options,
+        **predict_options,
+    )
+
+
+def split_dataframe(
+    df: pandas.DataFrame,
+    num_partitions: int,
+) -> Iterator[pandas.DataFrame]:
+    partition_size = -(-len(df) // max(num_partitions, 1))
+    for start in range(0, len(df), max(partition_size, 1)):
+        yield df.iloc[start : start + partition_size]
+
+
+def parallel_predict(
+    model_source: ModelSource,
+    partitions: Iterable[pandas.DataFrame],
+    workers: int,
+    prediction_column: Optional[str] = None,
+    max_pending: Optional[int] = None,
+    **predict_options: Any,
+) -> Iterator[pandas.DataFrame]:
+    """
+    Make predictions for each partition in a process pool and yield results
+    in the original partition order. `predict_options` (e.g. `proba`) are
+    passed to `Model.predict_dataframe`. The model is unpickled only once per
+    worker, and at most `max_pending` partitions are in flight at a time so
+    that memory usage stays bounded for streamed inputs.
+    """
+    max_pending = max_pending or 2 * workers
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_worker,
+        initargs=(model_source,),
+    ) as executor:
+        pending: Deque["Future[pandas.DataFrame]"] = deque()
+        for df in partitions:
+            pending.append(
+                executor.submit(
+                    _predict_partition, df, prediction_column, predict_options
+                )
+            )
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def parallel_predict_shards(
+    model_source: ModelSource,
+    shards: Sequence[Tuple[str, str]],
+    workers: int,
+    prediction_column: Optional[str] = None,
+    write_options: Optional[Dict[str, Any]] = None,
+    **predict_options: Any,
+) -> Iterator[str]:
+    """
+    Make predictions for each `(input_file, output_file)` pair in a process
+    pool, so that shards are read, scored and written in parallel. Output
+    files are yielded as they are completed.
+    """
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_worker,
+        initargs=(model_source,),
+    ) as executor:
+        futures = [
+            executor.submit(
+                _predict_shard_in_worker,
+                input_file,
+                output_file,
+                prediction_column,
+                write_options,
+                predict_options,
+            )
+            for input_file, output_file in shards
+        ]
+        for future in as_completed(futures):
+            yield future.result()
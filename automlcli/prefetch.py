@@ -0,0 +1,96 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+from urllib.parse import urlparse
+
+import minato
+
+from automlcli.settings import PREFETCH_WORKERS
+
+logger = logging.getLogger(__name__)
+
+
+def is_remote(url: Union[str, Path]) -> bool:
+    return urlparse(str(url)).scheme not in ("", "file", "osfs")
+
+
+class Prefetcher:
+    """
+    Downloads remote inputs into the minato cache concurrently in background
+    threads. Commands register every input URL up front with `prefetch`, and
+    later calls to `cached_path` wait only for the download of the requested
+    file, so the other downloads overlap with config building and model
+    unpickling.
+    """
+
+    def __init__(self, max_workers: int = PREFETCH_WORKERS) -> None:
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: Dict[str, "Future[Path]"] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _download(url: str) -> Path:
+        start = time.perf_counter()
+        path = Path(minato.cached_path(url))
+        logger.info(
+            "Downloaded %s (%.1f MiB) in %.1fs",
+            url,
+            os.path.getsize(path) / 1024 ** 2 if path.is_file() else 0.0,
+            time.perf_counter() - start,
+        )
+        return path
+
+    def prefetch(
+        self,
+        urls: Iterable[Optional[Union[str, Path]]],
+        wait: bool = False,
+    ) -> None:
+        remote_urls = [str(url) for url in urls if url is not None and is_remote(url)]
+        with self._lock:
+            new_urls = [
+                url for url in dict.fromkeys(remote_urls) if url not in self._futures
+            ]
+            if new_urls:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_workers, thread_name_prefix="prefetch"
+                    )
+                logger.info("Prefetch %d remote files", len(new_urls))
+                for url in new_urls:
+                    self._futures[url] = self._executor.submit(self._download, url)
+            futures = [self._futures[url] for url in remote_urls]
+
+        if wait:
+            for future in futures:
+                future.result()
+
+    def cached_path(self, url: Union[str, Path]) -> Path:
+        with self._lock:
+            future = self._futures.get(str(url))
+        if future is None:
+            return Path(minato.cached_path(url))
+        return future.result()
+
+
+_prefetcher = Prefetcher()
+
+
+def prefetch(*urls: Optional[Union[str, Path]], wait: bool = False) -> None:
+    """
+    Start downloading remote `urls` in the background, or with `wait`, block
+    until they are downloaded. `None` and local paths are ignored.
+    """
+    _prefetcher.prefetch(urls, wait)
+
+
+def cached_path(url: Union[str, Path]) -> Path:
+    """
+    Same as `minato.cached_path`, but waits for the prefetched download if
+    `url` was passed to `prefetch`.
+    """
+    return _prefetcher.cached_path(url)
@@ -0,0 +1,197 @@
+import importlib.util
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+import minato
+
+from automlcli.prefetch import is_remote
+
+logger = logging.getLogger(__name__)
+
+PROFILE_REPORTS = ("cprofile", "pyinstrument")
+
+# The resource module is not available on Windows.
+HAS_RESOURCE = importlib.util.find_spec("resource") is not None
+
+
+def get_peak_rss() -> Optional[int]:
+    """
+    Return the peak resident set size of this process so far in bytes. This
+    is a high-water mark which never decreases.
+    """
+    if not HAS_RESOURCE:
+        return None
+
+    import resource
+
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere.
+    return int(maxrss if sys.platform == "darwin" else maxrss * 1024)
+
+
+class Profiler:
+    """
+    Records wall time, CPU time and peak RSS of named stages such as data
+    loading, fitting and model saving. A stage entered several times (e.g.
+    one per chunk) is accumulated. CPU time is the time of the whole process,
+    so it includes worker threads running during the stage. `peak_rss` is
+    the peak RSS of the process by the end of the stage, which includes
+    earlier stages, not the peak within the stage.
+    """
+
+    TIMINGS_FILENAME = "timings.json"
+
+    def __init__(
+        self,
+        output_dir: Optional[Union[str, Path]] = None,
+        report: Optional[str] = None,
+    ) -> None:
+        if report is not None and report not in PROFILE_REPORTS:
+            raise ValueError(f"report must be one of {PROFILE_REPORTS}: {report}")
+
+        self.output_dir = output_dir
+        self.saved = False
+        self._report = report
+        self._reporter: Any = None
+        self._stages: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - start_wall
+            cpu_time = time.process_time() - start_cpu
+            peak_rss = get_peak_rss()
+            with self._lock:
+                timing = self._stages.setdefault(
+                    name, {"count": 0, "wall_time": 0.0, "cpu_time": 0.0}
+                )
+                timing["count"] += 1
+                timing["wall_time"] += wall_time
+                timing["cpu_time"] += cpu_time
+                if peak_rss is not None:
+                    timing["peak_rss"] = max(timing.get("peak_rss", 0), peak_rss)
+
+    def merge(self, timings: Dict[str, Dict[str, float]]) -> None:
+        """
+        Add stages recorded by another profiler, e.g. in a child process.
+        """
+        with self._lock:
+            for name, other in timings.items():
+                timing = self._stages.setdefault(
+                    name, {"count": 0, "wall_time": 0.0, "cpu_time": 0.0}
+                )
+                for key in ("count", "wall_time", "cpu_time"):
+                    timing[key] += other[key]
+                if "peak_rss" in other:
+                    timing["peak_rss"] = max(
+                        timing.get("peak_rss", 0), other["peak_rss"]
+                    )
+
+    @property
+    def timings(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {name: dict(timing) for name, timing in self._stages.items()}
+
+    def start(self) -> None:
+        if self._report == "cprofile":
+            import cProfile
+
+            self._reporter = cProfile.Profile()
+            self._reporter.enable()
+        elif self._report == "pyinstrument":
+            from automlcli.util import import_optional_module
+
+            pyinstrument = import_optional_module("pyinstrument")
+            self._reporter = pyinstrument.Profiler()
+            self._reporter.start()
+
+    def stop(self) -> None:
+        if self._reporter is None:
+            return
+        if self._report == "cprofile":
+            self._reporter.disable()
+        elif self._reporter.is_running:
+            self._reporter.stop()
+
+    def save(self, output_dir: Union[str, Path]) -> None:
+        """
+        Write `timings.json` and the profile report (if any) into `output_dir`,
+        which may be a remote URL. Saving again overwrites the files with the
+        stages recorded since.
+        """
+        output_dir = str(output_dir).rstrip("/")
+        if not is_remote(output_dir):
+            os.makedirs(output_dir, exist_ok=True)
+
+        with minato.open(f"{output_dir}/{self.TIMINGS_FILENAME}", "w") as fp:
+            json.dump(self.timings, fp, indent=2)
+
+        self.stop()
+        if self._report is not None:
+            filename = "profile.prof" if self._report == "cprofile" else "profile.html"
+            with tempfile.TemporaryDirectory() as tempdir:
+                report_file = os.path.join(tempdir, filename)
+                if self._report == "cprofile":
+                    self._reporter.dump_stats(report_file)
+                else:
+                    with open(report_file, "w") as fp:
+                        fp.write(self._reporter.output_html())
+                with open(report_file, "rb") as src, minato.open(
+                    f"{output_dir}/{filename}", "wb"
+                ) as dst:
+                    shutil.copyfileobj(src, dst)
+
+        logger.info("Save profile to %s", output_dir)
+        self.saved = True
+
+    def get_metrics(self) -> Dict[str, float]:
+        return {
+            f"profile.{name}.{key}": value
+            for name, timing in self.timings.items()
+            for key, value in timing.items()
+            if key != "count"
+        }
+
+
+_profiler: Optional[Profiler] = None
+
+
+def enable_profiling(
+    output_dir: Optional[Union[str, Path]] = None,
+    report: Optional[str] = None,
+) -> Profiler:
+    global _profiler
+    _profiler = Profiler(output_dir, report)
+    _profiler.start()
+    return _profiler
+
+
+def get_profiler() -> Optional[Profiler]:
+    return _profiler
+
+
+@contextmanager
+def profile_stage(name: str) -> Iterator[None]:
+    """
+    Record the enclosed block as a stage of the active profiler. This is a
+    no-op unless profiling is enabled.
+    """
+    if _profiler is None:
+        yield
+        return
+    with _profiler.stage(name):
+        yield
@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import re
+import signal
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+from automlcli.exceptions import ConfigurationError, ResourceLimitExceeded
+from automlcli.profiling import enable_profiling, get_profiler
+from automlcli.settings import LOG_FORMAT
+from automlcli.shards import DataPath
+from automlcli.util import import_optional_module, is_module_available
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+
+    from automlcli.models.model import Model
+
+logger = logging.getLogger(__name__)
+
+THREAD_ENVIRONMENT_VARIABLES = (
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+)
+
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+def parse_size(size: Union[int, float, str]) -> int:
+    """
+    Parse a number of bytes such as `1073741824`, `"512MB"` or `"8G"`.
+    Units are binary (1K = 1024 bytes).
+    """
+    if isinstance(size, (int, float)):
+        return int(size)
+    match = re.fullmatch(r"\s*([0-9.]+)\s*([KMGT]?)(?:i?B)?\s*", size, re.I)
+    if match is None:
+        raise ConfigurationError(f"Invalid size: {size}")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2).upper()])
+
+
+def limit_threads(cpus: int) -> None:
+    """
+    Limit the number of threads used by BLAS / OpenMP in this process and
+    in the processes spawned from it.
+    """
+    for name in THREAD_ENVIRONMENT_VARIABLES:
+        os.environ[name] = str(cpus)
+    if is_module_available("threadpoolctl"):
+        threadpoolctl = import_optional_module("threadpoolctl")
+        threadpoolctl.threadpool_limits(cpus)
+
+
+def limit_cpus(cpus: int) -> None:
+    """
+    Pin this process (and its future children) to at most `cpus` cores.
+    """
+    if hasattr(os, "sched_setaffinity"):
+        available = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, available[:cpus])
+    limit_threads(cpus)
+
+
+def get_process_tree_rss(pid: int) -> Optional[int]:
+    """
+    Return the total resident set size in bytes of the process and all of
+    its descendants, or `None` if `/proc` is not available.
+    """
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+
+    children: Dict[int, List[int]] = {}
+    rss: Dict[int, int] = {}
+    for path in proc.iterdir():
+        if not path.name.isdigit():
+            continue
+        try:
+            stat = (path / "stat").read_text()
+            statm = (path / "statm").read_text()
+        except OSError:
+            # The process exited while scanning.
+            continue
+        # The command name may contain spaces, so split after its closing paren.
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(path.name))
+        rss[int(path.name)] = int(statm.split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+    total = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        total += rss.get(current, 0)
+        stack.extend(children.get(current, []))
+    return total
+
+
+class ResourceLimits:
+    """
+    Resource limits of a training run, given by the `resources` section of
+    the config:
+
+        resources:
+          wall_time: 3600      # seconds
+          recovery_time: 300   # seconds of wall_time kept for recovery
+          memory: 8GB          # resident set size of the whole process tree
+          cpus: 4
+
+    Limits are mapped onto the native options of each backend (see
+    `Model.apply_resource_limits`), and wall-clock and memory limits are also
+    enforced by `train_with_limits`. Training is killed `recovery_time`
+    seconds (by default 10% of `wall_time`) before the wall-clock limit, and
+    the rest is left for recovering the best model found so far.
+    """
+
+    # Fraction of the training time given to the search itself, leaving time
+    # to refit the best model and save it.
+    SEARCH_TIME_RATIO = 0.9
+
+    # Default fraction of the wall-clock limit kept for recovery.
+    RECOVERY_TIME_RATIO = 0.1
+
+    def __init__(
+        self,
+        wall_time: Optional[float] = None,
+        memory: Optional[Union[int, str]] = None,
+        cpus: Optional[int] = None,
+        recovery_time: Optional[float] = None,
+    ) -> None:
+        if wall_time is not None and wall_time <= 0:
+            raise ConfigurationError(f"wall_time must be positive: {wall_time}")
+        if cpus is not None and cpus <= 0:
+            raise ConfigurationError(f"cpus must be positive: {cpus}")
+        if recovery_time is not None:
+            if wall_time is None:
+                raise ConfigurationError("recovery_time requires wall_time.")
+            if not 0 < recovery_time < wall_time:
+                raise ConfigurationError(
+                    "recovery_time must be positive and less than wall_time: "
+                    f"{recovery_time}"
+                )
+        elif wall_time is not None:
+            recovery_time = wall_time * self.RECOVERY_TIME_RATIO
+
+        self.wall_time = wall_time
+        self.recovery_time = recovery_time
+        self.memory = parse_size(memory) if memory is not None else None
+        self.cpus = cpus
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> ResourceLimits:
+        config = config or {}
+        if not isinstance(config, dict):
+            raise ConfigurationError("`resources` field is not a dictionary.")
+        unknown = set(config) - {"wall_time", "recovery_time", "memory", "cpus"}
+        if unknown:
+            raise ConfigurationError(f"Unknown resource limits: {sorted(unknown)}")
+        return cls(**config)
+
+    @property
+    def enforced(self) -> bool:
+        return self.wall_time is not None or self.memory is not None
+
+    def training_time(self) -> Optional[float]:
+        if self.wall_time is None or self.recovery_time is None:
+            return None
+        return self.wall_time - self.recovery_time
+
+    def search_time(self) -> Optional[float]:
+        training_time = self.training_time()
+        if training_time is None:
+            return None
+        return training_time * self.SEARCH_TIME_RATIO
+
+    def check(
+        self,
+        elapsed: float,
+        pid: int,
+        time_limit: Optional[float],
+    ) -> Optional[str]:
+        """
+        Return a description of the exceeded limit, or `None` if the process
+        is within `time_limit` seconds and the memory limit.
+        """
+        if time_limit is not None and elapsed > time_limit:
+            return f"Wall-clock limit exceeded ({elapsed:.1f}s > {time_limit:.1f}s)"
+        if self.memory is not None:
+            rss = get_process_tree_rss(pid)
+            if rss is not None and rss > self.memory:
+                return f"Memory limit exceeded ({rss} > {self.memory} bytes)"
+        return None
+
+
+def _worker(
+    conn: Connection,
+    model: Model,
+    method: str,
+    kwargs: Dict[str, Any],
+    cpus: Optional[int],
+    log_level: int,
+    profile: bool,
+) -> None:
+    logging.basicConfig(format=LOG_FORMAT, level=log_level)
+    # Stages recorded in this process are sent back to be merged into the
+    # profiler of the parent.
+    profiler = enable_profiling() if profile else None
+    # Start a new session so that the supervisor can kill the whole tree
+    # including the workers spawned by the backend.
+    if hasattr(os, "setsid"):
+        os.setsid()
+    if cpus is not None:
+        limit_cpus(cpus)
+
+    try:
+        metrics = getattr(model, method)(**kwargs)
+        result: Tuple[Any, ...] = (model, metrics, None)
+    except Exception as e:  # noqa: B902
+        logger.exception("Failed to %s model", method)
+        result = (None, None, RuntimeError(f"Failed to {method} model: {e!r}"))
+    try:
+        timings = profiler.timings if profiler is not None else None
+        conn.send(result + (timings,))
+    finally:
+        conn.close()
+
+
+def _kill(process: multiprocessing.process.BaseProcess) -> None:
+    assert process.pid is not None
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
+
+
+def _run_with_limits(
+    model: Model,
+    limits: ResourceLimits,
+    time_limit: Optional[float],
+    method: str,
+    kwargs: Dict[str, Any],
+    poll_interval: float,
+) -> Tuple[Optional[str], Optional[Model], Optional[Dict[str, float]]]:
+    """
+    Call `method` of the model in a supervised child process, and return the
+    description of the exceeded limit if it was killed, or the updated model
+    and its metrics.
+    """
+    # The child is spawned rather than forked, because threads of this
+    # process (e.g. uploads and prefetches) may hold locks while forking.
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_worker,
+        args=(
+            sender,
+            model,
+            method,
+            kwargs,
+            limits.cpus,
+            logging.getLogger().getEffectiveLevel(),
+            get_profiler() is not None,
+        ),
+    )
+
+    start = time.monotonic()
+    process.start()
+    sender.close()
+    assert process.pid is not None
+
+    try:
+        while True:
+            if receiver.poll(poll_interval):
+                try:
+                    trained_model, metrics, error, timings = receiver.recv()
+                except EOFError:
+                    raise RuntimeError(f"Process to {method} model exited unexpectedly")
+                profiler = get_profiler()
+                if profiler is not None and timings is not None:
+                    profiler.merge(timings)
+                if error is not None:
+                    raise error
+                return None, trained_model, metrics
+            exceeded = limits.check(time.monotonic() - start, process.pid, time_limit)
+            if exceeded is not None:
+                return exceeded, None, None
+    finally:
+        _kill(process)
+        process.join()
+        receiver.close()
+
+
+def train_with_limits(
+    model: Model,
+    limits: ResourceLimits,
+    train_file: DataPath,
+    validation_file: Optional[DataPath] = None,
+    workdir: Optional[Union[str, Path]] = None,
+    resume: bool = False,
+    poll_interval: float = 1.0,
+) -> Tuple[Model, Dict[str, float]]:
+    """
+    Train the model in a supervised child process which is killed when it
+    exceeds its share of the wall-clock limit or the memory limit. In that
+    case the best model found so far is recovered from the search checkpoints
+    in `workdir`, in another child process which has the rest of the
+    wall-clock limit. Return the trained model and its metrics.
+    """
+    if not limits.enforced:
+        return model, model.train(train_file, validation_file, workdir, resume=resume)
+
+    exceeded, trained_model, metrics = _run_with_limits(
+        model,
+        limits,
+        limits.training_time(),
+        "train",
+        {
+            "train_file": train_file,
+            "validation_file": validation_file,
+            "workdir": workdir,
+            "resume": resume,
+        },
+        poll_interval,
+    )
+    if exceeded is None:
+        assert trained_model is not None and metrics is not None
+        return trained_model, metrics
+
+    logger.warning("%s, recover the best model found so far", exceeded)
+    if workdir is None:
+        raise ResourceLimitExceeded(exceeded)
+    try:
+        recovery_exceeded, trained_model, metrics = _run_with_limits(
+            model,
+            limits,
+            limits.recovery_time,
+            "recover",
+            {
+                "train_file": train_file,
+                "validation_file": validation_file,
+                "workdir": workdir,
+            },
+            poll_interval,
+        )
+    except RuntimeError as e:
+        raise ResourceLimitExceeded(
+            f"{exceeded}, and failed to recover the best model: {e!r}"
+        ) from e
+    if recovery_exceeded is not None:
+        raise ResourceLimitExceeded(
+            f"{exceeded}, and failed to recover the best model: {recovery_exceeded}"
+        )
+    assert trained_model is not None and metrics is not None
+    metrics["resource_limit_exceeded"] = 1.0
+    return trained_model, metrics
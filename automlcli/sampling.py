@@ -0,0 +1,138 @@
+import logging
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy
+import pandas
+
+from automlcli.exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+
+class Sampler:
+    """
+    Draws a random sample of rows in a single streaming pass over chunks of
+    a dataset, given either the target number of rows (`size`) or the
+    `fraction` of rows to keep.
+
+    A fixed size sample is the set of rows with the smallest random keys
+    (bottom-k sampling), which is a uniform sample without replacement and
+    is maintained with one `argpartition` per chunk. With `stratify`, one
+    such reservoir is kept per class and the size is split across classes
+    in proportion to their frequencies, so memory is bounded by `size` rows
+    per class. A fraction sample keeps each row independently, so class
+    proportions are kept in expectation.
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        fraction: Optional[float] = None,
+        stratify: bool = False,
+        chunk_size: int = 100000,
+        seed: int = 13370,
+    ) -> None:
+        if (size is None) == (fraction is None):
+            raise ConfigurationError("Either sampling size or fraction is required.")
+        if size is not None and size <= 0:
+            raise ConfigurationError(f"Sampling size must be positive: {size}")
+        if fraction is not None and not 0.0 < fraction <= 1.0:
+            raise ConfigurationError(f"Sampling fraction must be in (0, 1]: {fraction}")
+
+        self.size = size
+        self.fraction = fraction
+        self.stratify = stratify
+        self.chunk_size = chunk_size
+        self.seed = seed
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> Optional["Sampler"]:
+        if config is None:
+            return None
+        if not isinstance(config, dict):
+            raise ConfigurationError(f"sampling should be a dict: {config}")
+
+        unknown_keys = set(config) - {
+            "size",
+            "fraction",
+            "stratify",
+            "chunk_size",
+            "seed",
+        }
+        if unknown_keys:
+            raise ConfigurationError(f"Unknown sampling keys: {sorted(unknown_keys)}")
+        return cls(**config)
+
+    def sample(
+        self,
+        frames: Iterable[pandas.DataFrame],
+        target_column: Optional[str] = None,
+    ) -> pandas.DataFrame:
+        if self.stratify and target_column is None:
+            raise ConfigurationError("target column is required for stratification")
+
+        rng = numpy.random.default_rng(self.seed)
+        samples: List[pandas.DataFrame] = []
+        reservoirs: Dict[Hashable, Tuple[pandas.DataFrame, numpy.ndarray]] = {}
+        counts: Dict[Hashable, int] = {}
+        num_rows = 0
+
+        for df in frames:
+            num_rows += len(df)
+            if self.fraction is not None:
+                samples.append(df[rng.random(len(df)) < self.fraction])
+                continue
+
+            keys = rng.random(len(df))
+            if not self.stratify:
+                self._update_reservoir(reservoirs, None, df, keys)
+                continue
+
+            groups = df.groupby(target_column, sort=False).indices
+            for label, positions in groups.items():
+                counts[label] = counts.get(label, 0) + len(positions)
+                self._update_reservoir(
+                    reservoirs, label, df.iloc[positions], keys[positions]
+                )
+
+        if self.fraction is None and self.stratify:
+            assert self.size is not None
+            for label, (df, keys) in reservoirs.items():
+                size = max(1, round(self.size * counts[label] / num_rows))
+                samples.append(self._take_smallest(df, keys, size))
+        elif self.fraction is None:
+            samples.extend(df for df, _ in reservoirs.values())
+
+        if not samples:
+            raise ValueError("No rows to sample from.")
+
+        sample = pandas.concat(samples, ignore_index=True)
+        logger.info("Sampled %d of %d rows", len(sample), num_rows)
+        return sample
+
+    def _update_reservoir(
+        self,
+        reservoirs: Dict[Hashable, Tuple[pandas.DataFrame, numpy.ndarray]],
+        label: Hashable,
+        df: pandas.DataFrame,
+        keys: numpy.ndarray,
+    ) -> None:
+        assert self.size is not None
+        if label in reservoirs:
+            reservoir, reservoir_keys = reservoirs[label]
+            df = pandas.concat([reservoir, df])
+            keys = numpy.concatenate([reservoir_keys, keys])
+        if len(df) > self.size:
+            positions = numpy.argpartition(keys, self.size - 1)[: self.size]
+            df, keys = df.iloc[positions], keys[positions]
+        reservoirs[label] = (df, keys)
+
+    @staticmethod
+    def _take_smallest(
+        df: pandas.DataFrame,
+        keys: numpy.ndarray,
+        size: int,
+    ) -> pandas.DataFrame:
+        if len(df) <= size:
+            return df
+        return df.iloc[numpy.argpartition(keys, size - 1)[:size]]
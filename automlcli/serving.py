@@ -0,0 +1,202 @@
+import io
+import json
+import logging
+import os
+import queue
+import socketserver
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, List, Optional, Tuple, Type
+
+import pandas
+
+from automlcli.models import Model
+
+logger = logging.getLogger(__name__)
+
+_Request = Tuple[pandas.DataFrame, "Future[pandas.DataFrame]"]
+
+
+class MicroBatcher:
+    """
+    Group concurrent prediction requests into micro-batches. A batch is
+    flushed before it would exceed `max_batch_size` rows or when `max_wait`
+    seconds have passed since its first request arrived. A request larger
+    than `max_batch_size` is predicted in a batch of its own. If a batch
+    fails, its requests are predicted one by one, so that a malformed
+    request fails only by itself.
+    """
+
+    def __init__(
+        self,
+        predict: Callable[[pandas.DataFrame], pandas.DataFrame],
+        max_batch_size: int = 256,
+        max_wait: float = 0.005,
+    ) -> None:
+        self._predict = predict
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._queue: "queue.Queue[_Request]" = queue.Queue()
+        self._pending: Optional[_Request] = None
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def submit(self, df: pandas.DataFrame) -> "Future[pandas.DataFrame]":
+        future: "Future[pandas.DataFrame]" = Future()
+        self._queue.put((df, future))
+        return future
+
+    def _collect(self) -> List[_Request]:
+        if self._pending is not None:
+            batch = [self._pending]
+            self._pending = None
+        else:
+            try:
+                batch = [self._queue.get(timeout=0.1)]
+            except queue.Empty:
+                return []
+
+        num_rows = len(batch[0][0])
+        deadline = time.monotonic() + self._max_wait
+        while num_rows < self._max_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if num_rows + len(item[0]) > self._max_batch_size:
+                # The request starts the next batch.
+                self._pending = item
+                break
+            batch.append(item)
+            num_rows += len(item[0])
+        return batch
+
+    def _predict_each(self, batch: List[_Request]) -> None:
+        for df, future in batch:
+            try:
+                future.set_result(self._predict(df))
+            except Exception as e:  # noqa: B902
+                future.set_exception(e)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            batch = self._collect()
+            if not batch:
+                continue
+
+            try:
+                inputs = pandas.concat([df for df, _ in batch], ignore_index=True)
+                predictions = self._predict(inputs)
+            except Exception as e:  # noqa: B902
+                if len(batch) > 1:
+                    logger.warning("Failed to predict a batch, retry each request")
+                    self._predict_each(batch)
+                else:
+                    batch[0][1].set_exception(e)
+                continue
+
+            offset = 0
+            for df, future in batch:
+                future.set_result(predictions.iloc[offset : offset + len(df)])
+                offset += len(df)
+
+
+def _parse_rows(body: bytes, content_type: str) -> pandas.DataFrame:
+    if content_type.startswith("text/csv"):
+        return pandas.read_csv(io.BytesIO(body))
+
+    rows = json.loads(body)
+    if isinstance(rows, dict):
+        rows = rows["rows"]
+    return pandas.DataFrame.from_records(rows)
+
+
+def _create_handler(
+    model: Model,
+    batcher: MicroBatcher,
+) -> Type[BaseHTTPRequestHandler]:
+    class PredictionRequestHandler(BaseHTTPRequestHandler):
+        def address_string(self) -> str:
+            # Unix domain sockets do not have client addresses.
+            if isinstance(self.client_address, tuple):
+                return str(self.client_address[0])
+            return "unix"
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug("%s - %s", self.address_string(), format % args)
+
+        def _send(self, status: int, body: str) -> None:
+            content = body.encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def do_GET(self) -> None:
+            if self.path == "/health":
+                self._send(200, json.dumps({"status": "ok"}))
+            else:
+                self._send(404, json.dumps({"error": "not found"}))
+
+        def do_POST(self) -> None:
+            if self.path != "/predict":
+                self._send(404, json.dumps({"error": "not found"}))
+                return
+
+            content_type = self.headers.get("Content-Type", "application/json")
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                if length < 0:
+                    raise ValueError(f"negative Content-Length: {length}")
+                df = _parse_rows(self.rfile.read(length), content_type)
+                model.check_columns(df)
+            except (ValueError, KeyError) as e:
+                self._send(400, json.dumps({"error": f"invalid request: {e}"}))
+                return
+
+            try:
+                predictions = batcher.submit(df).result()
+            except Exception as e:  # noqa: B902
+                logger.exception("Failed to make predictions")
+                self._send(500, json.dumps({"error": str(e)}))
+                return
+
+            if model.index_column is not None:
+                predictions = predictions.reset_index()
+            self._send(200, predictions.to_json(orient="records"))
+
+    return PredictionRequestHandler
+
+
+class _ThreadingUnixHTTPServer(
+    socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    daemon_threads = True
+
+
+def create_server(
+    model: Model,
+    batcher: MicroBatcher,
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    unix_socket: Optional[str] = None,
+) -> socketserver.BaseServer:
+    handler = _create_handler(model, batcher)
+    if unix_socket is not None:
+        if os.path.exists(unix_socket):
+            os.remove(unix_socket)
+        return _ThreadingUnixHTTPServer(unix_socket, handler)
+    return ThreadingHTTPServer((host, port), handler)
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 # colt settings
@@ -5,9 +6,32 @@ DEFAULT_COLT_SETTING = {
     "typekey": "type",
 }
 
+# logging settings
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
+
 # automlcli directory settings
 AUTOMLCLI_ROOT = Path.home() / ".automlcli"
 
 # plugin settings
 LOCAL_PLUGINS_FILENAME = ".automlcli_plugins"
 GLOBAL_PLUGINS_FILENAME = AUTOMLCLI_ROOT / "plugins"
+
+# data cache settings
+DATA_CACHE_DIR = Path(os.environ.get("AUTOMLCLI_CACHE_DIR", AUTOMLCLI_ROOT / "cache"))
+DATA_CACHE_MAX_SIZE = int(os.environ.get("AUTOMLCLI_CACHE_MAX_SIZE", 10 * 1024 ** 3))
+
+# remote workdir settings
+UPLOAD_WORKERS = int(os.environ.get("AUTOMLCLI_UPLOAD_WORKERS", 8))
+UPLOAD_PART_SIZE = int(os.environ.get("AUTOMLCLI_UPLOAD_PART_SIZE", 8 * 1024 ** 2))
+WORKDIR_SYNC_INTERVAL = float(os.environ.get("AUTOMLCLI_SYNC_INTERVAL", 30))
+
+# prefetch settings
+PREFETCH_WORKERS = int(os.environ.get("AUTOMLCLI_PREFETCH_WORKERS", 8))
+
+# sharded input settings
+SHARD_WORKERS = int(os.environ.get("AUTOMLCLI_SHARD_WORKERS", 8))
+
+# mlflow logging settings
+MLFLOW_BATCH_INTERVAL = float(os.environ.get("AUTOMLCLI_MLFLOW_BATCH_INTERVAL", 1.0))
+MLFLOW_MAX_RETRIES = int(os.environ.get("AUTOMLCLI_MLFLOW_MAX_RETRIES", 3))
+MLFLOW_FLUSH_TIMEOUT = float(os.environ.get("AUTOMLCLI_MLFLOW_FLUSH_TIMEOUT", 300))
@@ -0,0 +1,121 @@
+import glob
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, TypeVar, Union
+from urllib.parse import urlparse
+
+from fs import open_fs
+
+from automlcli.settings import SHARD_WORKERS
+
+T = TypeVar("T")
+
+FilePath = Union[str, Path]
+# A file, a glob pattern, a directory, or a list of them.
+DataPath = Union[FilePath, Sequence[FilePath]]
+
+_GLOB_PATTERN = re.compile(r"[*?\[]")
+
+
+def _is_hidden(name: str) -> bool:
+    # e.g. `.crc` files or `_SUCCESS` markers written next to data shards
+    return name.startswith((".", "_"))
+
+
+def _expand_local(path: str) -> List[str]:
+    if urlparse(path).scheme == "file":
+        path = urlparse(path).path
+
+    if _GLOB_PATTERN.search(path):
+        return sorted(p for p in glob.glob(path, recursive=True) if os.path.isfile(p))
+
+    if os.path.isdir(path):
+        files: List[str] = []
+        for root, dirnames, filenames in os.walk(path):
+            dirnames[:] = [name for name in dirnames if not _is_hidden(name)]
+            files.extend(
+                os.path.join(root, name) for name in filenames if not _is_hidden(name)
+            )
+        return sorted(files)
+
+    return [path]
+
+
+def _expand_remote(url: str) -> List[str]:
+    match = _GLOB_PATTERN.search(url)
+    if match is None and not url.endswith("/"):
+        return [url]
+
+    if match is not None:
+        base_url = url[: match.start()].rpartition("/")[0]
+        pattern = url[len(base_url) :]
+    else:
+        base_url, pattern = url.rstrip("/"), "/**"
+
+    with open_fs(base_url) as fs:
+        paths = [
+            glob_match.path
+            for glob_match in fs.glob(pattern, namespaces=["basic"])
+            if not glob_match.info.is_dir
+        ]
+
+    if match is None:
+        paths = [
+            path
+            for path in paths
+            if not any(_is_hidden(name) for name in path.split("/"))
+        ]
+    return [base_url + path for path in sorted(paths)]
+
+
+def expand_data_path(data_path: Optional[DataPath]) -> List[str]:
+    """
+    Expand a data path into the sorted list of its files. A data path is a
+    file, a glob pattern (e.g. `data/*.csv` or `s3://bucket/dt=*/*.parquet`),
+    a directory, or a list of them. Remote globs and directories are listed
+    with pyfilesystem, and remote directories must end with `/`. Hidden files
+    in directories and files starting with `_` (e.g. `_SUCCESS`) are skipped.
+    """
+    if data_path is None:
+        return []
+    if not isinstance(data_path, (str, Path)):
+        return [file for path in data_path for file in expand_data_path(path)]
+
+    path = str(data_path)
+    if urlparse(path).scheme in ("", "file"):
+        files = _expand_local(path)
+    else:
+        files = _expand_remote(path)
+
+    if not files:
+        raise FileNotFoundError(f"No files found in {path}")
+    return files
+
+
+def map_shards(
+    func: Callable[[str], T],
+    files: Sequence[str],
+    max_workers: int = SHARD_WORKERS,
+) -> List[T]:
+    """
+    Apply `func` to each file concurrently in a thread pool and return the
+    results in the order of `files`.
+    """
+    if len(files) == 1:
+        return [func(files[0])]
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(files)), thread_name_prefix="shard"
+    ) as executor:
+        return list(executor.map(func, files))
+
+
+def get_shard_names(files: Sequence[str]) -> List[str]:
+    """
+    Return the paths of `files` relative to their common parent directory,
+    e.g. `dt=2021-01-01/part-0.csv`, to name per-shard outputs.
+    """
+    prefix = os.path.commonprefix(list(files))
+    root = prefix[: prefix.rfind("/") + 1]
+    return [file[len(root) :] for file in files]
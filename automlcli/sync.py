@@ -0,0 +1,129 @@
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from fs import open_fs
+from fs.base import FS
+
+from automlcli.settings import UPLOAD_PART_SIZE, UPLOAD_WORKERS
+
+logger = logging.getLogger(__name__)
+
+
+class DirectorySync:
+    """
+    Mirror a local directory into a pyfilesystem URL (e.g. `s3://bucket/run`).
+    Each `sync` uploads only files which are new or modified since the last
+    sync, concurrently with `workers` threads, each of which holds its own
+    filesystem connection. Files are streamed in parts of `part_size` bytes
+    rather than read into memory. With `start(interval)` the directory is
+    synced periodically in the background until `stop` is called.
+    """
+
+    def __init__(
+        self,
+        local_dir: Union[str, Path],
+        fs_url: str,
+        workers: int = UPLOAD_WORKERS,
+        part_size: int = UPLOAD_PART_SIZE,
+    ) -> None:
+        self._local_dir = Path(local_dir)
+        self._fs_url = fs_url
+        self._part_size = part_size
+        self._uploaded: Dict[str, Tuple[int, int]] = {}
+        self._sync_lock = threading.Lock()
+        self._local = threading.local()
+        self._filesystems: List[FS] = []
+        self._filesystems_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+
+    def _get_fs(self) -> FS:
+        fs = getattr(self._local, "fs", None)
+        if fs is None:
+            fs = open_fs(self._fs_url, create=True)
+            self._local.fs = fs
+            with self._filesystems_lock:
+                self._filesystems.append(fs)
+        return fs
+
+    def _upload(self, relpath: str) -> None:
+        fs = self._get_fs()
+        remote_dir = os.path.dirname(relpath)
+        if remote_dir:
+            fs.makedirs(remote_dir, recreate=True)
+        with open(self._local_dir / relpath, "rb") as fp:
+            fs.upload(relpath, fp, chunk_size=self._part_size)
+
+    def _list_modified_files(self) -> Dict[str, Tuple[int, int]]:
+        modified = {}
+        for root, _, filenames in os.walk(self._local_dir):
+            for filename in filenames:
+                local_path = os.path.join(root, filename)
+                relpath = os.path.relpath(local_path, self._local_dir)
+                try:
+                    stat = os.stat(local_path)
+                except FileNotFoundError:
+                    continue
+                signature = (stat.st_size, stat.st_mtime_ns)
+                if self._uploaded.get(relpath) != signature:
+                    modified[relpath] = signature
+        return modified
+
+    def mark_synced(self) -> None:
+        """
+        Treat the current local files as uploaded, e.g. after downloading
+        them from the remote directory.
+        """
+        with self._sync_lock:
+            self._uploaded.update(self._list_modified_files())
+
+    def sync(self) -> int:
+        """
+        Upload new and modified files and return the number of uploaded files.
+        """
+        with self._sync_lock:
+            modified = self._list_modified_files()
+            if not modified:
+                return 0
+
+            # Larger files first, so that they do not end up as stragglers.
+            relpaths = sorted(modified, key=lambda p: modified[p][0], reverse=True)
+            uploads = self._executor.map(self._upload, relpaths)
+            for relpath, _ in zip(relpaths, uploads):
+                self._uploaded[relpath] = modified[relpath]
+
+            logger.debug("Uploaded %d files to %s", len(relpaths), self._fs_url)
+            return len(relpaths)
+
+    def _run(self, interval: float) -> None:
+        while not self._stop_event.wait(interval):
+            try:
+                self.sync()
+            except Exception:  # noqa: B902
+                # A failed periodic sync is retried by the next one.
+                logger.warning("Failed to sync %s", self._fs_url, exc_info=True)
+
+    def start(self, interval: float) -> None:
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def close(self) -> None:
+        self.stop()
+        self._executor.shutdown()
+        with self._filesystems_lock:
+            for fs in self._filesystems:
+                fs.close()
+            self._filesystems = []
@@ -0,0 +1,245 @@
+import logging
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from flatten_dict import flatten
+
+from automlcli.settings import (
+    MLFLOW_BATCH_INTERVAL,
+    MLFLOW_FLUSH_TIMEOUT,
+    MLFLOW_MAX_RETRIES,
+    UPLOAD_WORKERS,
+)
+from automlcli.util import import_optional_module
+
+logger = logging.getLogger(__name__)
+
+# Limits of a single `log_batch` request of the mlflow REST API.
+MAX_PARAMS_PER_BATCH = 100
+MAX_METRICS_PER_BATCH = 1000
+
+
+def _chunks(items: Sequence[Any], size: int) -> List[Sequence[Any]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+class MlflowLogger:
+    """
+    Logs params, metrics and artifacts of an mlflow run in the background,
+    so that a slow tracking server does not block training.
+
+    Params (nested dicts are flattened with `.`) and metrics are queued and
+    sent with `log_batch` every `batch_interval` seconds. Artifact files are
+    snapshotted by hard links when they are logged, so the source directory
+    can be removed right away, and uploaded concurrently by `workers`
+    threads. Failed requests are retried up to `max_retries` times with
+    exponential backoff, and `close` waits for pending requests until its
+    deadline. After that they are dropped, so the process can exit.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        client: Optional[Any] = None,
+        batch_interval: float = MLFLOW_BATCH_INTERVAL,
+        max_retries: int = MLFLOW_MAX_RETRIES,
+        retry_interval: float = 1.0,
+        workers: int = UPLOAD_WORKERS,
+    ) -> None:
+        if client is None:
+            client = import_optional_module("mlflow.tracking").MlflowClient()
+
+        self._entities = import_optional_module("mlflow.entities")
+        self._run_id = run_id
+        self._client = client
+        self._batch_interval = batch_interval
+        self._max_retries = max_retries
+        self._retry_interval = retry_interval
+        self._workers = workers
+
+        self._params: Dict[str, str] = {}
+        self._metrics: List[Any] = []
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._wakeup = threading.Event()
+        self._closed = threading.Event()
+        self._abandoned = threading.Event()
+
+        self._uploads: "queue.Queue[Optional[Tuple[str, Optional[str]]]]" = (
+            queue.Queue()
+        )
+        self._upload_threads: List[threading.Thread] = []
+        self._staging_dir: Optional[str] = None
+
+        # Daemon threads do not block the exit of the process.
+        self._batch_thread = threading.Thread(target=self._run_batches, daemon=True)
+        self._batch_thread.start()
+
+    def log_params(self, params: Dict[str, Any]) -> None:
+        flattened = flatten(params, reducer="dot")
+        with self._condition:
+            self._params.update({key: str(value) for key, value in flattened.items()})
+
+    def log_metrics(
+        self, metrics: Dict[str, float], step: Optional[int] = None
+    ) -> None:
+        timestamp = int(time.time() * 1000)
+        with self._condition:
+            self._metrics.extend(
+                self._entities.Metric(key, float(value), timestamp, step or 0)
+                for key, value in metrics.items()
+            )
+
+    def log_artifacts(
+        self,
+        local_dir: Union[str, Path],
+        artifact_path: Optional[str] = None,
+    ) -> None:
+        if self._staging_dir is None:
+            self._staging_dir = tempfile.mkdtemp(prefix="automlcli-mlflow-")
+            for _ in range(self._workers):
+                thread = threading.Thread(target=self._run_uploads, daemon=True)
+                thread.start()
+                self._upload_threads.append(thread)
+
+        staging_dir = tempfile.mkdtemp(dir=self._staging_dir)
+        for root, _, filenames in os.walk(local_dir):
+            reldir = os.path.relpath(root, local_dir)
+            os.makedirs(os.path.join(staging_dir, reldir), exist_ok=True)
+            for filename in filenames:
+                source = os.path.join(root, filename)
+                staged = os.path.join(staging_dir, reldir, filename)
+                try:
+                    os.link(source, staged)
+                except OSError:
+                    # e.g. across devices
+                    shutil.copy2(source, staged)
+
+                if reldir == ".":
+                    remote_dir = artifact_path
+                else:
+                    remote_dir = os.path.join(artifact_path or "", reldir)
+                with self._condition:
+                    self._in_flight += 1
+                self._uploads.put((staged, remote_dir))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all queued params, metrics and artifacts are logged, and
+        return whether they were done within `timeout` seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self._wakeup.set()
+        with self._condition:
+            while self._params or self._metrics or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = MLFLOW_FLUSH_TIMEOUT) -> bool:
+        start = time.monotonic()
+        flushed = self.flush(timeout)
+        if not flushed:
+            with self._condition:
+                pending = len(self._params) + len(self._metrics) + self._in_flight
+            logger.warning(
+                "Give up logging %d pending items to mlflow after %.1f seconds",
+                pending,
+                time.monotonic() - start,
+            )
+            self._abandoned.set()
+
+        self._closed.set()
+        self._wakeup.set()
+        for _ in self._upload_threads:
+            self._uploads.put(None)
+        if flushed:
+            self._batch_thread.join()
+            for thread in self._upload_threads:
+                thread.join()
+        if self._staging_dir is not None:
+            shutil.rmtree(self._staging_dir, ignore_errors=True)
+        return flushed
+
+    def _call(
+        self,
+        description: str,
+        func: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        for attempt in range(self._max_retries + 1):
+            try:
+                func(*args, **kwargs)
+                return
+            except Exception:  # noqa: B902
+                if self._abandoned.is_set():
+                    return
+                if attempt == self._max_retries:
+                    logger.warning("Failed to %s", description, exc_info=True)
+                    return
+                logger.debug("Retry to %s", description, exc_info=True)
+                self._abandoned.wait(self._retry_interval * 2 ** attempt)
+
+    def _send_batches(self) -> None:
+        with self._condition:
+            params, self._params = self._params, {}
+            metrics, self._metrics = self._metrics, []
+            self._in_flight += 1
+        try:
+            param_entities = [
+                self._entities.Param(key, value) for key, value in params.items()
+            ]
+            for chunk in _chunks(param_entities, MAX_PARAMS_PER_BATCH):
+                self._call(
+                    "log params to mlflow",
+                    self._client.log_batch,
+                    self._run_id,
+                    params=chunk,
+                )
+            for chunk in _chunks(metrics, MAX_METRICS_PER_BATCH):
+                self._call(
+                    "log metrics to mlflow",
+                    self._client.log_batch,
+                    self._run_id,
+                    metrics=chunk,
+                )
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def _run_batches(self) -> None:
+        while not self._abandoned.is_set():
+            self._wakeup.wait(self._batch_interval)
+            self._wakeup.clear()
+            self._send_batches()
+            if self._closed.is_set():
+                return
+
+    def _run_uploads(self) -> None:
+        while True:
+            task = self._uploads.get()
+            if task is None or self._abandoned.is_set():
+                return
+            local_path, artifact_path = task
+            try:
+                self._call(
+                    f"log artifact {local_path} to mlflow",
+                    self._client.log_artifact,
+                    self._run_id,
+                    local_path,
+                    artifact_path,
+                )
+            finally:
+                with self._condition:
+                    self._in_flight -= 1
+                    self._condition.notify_all()
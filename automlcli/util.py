@@ -1,3 +1,5 @@
+import importlib
+import importlib.util
 import logging
 import os
 import random
@@ -5,12 +7,18 @@ import re
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path
+from types import ModuleType
 from typing import Iterable, Iterator, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import numpy
 from fs import open_fs
 from fs.copy import copy_fs
+from fs.errors import CreateFailed
+
+from automlcli.profiling import profile_stage
+from automlcli.settings import WORKDIR_SYNC_INTERVAL
+from automlcli.sync import DirectorySync
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +33,20 @@ def set_random_seed(
         numpy.random.seed(numpy_seed)
 
 
+def is_module_available(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+def import_optional_module(name: str) -> ModuleType:
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        package = name.split(".", 1)[0]
+        raise ImportError(
+            f"Failed to import {name}. Make sure {package} is successfully installed"
+        ) from e
+
+
 def ext_match(file_path: Union[str, Path], exts: Iterable[str]) -> bool:
     filename = urlparse(str(file_path)).path
     pattern = re.compile(rf".+\.{ '|'.join(exts) }(\..*)?$")
@@ -47,10 +69,28 @@ def get_parent_path_and_filename(file_path: str) -> Tuple[str, str]:
     return parent, name
 
 
+def _fs_exists(url: str) -> bool:
+    parent, name = get_parent_path_and_filename(url)
+    try:
+        with open_fs(parent) as fs:
+            return bool(fs.exists(name))
+    except CreateFailed:
+        return False
+
+
 @contextmanager
 def create_workdir(
-    path: Optional[Union[str, Path]] = None, exist_ok: bool = False
+    path: Optional[Union[str, Path]] = None,
+    exist_ok: bool = False,
+    restore: bool = False,
+    sync_interval: Optional[float] = WORKDIR_SYNC_INTERVAL,
 ) -> Iterator[Path]:
+    """
+    Yield a local working directory for `path`. Remote paths are backed by a
+    temporary directory which is uploaded concurrently, every `sync_interval`
+    seconds while in use and once more on exit. With `restore` the existing
+    contents of the remote directory are downloaded first.
+    """
     if path is None:
         with tempfile.TemporaryDirectory() as tempdir:
             yield Path(tempdir)
@@ -63,10 +103,23 @@ def create_workdir(
         return
 
     path = str(path)
-    with open_fs(path) as fs:
-        if not exist_ok and fs.exists:
-            raise FileExistsError(f"File exists: {path}")
+    if not exist_ok and _fs_exists(path):
+        raise FileExistsError(f"File exists: {path}")
 
     with tempfile.TemporaryDirectory() as tempdir:
-        yield Path(tempdir)
-        copy_fs(tempdir, path)
+        if restore:
+            with open_fs(path, create=True) as fs, profile_stage("download"):
+                copy_fs(fs, tempdir)
+
+        syncer = DirectorySync(tempdir, path)
+        if restore:
+            syncer.mark_synced()
+        if sync_interval:
+            syncer.start(sync_interval)
+        try:
+            yield Path(tempdir)
+        finally:
+            syncer.stop()
+            with profile_stage("upload"):
+                syncer.sync()
+            syncer.close()
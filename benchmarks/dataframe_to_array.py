@@ -0,0 +1,70 @@
+"""
+Peak memory of `Model._dataframe_to_array` for each feature dtype.
+
+    $ python benchmarks/dataframe_to_array.py --rows 1000000 --columns 200
+"""
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict
+
+import numpy
+import pandas
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from automlcli.models import Model  # noqa: E402
+
+
+def _legacy_dataframe_to_array(model: Model, df: pandas.DataFrame) -> Any:
+    # The conversion used before feature_dtype was introduced.
+    y = df.pop(model._target_column).to_numpy()
+    X = df.to_numpy(dtype=float)
+    return X, y
+
+
+def measure_peak_memory(func: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run(rows: int, columns: int) -> Dict[str, float]:
+    rng = numpy.random.default_rng(0)
+    data = {f"x{i}": rng.random(rows, dtype=numpy.float32) for i in range(columns)}
+    data["target"] = rng.integers(0, 2, rows)
+
+    results: Dict[str, float] = {}
+
+    df = pandas.DataFrame(data)
+    model = Model(target_column="target")
+    results["legacy"] = measure_peak_memory(
+        lambda: _legacy_dataframe_to_array(model, df.copy(deep=False))
+    )
+    for feature_dtype in Model.FEATURE_DTYPES:
+        model = Model(target_column="target", feature_dtype=feature_dtype)
+        results[feature_dtype] = measure_peak_memory(
+            lambda: model._dataframe_to_array(df)
+        )
+
+    return {key: value / 1024 ** 2 for key, value in results.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--columns", type=int, default=200)
+    args = parser.parse_args()
+
+    results = run(args.rows, args.columns)
+    print(json.dumps({"peak_memory_mib": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
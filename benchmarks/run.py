@@ -0,0 +1,280 @@
+"""
+Throughput of data loading, training, prediction, evaluation, artifact
+save / load and CLI cold start on synthetic datasets.
+
+    $ python benchmarks/run.py --scales 10000x20 100000x50 --output results.json
+    $ python benchmarks/run.py --baseline results.json --output new.json
+
+Results are written as a flat list of records so that two runs can be
+compared with `--baseline`.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy
+import pandas
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import startup  # noqa: E402
+
+from automlcli import __version__  # noqa: E402
+from automlcli.artifacts import load_model, save_model  # noqa: E402
+from automlcli.cache import set_cache_enabled  # noqa: E402
+from automlcli.configs import ConfigBuilder  # noqa: E402
+from automlcli.evaluation import evaluate  # noqa: E402
+from automlcli.models import Model  # noqa: E402
+from automlcli.util import is_module_available  # noqa: E402
+
+FORMATS = ("csv", "tsv", "jsonl", "pkl", "parquet", "feather", "npy", "npz")
+MODELS = ("flaml", "tpot")
+
+# Fixed tiny search budgets, so that runs are comparable across commits.
+MODEL_PARAMS: Dict[str, Dict[str, Any]] = {
+    "flaml": {
+        "task": "classification",
+        "metric": "accuracy",
+        "time_budget": 2,
+        "estimator_list": ["lgbm"],
+        "verbose": 0,
+    },
+    "tpot": {
+        "task": "classification",
+        "generations": 1,
+        "population_size": 4,
+        "max_time_mins": 1,
+        "verbosity": 0,
+    },
+}
+
+
+def generate_dataframe(rows: int, columns: int, seed: int = 0) -> pandas.DataFrame:
+    rng = numpy.random.default_rng(seed)
+    X = rng.standard_normal((rows, columns))
+    weights = rng.standard_normal(columns)
+    data = {f"x{i}": X[:, i] for i in range(columns)}
+    data["target"] = (X @ weights > 0).astype(numpy.int64)
+    return pandas.DataFrame(data)
+
+
+def write_dataset(df: pandas.DataFrame, directory: Path, file_format: str) -> Path:
+    path = directory / f"data.{file_format}"
+    if file_format == "csv":
+        df.to_csv(path, index=False)
+    elif file_format == "tsv":
+        df.to_csv(path, sep="\t", index=False)
+    elif file_format == "jsonl":
+        df.to_json(path, orient="records", lines=True)
+    elif file_format == "pkl":
+        df.to_pickle(path)
+    elif file_format == "parquet":
+        df.to_parquet(path)
+    elif file_format == "feather":
+        df.to_feather(path)
+    elif file_format == "npy":
+        numpy.save(path, df.to_records(index=False))
+    elif file_format == "npz":
+        numpy.savez(path, **{column: df[column].to_numpy() for column in df.columns})
+    else:
+        raise ValueError(f"Unknown format: {file_format}")
+    return path
+
+
+def is_format_available(file_format: str) -> bool:
+    if file_format in ("parquet", "feather"):
+        return is_module_available("pyarrow")
+    return True
+
+
+def timeit(func: Callable[[], Any], repeat: int) -> Tuple[float, Any]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def build_model(name: str) -> Model:
+    config = {"model": {"type": name, "target_column": "target", **MODEL_PARAMS[name]}}
+    return ConfigBuilder.build(config).model
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.records: List[Dict[str, Any]] = []
+
+    def add(self, benchmark: str, metric: str, value: float, **labels: Any) -> None:
+        record = {"benchmark": benchmark, **labels, "metric": metric, "value": value}
+        print(json.dumps(record), file=sys.stderr)
+        self.records.append(record)
+
+
+def run_scale(
+    recorder: Recorder,
+    rows: int,
+    columns: int,
+    formats: List[str],
+    models: List[str],
+    repeat: int,
+    workdir: Path,
+) -> None:
+    scale = {"rows": rows, "columns": columns}
+    df = generate_dataframe(rows, columns)
+
+    paths: Dict[str, Path] = {}
+    for file_format in formats:
+        if is_format_available(file_format):
+            paths[file_format] = write_dataset(df, workdir, file_format)
+
+    model = Model(target_column="target")
+    for file_format, path in paths.items():
+        seconds, _ = timeit(lambda: model.load_data(path), repeat)
+        recorder.add(
+            "load_data", "rows_per_sec", rows / seconds, format=file_format, **scale
+        )
+
+    csv_path = paths.get("csv") or write_dataset(df, workdir, "csv")
+    X, y = model.load_data(csv_path)
+    assert y is not None
+
+    for name in models:
+        if not is_module_available(name):
+            print(f"Skip {name}: not installed", file=sys.stderr)
+            continue
+
+        labels = {"model": name, **scale}
+        model_dir = workdir / name
+        trained = build_model(name)
+
+        seconds, _ = timeit(lambda: trained.train(csv_path, workdir=workdir), 1)
+        recorder.add("train", "seconds", seconds, **labels)
+
+        seconds, _ = timeit(lambda: trained.predict(csv_path), repeat)
+        recorder.add("predict", "rows_per_sec", rows / seconds, **labels)
+
+        seconds, _ = timeit(
+            lambda: evaluate(trained.estimator, X, y, ["accuracy", "f1"]), repeat
+        )
+        recorder.add("evaluate", "seconds", seconds, **labels)
+
+        seconds, _ = timeit(lambda: save_model(trained, model_dir), repeat)
+        recorder.add("save_model", "seconds", seconds, **labels)
+        seconds, _ = timeit(lambda: load_model(model_dir), repeat)
+        recorder.add("load_model", "seconds", seconds, **labels)
+
+        cold_start = startup.run(str(model_dir), str(csv_path), repeat)
+        for command, timing in cold_start.items():
+            recorder.add(f"cli_{command}", "seconds", timing["min"], **labels)
+
+
+def get_metadata() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(__file__),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "automlcli_version": __version__,
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.time(),
+    }
+
+
+def _record_key(record: Dict[str, Any]) -> Tuple[Any, ...]:
+    return tuple(sorted((k, v) for k, v in record.items() if k != "value"))
+
+
+def compare(
+    baseline: List[Dict[str, Any]],
+    records: List[Dict[str, Any]],
+    tolerance: float,
+) -> List[str]:
+    """
+    Return descriptions of the records which got worse than the baseline by
+    more than `tolerance` (relative).
+    """
+    baseline_values = {_record_key(record): record["value"] for record in baseline}
+    regressions = []
+    for record in records:
+        old = baseline_values.get(_record_key(record))
+        if not old:
+            continue
+        change = record["value"] / old - 1
+        if record["metric"] == "seconds":
+            change = -change
+        if change < -tolerance:
+            labels = ", ".join(f"{k}={v}" for k, v in _record_key(record))
+            regressions.append(f"{labels}: {old:.4g} -> {record['value']:.4g}")
+    return regressions
+
+
+def parse_scale(scale: str) -> Tuple[int, int]:
+    rows, columns = scale.lower().split("x")
+    return int(rows), int(columns)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scales", nargs="+", default=["10000x20", "100000x20"])
+    parser.add_argument("--formats", nargs="+", default=list(FORMATS))
+    parser.add_argument("--models", nargs="+", default=list(MODELS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=str, default=None)
+    parser.add_argument("--baseline", type=str, default=None)
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args()
+
+    # Measure actual parsing, not the preprocessed data cache.
+    set_cache_enabled(False)
+
+    recorder = Recorder()
+    for scale in args.scales:
+        rows, columns = parse_scale(scale)
+        with tempfile.TemporaryDirectory() as tempdir:
+            run_scale(
+                recorder,
+                rows,
+                columns,
+                args.formats,
+                args.models,
+                args.repeat,
+                Path(tempdir),
+            )
+
+    results = {"metadata": get_metadata(), "records": recorder.records}
+    if args.output is not None:
+        with open(args.output, "w") as fp:
+            json.dump(results, fp, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.baseline is not None:
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)["records"]
+        regressions = compare(baseline, recorder.records, args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
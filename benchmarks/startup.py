@@ -0,0 +1,59 @@
+"""
+Cold-start time of the `automl` command.
+
+    $ python benchmarks/startup.py --model out/model --data test.csv
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+
+def measure(command: List[str], repeat: int) -> Dict[str, float]:
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "automlcli", *command],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        elapsed.append(time.perf_counter() - start)
+    return {"mean": statistics.mean(elapsed), "min": min(elapsed)}
+
+
+def run(
+    model: Optional[str] = None,
+    data: Optional[str] = None,
+    repeat: int = 5,
+) -> Dict[str, Dict[str, float]]:
+    results = {"help": measure(["--help"], repeat)}
+    if model is not None and data is not None:
+        results["predict"] = measure(
+            ["predict", model, data, "--quiet", "--no-cache"], repeat
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", type=str, default=None)
+    parser.add_argument("--data", type=str, default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run(args.model, args.data, args.repeat)
+    print(json.dumps({"startup_seconds": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
 import tempfile
 from pathlib import Path
 
+import numpy
 import pandas
+import pytest
 
 from automlcli.commands import create_parser
 from automlcli.commands.predict import PredictCommand  # noqa: F401
@@ -36,3 +38,267 @@ def test_train_command() -> None:
         predictions = pandas.read_csv(prediction_path)
 
         assert len(test_df) == len(predictions)
+
+
+def test_predict_command_with_chunk_size() -> None:
+    model_path = FIXTURE_PATH / "data" / "model.pkl"
+    test_path = FIXTURE_PATH / "data" / "test.csv"
+
+    with tempfile.TemporaryDirectory() as _tempdir:
+        tempdir = Path(_tempdir)
+        prediction_path = tempdir / "predictions.csv"
+        chunked_prediction_path = tempdir / "chunked_predictions.csv"
+
+        parser = create_parser()
+        for output_path, extra_args in (
+            (prediction_path, []),
+            (chunked_prediction_path, ["--chunk-size", "10"]),
+        ):
+            args = parser.parse_args(
+                [
+                    "predict",
+                    str(model_path),
+                    str(test_path),
+                    "--output-file",
+                    str(output_path),
+                    "--quiet",
+                ]
+                + extra_args
+            )
+            args.func(args)
+
+        assert prediction_path.read_text() == chunked_prediction_path.read_text()
+
+
+def test_predict_command_with_workers() -> None:
+    model_path = FIXTURE_PATH / "data" / "model.pkl"
+    test_path = FIXTURE_PATH / "data" / "test.csv"
+
+    with tempfile.TemporaryDirectory() as _tempdir:
+        tempdir = Path(_tempdir)
+        prediction_path = tempdir / "predictions.csv"
+        parallel_prediction_path = tempdir / "parallel_predictions.csv"
+
+        parser = create_parser()
+        for output_path, extra_args in (
+            (prediction_path, []),
+            (parallel_prediction_path, ["--workers", "2", "--chunk-size", "10"]),
+        ):
+            args = parser.parse_args(
+                [
+                    "predict",
+                    str(model_path),
+                    str(test_path),
+                    "--output-file",
+                    str(output_path),
+                    "--quiet",
+                ]
+                + extra_args
+            )
+            args.func(args)
+
+        assert prediction_path.read_text() == parallel_prediction_path.read_text()
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+def test_predict_command_with_compressed_output(compression: str) -> None:
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+
+    model_path = FIXTURE_PATH / "data" / "model.pkl"
+    test_path = FIXTURE_PATH / "data" / "test.csv"
+
+    with tempfile.TemporaryDirectory() as _tempdir:
+        tempdir = Path(_tempdir)
+        prediction_path = tempdir / "predictions.csv"
+        compressed_prediction_path = tempdir / "predictions.csv.out"
+
+        parser = create_parser()
+        for output_path in (prediction_path, compressed_prediction_path):
+            args = parser.parse_args(
+                [
+                    "predict",
+                    str(model_path),
+                    str(test_path),
+                    "--output-file",
+                    str(output_path),
+                    "--chunk-size",
+                    "10",
+                    "--quiet",
+                ]
+                + (
+                    ["--output-compression", compression]
+                    if output_path.suffix == ".out"
+                    else []
+                )
+            )
+            args.func(args)
+
+        pandas.testing.assert_frame_equal(
+            pandas.read_csv(
+                compressed_prediction_path, compression={"method": compression}
+            ),
+            pandas.read_csv(prediction_path),
+        )
+
+
+def test_predict_command_with_proba_and_top_k() -> None:
+    model_path = FIXTURE_PATH / "data" / "model.pkl"
+    test_path = FIXTURE_PATH / "data" / "test.csv"
+
+    with tempfile.TemporaryDirectory() as _tempdir:
+        tempdir = Path(_tempdir)
+        prediction_path = tempdir / "predictions.csv"
+
+        parser = create_parser()
+        args = parser.parse_args(
+            [
+                "predict",
+                str(model_path),
+                str(test_path),
+                "--output-file",
+                str(prediction_path),
+                "--proba",
+                "--top-k",
+                "2",
+                "--quiet",
+            ]
+        )
+        args.func(args)
+
+        predictions = pandas.read_csv(prediction_path)
+        proba_columns = [c for c in predictions.columns if "_proba_" in c]
+
+        assert len(proba_columns) == 3
+        assert list(predictions.columns[-4:]) == [
+            "target_top1",
+            "target_top1_proba",
+            "target_top2",
+            "target_top2_proba",
+        ]
+        assert (predictions["target"] == predictions["target_top1"]).all()
+        assert (
+            predictions["target_top1_proba"] >= predictions["target_top2_proba"]
+        ).all()
+        numpy.testing.assert_allclose(
+            predictions[proba_columns].sum(axis=1), 1.0, rtol=1e-5
+        )
+
+
+@pytest.mark.parametrize("ext", ["parquet", "feather"])
+def test_predict_command_with_columnar_output(ext: str) -> None:
+    pytest.importorskip("pyarrow")
+
+    model_path = FIXTURE_PATH / "data" / "model.pkl"
+    test_path = FIXTURE_PATH / "data" / "test.csv"
+
+    with tempfile.TemporaryDirectory() as _tempdir:
+        tempdir = Path(_tempdir)
+        prediction_path = tempdir / "predictions.csv"
+        columnar_prediction_path = tempdir / f"predictions.{ext}"
+
+        parser = create_parser()
+        for output_path in (prediction_path, columnar_prediction_path):
+            args = parser.parse_args(
+                [
+                    "predict",
+                    str(model_path),
+                    str(test_path),
+                    "--output-file",
+                    str(output_path),
+                    "--proba",
+                    "--chunk-size",
+                    "10",
+                    "--quiet",
+                ]
+            )
+            args.func(args)
+
+        if ext == "parquet":
+            columnar_predictions = pandas.read_parquet(columnar_prediction_path)
+        else:
+            columnar_predictions = pandas.read_feather(columnar_prediction_path)
+
+        # Probabilities keep their dtype in columnar files, unlike in CSV.
+        pandas.testing.assert_frame_equal(
+            columnar_predictions, pandas.read_csv(prediction_path), check_dtype=False
+        )
+
+
+def test_predict_command_with_output_dir() -> None:
+    model_path = FIXTURE_PATH / "data" / "model.pkl"
+    test_path = FIXTURE_PATH / "data" / "test.csv"
+    test_df = pandas.read_csv(test_path)
+
+    with tempfile.TemporaryDirectory() as _tempdir:
+        tempdir = Path(_tempdir)
+        for i, start in enumerate(range(0, len(test_df), 20)):
+            (tempdir / "inputs" / f"dt={i}").mkdir(parents=True)
+            shard_path = tempdir / "inputs" / f"dt={i}" / "part-0.csv.gz"
+            test_df.iloc[start : start + 20].to_csv(shard_path, index=False)
+
+        prediction_path = tempdir / "predictions.csv"
+        output_dir = tempdir / "outputs"
+
+        parser = create_parser()
+        for extra_args in (
+            ["--output-file", str(prediction_path)],
+            ["--output-dir", str(output_dir), "--workers", "2"],
+        ):
+            args = parser.parse_args(
+                ["predict", str(model_path), str(tempdir / "inputs"), "--quiet"]
+                + extra_args
+            )
+            args.func(args)
+
+        output_files = sorted(output_dir.glob("*/*"))
+        assert [path.relative_to(output_dir).as_posix() for path in output_files] == [
+            f"dt={i}/part-0.csv" for i in range(len(output_files))
+        ]
+        pandas.testing.assert_frame_equal(
+            pandas.concat(
+                [pandas.read_csv(path) for path in output_files], ignore_index=True
+            ),
+            pandas.read_csv(prediction_path),
+        )
+
+
+def test_predict_command_with_multiple_models() -> None:
+    model_path = FIXTURE_PATH / "data" / "model.pkl"
+    test_path = FIXTURE_PATH / "data" / "test.csv"
+
+    with tempfile.TemporaryDirectory() as _tempdir:
+        tempdir = Path(_tempdir)
+        prediction_path = tempdir / "predictions.csv"
+        ensemble_prediction_path = tempdir / "ensemble_predictions.csv"
+
+        parser = create_parser()
+        for output_path, extra_args in (
+            (prediction_path, []),
+            (
+                ensemble_prediction_path,
+                ["--model", str(model_path), "--model-name", "a", "--model-name", "b"]
+                + ["--ensemble", "vote"],
+            ),
+        ):
+            args = parser.parse_args(
+                [
+                    "predict",
+                    str(model_path),
+                    str(test_path),
+                    "--output-file",
+                    str(output_path),
+                    "--quiet",
+                ]
+                + extra_args
+            )
+            args.func(args)
+
+        predictions = pandas.read_csv(prediction_path)
+        ensemble_predictions = pandas.read_csv(ensemble_prediction_path)
+
+        assert list(ensemble_predictions.columns) == ["target_a", "target_b", "target"]
+        for column in ensemble_predictions.columns:
+            numpy.testing.assert_array_equal(
+                ensemble_predictions[column], predictions["target"]
+            )
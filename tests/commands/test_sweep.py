@@ -0,0 +1,83 @@
+import json
+import tempfile
+from pathlib import Path
+
+from automlcli.commands import create_parser
+from automlcli.commands.sweep import SweepCommand  # noqa: F401
+from automlcli.commands.sweep import _with_cpu_quota, expand_sweep
+
+FIXTURE_PATH = Path("tests/fixtures")
+
+
+def test_expand_sweep() -> None:
+    override_sets = expand_sweep(
+        {
+            "grid": {"model.time_budget": [1, 2], "model.metric": ["accuracy"]},
+            "overrides": [["model.type=tpot"], {"model.n_jobs": 4}],
+        }
+    )
+    assert override_sets == [
+        ["model.time_budget=1", 'model.metric="accuracy"'],
+        ["model.time_budget=2", 'model.metric="accuracy"'],
+        ["model.type=tpot"],
+        ["model.n_jobs=4"],
+    ]
+
+
+def test_with_cpu_quota() -> None:
+    with tempfile.TemporaryDirectory() as tempdir:
+        config_path = Path(tempdir) / "config.yml"
+        config_path.write_text("automlcli:\n  model:\n    type: flaml\n")
+
+        # n_jobs is injected under the nested config.
+        overrides, cpus = _with_cpu_quota(str(config_path), [], 2)
+        assert overrides == ["automlcli.model.n_jobs=2"]
+        assert cpus == 2
+
+        # n_jobs of the config is kept and sizes the job.
+        overrides, cpus = _with_cpu_quota(
+            str(config_path), ["automlcli.model.n_jobs=3"], 2
+        )
+        assert overrides == ["automlcli.model.n_jobs=3"]
+        assert cpus == 3
+
+        # Models without n_jobs are left as they are.
+        config_path.write_text(
+            "model:\n  type: automlcli.models.ensemble.ModelEnsemble\n"
+        )
+        overrides, cpus = _with_cpu_quota(str(config_path), [], 2)
+        assert overrides == []
+        assert cpus == 2
+
+
+def test_sweep_command() -> None:
+    config_path = FIXTURE_PATH / "configs" / "config.yml"
+    sweep_path = FIXTURE_PATH / "configs" / "sweep.yml"
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        output_dir = Path(tempdir) / "output"
+
+        parser = create_parser()
+        args = parser.parse_args(
+            [
+                "sweep",
+                str(config_path),
+                str(sweep_path),
+                "--overrides",
+                "model.target_column=target",
+                "--serialization-dir",
+                str(output_dir),
+                "--max-workers",
+                "2",
+            ]
+        )
+
+        args.func(args)
+
+        with open(output_dir / "leaderboard.json") as fp:
+            leaderboard = json.load(fp)
+
+        assert [result["status"] for result in leaderboard] == ["completed"] * 2
+        assert (output_dir / "leaderboard.csv").is_file()
+        assert (output_dir / "job-000" / "model" / "metadata.json").is_file()
+        assert (output_dir / "job-001" / "model" / "metadata.json").is_file()
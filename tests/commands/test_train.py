@@ -29,7 +29,7 @@ def test_train_command():
 
         assert output_dir.is_dir()
         assert (output_dir / "metrics.json").is_file()
-        assert (output_dir / "model.pkl").is_file()
+        assert (output_dir / "model" / "metadata.json").is_file()
 
 
 def test_train_command_with_command_args():
@@ -59,4 +59,4 @@ def test_train_command_with_command_args():
 
         assert output_dir.is_dir()
         assert (output_dir / "metrics.json").is_file()
-        assert (output_dir / "model.pkl").is_file()
+        assert (output_dir / "model" / "metadata.json").is_file()
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from automlcli import cache
+
+
+@pytest.fixture(autouse=True)
+def array_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[cache.ArrayCache]:
+    # Keep the array cache of tests out of the home directory.
+    array_cache = cache.ArrayCache(tmp_path / "cache")
+    monkeypatch.setattr(cache, "_array_cache", array_cache)
+    monkeypatch.setattr(cache, "_cache_enabled", True)
+    yield array_cache
@@ -0,0 +1,78 @@
+from typing import Any, Sequence
+
+import numpy
+import pandas
+import pytest
+
+from automlcli.exceptions import ConfigurationError
+from automlcli.models.ensemble import ModelEnsemble
+from automlcli.models.model import Model
+
+
+class Classifier:
+    def __init__(self, classes: Sequence[str], proba: Sequence[float]) -> None:
+        self.classes_ = numpy.asarray(classes)
+        self._proba = numpy.asarray(proba)
+
+    def predict(self, X: numpy.ndarray) -> numpy.ndarray:
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]  # type: ignore
+
+    def predict_proba(self, X: numpy.ndarray) -> numpy.ndarray:
+        return numpy.tile(self._proba, (len(X), 1))
+
+
+class DummyModel(Model):
+    def __init__(self, estimator: Classifier, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._estimator = estimator
+
+    @property
+    def estimator(self) -> Classifier:
+        return self._estimator
+
+
+def test_model_ensemble() -> None:
+    df = pandas.DataFrame({"id": [10, 11], "x": [1.0, 2.0], "z": [3.0, 4.0]})
+    models = {
+        "a": DummyModel(
+            Classifier(["cat", "dog"], [0.6, 0.4]),
+            target_column="y",
+            index_column="id",
+            ignored_columns=["z"],
+        ),
+        "b": DummyModel(
+            Classifier(["dog", "fox"], [0.55, 0.45]),
+            target_column="y",
+            index_column="id",
+        ),
+        "c": DummyModel(
+            Classifier(["cat", "fox"], [0.1, 0.9]),
+            target_column="y",
+            index_column="id",
+        ),
+    }
+
+    # Columns ignored by some of the models are still read.
+    assert ModelEnsemble(models)._get_excluded_columns() == set()
+
+    predictions = ModelEnsemble(models, "vote").predict_dataframe(df)
+    assert list(predictions.index) == [10, 11]
+    assert list(predictions.columns) == ["y_a", "y_b", "y_c", "y"]
+    # All models disagree, so the label of the first model wins.
+    assert list(predictions["y"]) == ["cat", "cat"]
+
+    predictions = ModelEnsemble(models, "mean").predict_dataframe(df, proba=True)
+    assert list(predictions["y"]) == ["fox", "fox"]
+    numpy.testing.assert_allclose(predictions["y_proba_cat"], [0.7 / 3] * 2)
+    numpy.testing.assert_allclose(predictions["y_proba_fox"], [1.35 / 3] * 2)
+    assert "y_a_proba_cat" in predictions.columns
+
+    predictions = ModelEnsemble(models, "mean").predict_dataframe(df)
+    assert list(predictions.columns) == ["y_a", "y_b", "y_c", "y"]
+
+    with pytest.raises(ConfigurationError):
+        ModelEnsemble(models, "median")
+
+    other = DummyModel(models["a"].estimator, target_column="z", index_column="id")
+    with pytest.raises(ConfigurationError):
+        ModelEnsemble({**models, "d": other})
@@ -1,8 +1,12 @@
+import json
 import tempfile
 from pathlib import Path
 
 import mlflow
+import pandas
+import pytest
 
+from automlcli.exceptions import ConfigurationError
 from automlcli.models.flaml import FLAML
 
 FIXTURE_PATH = Path("tests/fixtures")
@@ -22,3 +26,68 @@ def test_flaml_train():
             )
 
         assert (tempdir / "flaml.log").is_file()
+
+
+def test_flaml_train_resume():
+    data_path = FIXTURE_PATH / "data" / "train.csv"
+
+    model = FLAML(target_column="target", time_budget=1)
+    with tempfile.TemporaryDirectory() as tempdir:
+        tempdir = Path(tempdir)
+        model.train(data_path, data_path, tempdir)
+        with open(tempdir / "flaml.log") as fp:
+            num_lines = len(fp.readlines())
+
+        metrics = model.train(data_path, data_path, tempdir, resume=True)
+
+        assert "best_loss" in metrics
+        assert (tempdir / "search_state.json").is_file()
+        # The resumed search appends to the log of the interrupted one.
+        with open(tempdir / "flaml.log") as fp:
+            assert len(fp.readlines()) >= num_lines
+        assert model.predict(data_path).shape[0] > 0
+
+
+def test_flaml_train_with_sampling():
+    data_path = FIXTURE_PATH / "data" / "train.csv"
+
+    model = FLAML(
+        target_column="target",
+        sampling={"size": 50, "stratify": True},
+        time_budget=1,
+    )
+    with tempfile.TemporaryDirectory() as tempdir:
+        tempdir = Path(tempdir)
+        metrics = model.train(data_path, data_path, tempdir)
+
+        assert (tempdir / "sample.pkl").is_file()
+        assert len(pandas.read_pickle(tempdir / "sample.pkl")) < 60
+
+    assert {"sample_time", "search_time", "refit_time"} <= set(metrics)
+    assert len(model.predict(data_path)) == len(pandas.read_csv(data_path))
+
+
+def test_flaml_rejects_stratified_sampling_for_regression():
+    with pytest.raises(ConfigurationError):
+        FLAML(
+            target_column="target",
+            task="regression",
+            sampling={"size": 50, "stratify": True},
+        )
+
+
+def test_flaml_resume_kwargs_without_starting_points(monkeypatch):
+    monkeypatch.setattr(
+        "automlcli.models.flaml._get_fit_parameters",
+        lambda: {"X_train", "y_train", "time_budget"},
+    )
+    model = FLAML(target_column="target", time_budget=10)
+    with tempfile.TemporaryDirectory() as tempdir:
+        log_file = Path(tempdir) / "flaml.log"
+        record = {"learner": "lgbm", "config": {}, "validation_loss": 0.1}
+        log_file.write_text(json.dumps(record) + "\n")
+
+        # The search is restarted with the remaining budget.
+        assert model._get_resume_kwargs(log_file, 4.0) == {"time_budget": 6.0}
+        with pytest.raises(RuntimeError):
+            model._get_resume_kwargs(log_file, 4.0, refit_only=True)
@@ -0,0 +1,132 @@
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy
+import pandas
+import pytest
+
+from automlcli.exceptions import ConfigurationError
+from automlcli.models.model import Model
+from automlcli.shards import DataPath
+
+FIXTURE_PATH = Path("tests/fixtures")
+
+
+@pytest.mark.parametrize("feature_dtype", ["float32", "float64"])
+def test_dataframe_to_array_with_feature_dtype(feature_dtype: str) -> None:
+    df = pandas.read_csv(FIXTURE_PATH / "data" / "train.csv")
+    model = Model(
+        target_column="target",
+        ignored_columns=["alcohol"],
+        feature_dtype=feature_dtype,
+    )
+
+    X, y = model._dataframe_to_array(df)
+
+    assert X.dtype == numpy.dtype(feature_dtype)
+    assert X.shape == (len(df), len(df.columns) - 2)
+    numpy.testing.assert_allclose(
+        X, df.drop(columns=["target", "alcohol"]).to_numpy(dtype=float), rtol=1e-6
+    )
+    numpy.testing.assert_array_equal(y, df["target"].to_numpy())
+    assert "target" in df.columns
+
+
+def test_dataframe_to_array_keeps_integer_columns_with_auto_dtype() -> None:
+    df = pandas.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6], "target": [0, 1, 0]})
+    model = Model(target_column="target", feature_dtype="auto")
+
+    X, _ = model._dataframe_to_array(df)
+
+    assert X.dtype == numpy.int64
+
+
+def test_model_with_invalid_feature_dtype() -> None:
+    with pytest.raises(ConfigurationError):
+        Model(target_column="target", feature_dtype="float16")
+
+
+class ThresholdClassifier:
+    classes_ = numpy.array(["neg", "pos"])
+
+    def predict_proba(self, X: numpy.ndarray) -> numpy.ndarray:
+        return numpy.column_stack([1 - X[:, 0], X[:, 0]])
+
+    def predict(self, X: numpy.ndarray) -> numpy.ndarray:
+        return self.classes_[(X[:, 0] >= 0.3).astype(int)]  # type: ignore
+
+
+class EstimatorModel(Model):
+    def __init__(self, estimator: object) -> None:
+        super().__init__(target_column="target")
+        self._estimator = estimator
+
+    @property
+    def estimator(self) -> object:
+        return self._estimator
+
+
+def test_predict_array_takes_labels_from_predict() -> None:
+    model = EstimatorModel(ThresholdClassifier())
+    X = numpy.array([[0.1], [0.4], [0.8]])
+
+    predictions = model._predict_array(X, proba=True, top_k=1)
+
+    assert predictions["target"].tolist() == ["neg", "pos", "pos"]
+    assert predictions["target_top1"].tolist() == ["neg", "neg", "pos"]
+
+
+def test_predict_array_requires_classes() -> None:
+    class Classifier:
+        def predict_proba(self, X: numpy.ndarray) -> numpy.ndarray:
+            return numpy.column_stack([1 - X[:, 0], X[:, 0]])
+
+        def predict(self, X: numpy.ndarray) -> numpy.ndarray:
+            return X[:, 0] >= 0.5
+
+    model = EstimatorModel(Classifier())
+
+    with pytest.raises(ConfigurationError):
+        model._predict_array(numpy.array([[0.1]]), proba=True)
+
+
+class SamplingModel(Model):
+    def search(
+        self,
+        train_file: DataPath,
+        validation_file: Optional[DataPath] = None,
+        workdir: Optional[Union[str, Path]] = None,
+        resume: bool = False,
+    ) -> Dict[str, float]:
+        self.load_data(train_file)
+        return {}
+
+    def retrain(self, train_file: DataPath) -> None:
+        self.load_data(train_file)
+
+
+def test_train_with_sampling_refits_encoder() -> None:
+    df = pandas.DataFrame(
+        {
+            "city": ["tokyo"] * 99 + ["nagoya"],
+            "age": numpy.arange(100),
+            "target": [0, 1] * 50,
+        }
+    )
+    model = SamplingModel(
+        target_column="target",
+        sampling={"size": 10, "seed": 0},
+        encoding={"default": "ordinal"},
+    )
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        data_path = Path(tempdir) / "train.csv"
+        df.to_csv(data_path, index=False)
+        model.train(data_path, workdir=tempdir)
+        sample = pandas.read_pickle(Path(tempdir) / model.SAMPLE_FILENAME)
+
+    # The category missing from the sample is known to the refitted encoder.
+    assert "nagoya" not in sample["city"].tolist()
+    assert model._encoder is not None
+    assert model._encoder.transform("city", pandas.Series(["nagoya"]))[0] != -1
@@ -1,7 +1,11 @@
 import tempfile
 from pathlib import Path
 
+import pytest
+
+from automlcli.exceptions import ConfigurationError
 from automlcli.models.tpot import Tpot
+from automlcli.resources import ResourceLimits
 
 FIXTURE_PATH = Path("tests/fixtures")
 
@@ -26,3 +30,21 @@ def test_tpot_train():
 
         assert (tempdir / "tpot.log").is_file()
         assert (tempdir / "pipeline.py").is_file()
+
+
+def test_tpot_rejects_enforced_resource_limits():
+    model = Tpot(target_column="target", task="classification")
+    model.apply_resource_limits(ResourceLimits(cpus=2))
+    assert model._kwargs["n_jobs"] == 2
+
+    with pytest.raises(ConfigurationError):
+        model.apply_resource_limits(ResourceLimits(wall_time=60))
+
+
+def test_tpot_rejects_stratified_sampling_for_regression():
+    with pytest.raises(ConfigurationError):
+        Tpot(
+            target_column="target",
+            task="regression",
+            sampling={"size": 50, "stratify": True},
+        )
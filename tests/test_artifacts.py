@@ -0,0 +1,46 @@
+import tempfile
+from pathlib import Path
+
+import numpy
+from sklearn.base import BaseEstimator
+from sklearn.linear_model import LogisticRegression
+
+from automlcli.artifacts import load_model, save_model
+from automlcli.models import Model
+
+FIXTURE_PATH = Path("tests/fixtures")
+
+
+class SklearnModel(Model):
+    ARTIFACT_EXCLUDED_ATTRIBUTES = ("_log",)
+
+    def __init__(self, target_column: str) -> None:
+        super().__init__(target_column)
+        self._estimator = LogisticRegression(max_iter=1000)
+        self._log = "training log"
+
+    @property
+    def estimator(self) -> BaseEstimator:
+        return self._estimator
+
+
+def test_save_and_load_model() -> None:
+    data_path = FIXTURE_PATH / "data" / "train.csv"
+
+    model = SklearnModel(target_column="target")
+    X, y = model.load_data(data_path)
+    model.estimator.fit(X, y)
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        for artifact_path in (Path(tempdir) / "model", Path(tempdir) / "model.pkl"):
+            save_model(model, artifact_path)
+
+            loaded = load_model(artifact_path)
+            assert isinstance(loaded, SklearnModel)
+            numpy.testing.assert_array_equal(
+                loaded.estimator.predict(X), model.estimator.predict(X)
+            )
+
+        loaded = load_model(Path(tempdir) / "model")
+        assert loaded._log is None
+        assert isinstance(loaded.estimator.coef_, numpy.memmap)
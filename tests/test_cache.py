@@ -0,0 +1,57 @@
+import tempfile
+from pathlib import Path
+
+import numpy
+
+from automlcli.cache import ArrayCache
+
+FIXTURE_PATH = Path("tests/fixtures")
+
+
+def test_array_cache() -> None:
+    data_path = FIXTURE_PATH / "data" / "train.csv"
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        cache = ArrayCache(tempdir, max_size=10 ** 6)
+
+        key = cache.make_key(data_path, {"target_column": "target"})
+        assert key == cache.make_key(data_path, {"target_column": "target"})
+        assert key != cache.make_key(data_path, {"target_column": "label"})
+        assert cache.get(key) is None
+
+        X = numpy.random.rand(10, 3)
+        y = numpy.arange(10)
+        cache.put(key, {"X": X, "y": y})
+
+        arrays = cache.get(key)
+        assert arrays is not None
+        assert isinstance(arrays["X"], numpy.memmap)
+        numpy.testing.assert_array_equal(arrays["X"], X)
+        numpy.testing.assert_array_equal(arrays["y"], y)
+
+
+def test_array_cache_evicts_least_recently_used_entries() -> None:
+    with tempfile.TemporaryDirectory() as tempdir:
+        X = numpy.zeros((100, 10))
+        cache = ArrayCache(tempdir, max_size=int(2.5 * X.nbytes))
+
+        for key in ("a", "b", "c"):
+            cache.put(key, {"X": X})
+            cache.get("a")
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+
+def test_array_cache_with_object_arrays() -> None:
+    with tempfile.TemporaryDirectory() as tempdir:
+        cache = ArrayCache(tempdir, max_size=10 ** 6)
+
+        y = numpy.array(["cat", "dog", "cat"], dtype=object)
+        cache.put("key", {"X": numpy.zeros((3, 2)), "y": y})
+
+        arrays = cache.get("key")
+        assert arrays is not None
+        assert isinstance(arrays["X"], numpy.memmap)
+        numpy.testing.assert_array_equal(arrays["y"], y)
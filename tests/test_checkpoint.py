@@ -0,0 +1,28 @@
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from automlcli.checkpoint import SearchState, remaining_budget
+
+
+def test_search_state_accumulates_elapsed_time() -> None:
+    with tempfile.TemporaryDirectory() as tempdir:
+        log_file = Path(tempdir) / "search.log"
+        log_file.touch()
+        state = SearchState(tempdir, [log_file])
+
+        assert state.start() == 0.0
+
+        # Pretend the search made progress for 30 seconds before being killed.
+        progress_time = time.time() + 30
+        os.utime(log_file, (progress_time, progress_time))
+        assert 29 < state.elapsed() < 31
+
+        assert 29 < state.start(resume=True) < 31
+        assert state.start() == 0.0
+
+
+def test_remaining_budget() -> None:
+    assert remaining_budget(60, 15) == 45
+    assert remaining_budget(60, 90) == 0
@@ -0,0 +1,68 @@
+import io
+import tempfile
+from pathlib import Path
+
+import pandas
+import pytest
+
+from automlcli.compression import get_compression, open_compressed, open_decompressed
+from automlcli.models import Model
+
+FIXTURE_PATH = Path("tests/fixtures")
+
+
+def test_get_compression() -> None:
+    assert get_compression("train.csv.gz") == "gzip"
+    assert get_compression("s3://bucket/train.csv.ZST") == "zstd"
+    assert get_compression("train.csv") is None
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+def test_compression_round_trip(compression: str) -> None:
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+
+    data = b"automlcli\n" * 100_000
+    with tempfile.TemporaryDirectory() as tempdir:
+        file_path = Path(tempdir) / "data.bin"
+        with open(file_path, "wb") as fp:
+            with open_compressed(fp, compression) as stream:
+                stream.write(data)
+
+        assert file_path.stat().st_size < len(data)
+
+        with open_decompressed(file_path, compression) as stream:
+            assert stream.read() == data
+
+
+@pytest.mark.parametrize("ext", ["csv.gz", "csv.zst", "jsonl.gz", "pkl.gz"])
+def test_load_compressed_dataframe(ext: str) -> None:
+    if ext.endswith("zst"):
+        pytest.importorskip("zstandard")
+
+    df = pandas.read_csv(FIXTURE_PATH / "data" / "train.csv")
+    model = Model(target_column="target")
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        file_path = Path(tempdir) / f"train.{ext}"
+        uncompressed_path = file_path.with_suffix("")
+        buffer = io.BytesIO()
+        if ext.startswith("csv"):
+            df.to_csv(buffer, index=False)
+        elif ext.startswith("jsonl"):
+            df.to_json(buffer, orient="records", lines=True)
+        else:
+            df.to_pickle(buffer)
+
+        with open(file_path, "wb") as fp:
+            with open_compressed(fp, get_compression(file_path)) as stream:
+                stream.write(buffer.getvalue())
+        uncompressed_path.write_bytes(buffer.getvalue())
+
+        pandas.testing.assert_frame_equal(
+            model.load_dataframe(file_path), model.load_dataframe(uncompressed_path)
+        )
+
+        chunks = list(model.iter_dataframes(file_path, chunk_size=50))
+        assert len(chunks) == -(-len(df) // 50)
+        assert sum(len(chunk) for chunk in chunks) == len(df)
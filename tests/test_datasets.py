@@ -0,0 +1,49 @@
+import gc
+
+import numpy
+import pytest
+
+from automlcli.datasets import DatasetRegistry
+
+
+def test_dataset_registry_shares_readonly_views() -> None:
+    registry = DatasetRegistry()
+    calls = []
+
+    def load() -> dict:
+        calls.append(1)
+        return {"X": numpy.random.rand(10, 3), "y": numpy.arange(10)}
+
+    first = registry.get_or_load("key", load)
+    second = registry.get_or_load("key", load)
+
+    assert len(calls) == 1
+    assert numpy.shares_memory(first["X"], second["X"])
+    assert numpy.shares_memory(first["y"], second["y"])
+    with pytest.raises(ValueError):
+        first["X"][0, 0] = 0.0
+
+
+def test_dataset_registry_releases_unreferenced_arrays() -> None:
+    registry = DatasetRegistry()
+
+    arrays = registry.get_or_load("key", lambda: {"X": numpy.zeros((10, 3))})
+    assert len(registry) == 1
+
+    del arrays
+    gc.collect()
+
+    assert len(registry) == 0
+    assert registry.get("key") is None
+
+
+def test_dataset_registry_does_not_grow_with_keys() -> None:
+    registry = DatasetRegistry()
+
+    for i in range(1000):
+        registry.get_or_load(str(i), lambda: {"X": numpy.zeros(1)})
+    gc.collect()
+
+    assert len(registry) == 0
+    assert len(registry._names) == 0
+    assert len(registry._load_locks) == DatasetRegistry.NUM_LOAD_LOCKS
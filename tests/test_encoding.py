@@ -0,0 +1,87 @@
+import tempfile
+from pathlib import Path
+
+import numpy
+import pandas
+import pytest
+
+from automlcli.encoding import ColumnEncoder
+from automlcli.exceptions import ConfigurationError
+from automlcli.models import Model
+
+
+def test_column_encoder() -> None:
+    df = pandas.DataFrame(
+        {
+            "city": ["tokyo", "osaka", "tokyo", "kyoto", None],
+            "user": ["a", "b", "c", "d", "e"],
+            "size": [1.0, 2.0, 3.0, 4.0, 5.0],
+        }
+    )
+    encoder = ColumnEncoder(columns={"user": "hash", "size": "frequency"})
+    encoder.fit([df], list(df.columns))
+
+    assert encoder.categorical_columns == {"city", "user", "size"}
+    numpy.testing.assert_array_equal(
+        encoder.transform("city", df["city"]), [2, 1, 2, 0, -1]
+    )
+    numpy.testing.assert_array_equal(
+        encoder.transform("size", pandas.Series([1.0, 6.0])), [0.2, 0.0]
+    )
+
+    # Category dtype inputs give the same codes and hashes as object inputs.
+    for column in ("city", "user"):
+        numpy.testing.assert_array_equal(
+            encoder.transform(column, df[column].astype("category")),
+            encoder.transform(column, df[column]),
+        )
+
+    unseen = pandas.Series(["nagoya", "tokyo"])
+    numpy.testing.assert_array_equal(encoder.transform("city", unseen), [-1, 2])
+    assert (encoder.transform("user", df["user"]) < 2 ** 20).all()
+
+
+def test_column_encoder_with_max_categories() -> None:
+    values = pandas.Series(["a"] * 3 + ["b"] * 2 + ["c"])
+    encoder = ColumnEncoder(default="frequency", max_categories=2)
+    encoder.fit([values.to_frame("x")], ["x"])
+
+    numpy.testing.assert_allclose(
+        encoder.transform("x", values.drop_duplicates()), [0.5, 2 / 6, 0.0]
+    )
+
+    with pytest.raises(ConfigurationError):
+        ColumnEncoder(default="onehot")
+
+
+def test_model_with_string_columns() -> None:
+    rng = numpy.random.default_rng(0)
+    df = pandas.DataFrame(
+        {
+            "city": rng.choice(["tokyo", "osaka", "kyoto"], 100),
+            "user": [f"user-{i}" for i in rng.integers(0, 1000, 100)],
+            "age": rng.integers(20, 60, 100),
+            "target": rng.integers(0, 2, 100),
+        }
+    )
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        data_path = Path(tempdir) / "train.csv"
+        df.to_csv(data_path, index=False)
+
+        encoding = {"columns": {"user": "hash"}}
+        model = Model(target_column="target", encoding=encoding)
+        X, y = model.load_data(data_path)
+
+        assert X.shape == (100, 3)
+        assert X[:, 0].max() == 2
+        assert model.load_dataframe(data_path)["user"].dtype == "category"
+
+        # A new model gets the encoder state cached together with the arrays.
+        other = Model(target_column="target", encoding=encoding)
+        other_X, _ = other.load_data(data_path)
+        numpy.testing.assert_array_equal(other_X, X)
+        assert other._encoder.fitted
+
+        predicted_X, _ = other._dataframe_to_array(df.iloc[:10])
+        numpy.testing.assert_array_equal(predicted_X, X[:10])
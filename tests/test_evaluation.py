@@ -0,0 +1,51 @@
+from pathlib import Path
+from typing import Any
+
+import numpy
+from sklearn.tree import DecisionTreeClassifier
+
+from automlcli.evaluation import cross_evaluate, evaluate
+from automlcli.models import Model
+
+FIXTURE_PATH = Path("tests/fixtures")
+
+
+class CountingClassifier(DecisionTreeClassifier):  # type: ignore
+    num_predict_calls = 0
+
+    def predict(self, X: Any) -> numpy.ndarray:
+        CountingClassifier.num_predict_calls += 1
+        return super().predict(X)  # type: ignore
+
+
+def test_evaluate_predicts_once() -> None:
+    model = Model(target_column="target")
+    X, y = model.load_data(FIXTURE_PATH / "data" / "train.csv")
+    assert y is not None
+
+    estimator = CountingClassifier(random_state=0).fit(X, y)
+    CountingClassifier.num_predict_calls = 0
+
+    metrics = evaluate(estimator, X, y, ["accuracy", "f1_macro", "balanced_accuracy"])
+
+    assert CountingClassifier.num_predict_calls == 1
+    assert metrics["accuracy"] == 1.0
+    assert set(metrics) == {"accuracy", "f1_macro", "balanced_accuracy"}
+
+
+def test_cross_evaluate() -> None:
+    model = Model(target_column="target")
+    X, y = model.load_data(FIXTURE_PATH / "data" / "train.csv")
+    assert y is not None
+
+    metrics = cross_evaluate(
+        DecisionTreeClassifier(random_state=0),
+        X,
+        y,
+        ["accuracy", "f1_macro"],
+        cv=3,
+        n_jobs=2,
+    )
+
+    assert set(metrics) == {"fit_time", "score_time", "test_accuracy", "test_f1_macro"}
+    assert all(len(scores) == 3 for scores in metrics.values())
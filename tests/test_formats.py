@@ -0,0 +1,43 @@
+import tempfile
+from pathlib import Path
+
+import numpy
+import pandas
+import pytest
+
+from automlcli.models import Model
+
+FIXTURE_PATH = Path("tests/fixtures")
+
+
+@pytest.mark.parametrize("ext", ["parquet", "feather", "npy", "npz"])
+def test_load_dataframe_with_columnar_formats(ext: str) -> None:
+    if ext in ("parquet", "feather"):
+        pytest.importorskip("pyarrow")
+
+    df = pandas.read_csv(FIXTURE_PATH / "data" / "train.csv")
+    model = Model(target_column="target", ignored_columns=["alcohol", "ash"])
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        file_path = Path(tempdir) / f"train.{ext}"
+        if ext == "parquet":
+            df.to_parquet(file_path)
+        elif ext == "feather":
+            df.to_feather(file_path)
+        elif ext == "npy":
+            numpy.save(file_path, df.to_records(index=False))
+        else:
+            numpy.savez(file_path, **{column: df[column] for column in df.columns})
+
+        loaded = model.load_dataframe(file_path)
+        assert "alcohol" not in loaded.columns
+        assert "ash" not in loaded.columns
+        assert "target" in loaded.columns
+
+        loaded = model.load_dataframe(file_path, with_target=False)
+        assert "target" not in loaded.columns
+
+        expected_X, expected_y = model.load_data(FIXTURE_PATH / "data" / "train.csv")
+        X, y = model.load_data(file_path)
+        numpy.testing.assert_allclose(X, expected_X)
+        numpy.testing.assert_array_equal(y, expected_y)
@@ -0,0 +1,89 @@
+from pathlib import Path
+
+import numpy
+import pytest
+from sklearn.base import BaseEstimator
+from sklearn.linear_model import SGDClassifier
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+
+from automlcli.incremental import get_incremental_updater
+from automlcli.models.model import Model
+
+FIXTURE_PATH = Path("tests/fixtures")
+
+
+class SklearnModel(Model):
+    def __init__(self, target_column: str, estimator: BaseEstimator) -> None:
+        super().__init__(target_column)
+        self._estimator = estimator
+
+    @property
+    def estimator(self) -> BaseEstimator:
+        return self._estimator
+
+
+def test_get_incremental_updater() -> None:
+    assert get_incremental_updater(SGDClassifier()) is not None
+    assert get_incremental_updater(make_pipeline(StandardScaler(), SGDClassifier()))
+    assert get_incremental_updater(DecisionTreeClassifier()) is None
+
+
+def test_retrain_incrementally() -> None:
+    data_path = FIXTURE_PATH / "data" / "train.csv"
+
+    estimator = make_pipeline(StandardScaler(), SGDClassifier(random_state=0))
+    model = SklearnModel("target", estimator)
+    X, y = model.load_data(data_path)
+    estimator.fit(X, y)
+    coef = estimator[-1].coef_.copy()
+
+    assert model.retrain_incrementally(data_path, chunk_size=32)
+    assert (estimator[-1].coef_ != coef).any()
+
+    model = SklearnModel("target", DecisionTreeClassifier().fit(X, y))
+    assert not model.retrain_incrementally(data_path, chunk_size=32)
+
+
+def test_retrain_incrementally_boosting() -> None:
+    lightgbm = pytest.importorskip("lightgbm")
+    data_path = FIXTURE_PATH / "data" / "train.csv"
+
+    estimator = lightgbm.LGBMClassifier(n_estimators=10, min_child_samples=1)
+    model = SklearnModel("target", estimator)
+    X, y = model.load_data(data_path)
+    estimator.fit(X, y)
+
+    # Boosting models are refitted from scratch unless the rounds are capped.
+    assert not model.retrain_incrementally(data_path, chunk_size=32)
+
+    num_chunks = -(-len(X) // 32)
+    assert model.retrain_incrementally(data_path, chunk_size=32, rounds_per_chunk=2)
+    assert estimator.booster_.current_iteration() == 10 + 2 * num_chunks
+    assert estimator.n_estimators == 10
+
+
+@pytest.mark.parametrize("module_name", ["lightgbm", "xgboost"])
+def test_incremental_updater_pins_classes(module_name: str) -> None:
+    module = pytest.importorskip(module_name)
+    data_path = FIXTURE_PATH / "data" / "train.csv"
+
+    if module_name == "lightgbm":
+        estimator = module.LGBMClassifier(n_estimators=5, min_child_samples=1)
+    else:
+        estimator = module.XGBClassifier(n_estimators=5)
+    X, y = SklearnModel("target", estimator).load_data(data_path)
+    assert y is not None
+    estimator.fit(X, y)
+
+    update = get_incremental_updater(estimator, rounds_per_chunk=2)
+    assert update is not None
+
+    # A chunk lacking a class keeps the class set of the first fit.
+    update(X[y != 2], y[y != 2])
+    assert estimator.classes_.tolist() == [0, 1, 2]
+    assert estimator.predict_proba(X).shape == (len(X), 3)
+
+    with pytest.raises(ValueError, match="Classes not seen"):
+        update(X[:2], numpy.array([0, 3]))
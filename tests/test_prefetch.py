@@ -0,0 +1,46 @@
+import functools
+import tempfile
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from automlcli.prefetch import Prefetcher, is_remote
+
+
+def test_is_remote() -> None:
+    assert is_remote("s3://bucket/train.csv")
+    assert is_remote("https://example.com/train.csv")
+    assert not is_remote("tests/fixtures/data/train.csv")
+    assert not is_remote("file:///tmp/train.csv")
+
+
+def test_prefetcher_downloads_concurrently() -> None:
+    with tempfile.TemporaryDirectory() as tempdir:
+        for name in ("train.csv", "dev.csv"):
+            (Path(tempdir) / name).write_text(f"name\n{name}\n")
+
+        handler = functools.partial(SimpleHTTPRequestHandler, directory=tempdir)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            # Use a unique path so that earlier runs do not hit the minato cache.
+            base_url = f"http://127.0.0.1:{server.server_port}"
+            urls = [
+                f"{base_url}/{name}?{id(tempdir)}" for name in ("train.csv", "dev.csv")
+            ]
+
+            prefetcher = Prefetcher(max_workers=2)
+            prefetcher.prefetch([*urls, None, "tests/fixtures/data/test.csv"])
+            # Waiting does not download the registered files again.
+            prefetcher.prefetch(urls, wait=True)
+            assert all(prefetcher._futures[url].done() for url in urls)
+
+            for url, name in zip(urls, ("train.csv", "dev.csv")):
+                assert prefetcher.cached_path(url).read_text() == f"name\n{name}\n"
+            assert prefetcher.cached_path("tests/fixtures/data/test.csv") == Path(
+                "tests/fixtures/data/test.csv"
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,63 @@
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from automlcli.commands import main
+from automlcli.commands.train import TrainCommand  # noqa: F401
+from automlcli.profiling import Profiler
+
+FIXTURE_PATH = Path("tests/fixtures")
+
+
+def test_profiler_accumulates_stages() -> None:
+    profiler = Profiler()
+    for _ in range(3):
+        with profiler.stage("parse"):
+            sum(range(1000))
+
+    timings = profiler.timings
+    assert timings["parse"]["count"] == 3
+    assert timings["parse"]["wall_time"] > 0
+    assert "profile.parse.cpu_time" in profiler.get_metrics()
+
+
+def test_profiler_save() -> None:
+    profiler = Profiler(report="cprofile")
+    profiler.start()
+    with profiler.stage("fit"):
+        sorted(range(1000), reverse=True)
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        profiler.save(tempdir)
+
+        with open(Path(tempdir) / "timings.json") as fp:
+            assert "fit" in json.load(fp)
+        assert (Path(tempdir) / "profile.prof").is_file()
+
+
+def test_train_saves_final_timings(monkeypatch) -> None:
+    config_path = FIXTURE_PATH / "configs" / "config.yml"
+    monkeypatch.setattr("automlcli.profiling._profiler", None)
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        output_dir = Path(tempdir) / "output"
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "automl",
+                "train",
+                str(config_path),
+                "--overrides",
+                "model.target_column=target",
+                "--serialization-dir",
+                str(output_dir),
+                "--profile",
+            ],
+        )
+        main()
+
+        # Timings are saved again after the training command has finished.
+        with open(output_dir / "timings.json") as fp:
+            assert {"fit", "save_model", "total"} <= set(json.load(fp))
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from automlcli.exceptions import ConfigurationError, ResourceLimitExceeded
+from automlcli.models.flaml import FLAML
+from automlcli.models.model import Model
+from automlcli.profiling import Profiler, profile_stage
+from automlcli.resources import ResourceLimits, parse_size, train_with_limits
+
+FIXTURE_PATH = Path("tests/fixtures")
+
+
+class SlowModel(Model):
+    def __init__(self, recover_time: float) -> None:
+        super().__init__("target")
+        self._recover_time = recover_time
+
+    def train(self, *args: Any, **kwargs: Any) -> Dict[str, float]:
+        time.sleep(60)
+        return {}
+
+    def recover(self, *args: Any, **kwargs: Any) -> Dict[str, float]:
+        with profile_stage("recover"):
+            time.sleep(self._recover_time)
+        return {"pid": float(os.getpid())}
+
+
+def test_parse_size() -> None:
+    assert parse_size(1024) == 1024
+    assert parse_size("512MB") == 512 * 1024 ** 2
+    assert parse_size("8G") == 8 * 1024 ** 3
+    with pytest.raises(ConfigurationError):
+        parse_size("eight gigabytes")
+
+
+def test_resource_limits_from_config() -> None:
+    limits = ResourceLimits.from_config({"wall_time": 60, "memory": "1GB", "cpus": 2})
+    assert limits.memory == 1024 ** 3
+    assert limits.training_time() == pytest.approx(54)
+    assert limits.search_time() == pytest.approx(48.6)
+
+    limits = ResourceLimits.from_config({"wall_time": 60, "recovery_time": 20})
+    assert limits.training_time() == pytest.approx(40)
+
+    with pytest.raises(ConfigurationError):
+        ResourceLimits.from_config({"gpus": 1})
+    with pytest.raises(ConfigurationError):
+        ResourceLimits.from_config({"wall_time": 60, "recovery_time": 60})
+
+
+def test_flaml_apply_resource_limits() -> None:
+    model = FLAML(target_column="target", time_budget=120)
+    model.apply_resource_limits(ResourceLimits(wall_time=60, cpus=2))
+    assert model._kwargs["time_budget"] == pytest.approx(48.6)
+    assert model._kwargs["n_jobs"] == 2
+
+
+def test_train_with_limits_recovers_best_model() -> None:
+    data_path = FIXTURE_PATH / "data" / "train.csv"
+
+    # The search itself would run for a minute, but is killed after 8 seconds.
+    model = FLAML(target_column="target", time_budget=60)
+    limits = ResourceLimits(wall_time=20, recovery_time=12)
+    with tempfile.TemporaryDirectory() as tempdir:
+        model, metrics = train_with_limits(
+            model, limits, data_path, data_path, tempdir, poll_interval=0.1
+        )
+
+    assert metrics["resource_limit_exceeded"] == 1.0
+    assert model.predict(data_path).shape[0] > 0
+
+
+def test_train_with_limits_recovers_in_child_process() -> None:
+    data_path = FIXTURE_PATH / "data" / "train.csv"
+
+    limits = ResourceLimits(wall_time=6, recovery_time=3)
+    with tempfile.TemporaryDirectory() as tempdir:
+        _, metrics = train_with_limits(
+            SlowModel(recover_time=0),
+            limits,
+            data_path,
+            workdir=tempdir,
+            poll_interval=0.1,
+        )
+        assert metrics["pid"] != os.getpid()
+
+        # Recovery is killed when it exceeds the rest of the wall-clock limit.
+        start = time.monotonic()
+        with pytest.raises(ResourceLimitExceeded):
+            train_with_limits(
+                SlowModel(recover_time=60),
+                limits,
+                data_path,
+                workdir=tempdir,
+                poll_interval=0.1,
+            )
+        assert time.monotonic() - start < 8
+
+
+def test_train_with_limits_merges_child_timings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    data_path = FIXTURE_PATH / "data" / "train.csv"
+    profiler = Profiler()
+    monkeypatch.setattr("automlcli.profiling._profiler", profiler)
+
+    limits = ResourceLimits(wall_time=4, recovery_time=2)
+    with tempfile.TemporaryDirectory() as tempdir:
+        train_with_limits(
+            SlowModel(recover_time=0),
+            limits,
+            data_path,
+            workdir=tempdir,
+            poll_interval=0.1,
+        )
+
+    # The stage was recorded in the child process.
+    assert profiler.timings["recover"]["count"] == 1
@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import numpy
+import pandas
+import pytest
+
+from automlcli.exceptions import ConfigurationError
+from automlcli.sampling import Sampler
+
+FIXTURE_PATH = Path("tests/fixtures")
+
+
+def _iter_chunks(df: pandas.DataFrame, chunk_size: int):  # type: ignore
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start : start + chunk_size]
+
+
+def test_sampler_with_size() -> None:
+    df = pandas.DataFrame({"x": numpy.arange(10000), "target": numpy.arange(10000) % 2})
+    sampler = Sampler(size=500, seed=0)
+
+    sample = sampler.sample(_iter_chunks(df, 1000), "target")
+    assert len(sample) == 500
+    assert sample["x"].is_unique
+    # Rows are drawn from the whole file, not only from the first chunks.
+    assert sample["x"].max() > 9000
+
+    pandas.testing.assert_frame_equal(
+        sample, sampler.sample(_iter_chunks(df, 1000), "target")
+    )
+    assert len(Sampler(size=20000).sample(_iter_chunks(df, 1000))) == len(df)
+
+
+def test_sampler_with_stratification() -> None:
+    df = pandas.read_csv(FIXTURE_PATH / "data" / "train.csv")
+    sampler = Sampler(size=60, stratify=True)
+
+    sample = sampler.sample(_iter_chunks(df, 16), "target")
+    expected = df["target"].value_counts(normalize=True).sort_index()
+    actual = sample["target"].value_counts(normalize=True).sort_index()
+
+    assert abs(len(sample) - 60) <= len(expected)
+    numpy.testing.assert_allclose(actual, expected, atol=0.02)
+
+
+def test_sampler_with_fraction() -> None:
+    df = pandas.DataFrame({"x": numpy.arange(10000)})
+    sample = Sampler(fraction=0.1).sample(_iter_chunks(df, 1000))
+    assert 800 < len(sample) < 1200
+
+
+def test_sampler_from_config() -> None:
+    assert Sampler.from_config(None) is None
+
+    sampler = Sampler.from_config({"fraction": 0.5, "stratify": True})
+    assert sampler is not None
+    assert sampler.fraction == 0.5
+
+    for config in ({}, {"size": 10, "fraction": 0.1}, {"size": 0}, {"rows": 10}):
+        with pytest.raises(ConfigurationError):
+            Sampler.from_config(config)
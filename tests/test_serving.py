@@ -0,0 +1,219 @@
+import http.client
+import json
+import socketserver
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pandas
+from sklearn.base import BaseEstimator
+from sklearn.tree import DecisionTreeClassifier
+
+from automlcli.models.model import Model
+from automlcli.serving import MicroBatcher, create_server
+
+FIXTURE_PATH = Path("tests/fixtures")
+
+
+class DummyModel:
+    index_column = None
+
+    def check_columns(self, df: pandas.DataFrame) -> None:
+        pass
+
+    def predict_dataframe(self, df: pandas.DataFrame) -> pandas.DataFrame:
+        return pandas.DataFrame({"target": df["x"] * 2}, index=df.index)
+
+
+def _get_port(server: socketserver.BaseServer) -> int:
+    assert isinstance(server.server_address, tuple)
+    return int(server.server_address[1])
+
+
+def test_micro_batcher() -> None:
+    batch_sizes: List[int] = []
+
+    def predict(df: pandas.DataFrame) -> pandas.DataFrame:
+        batch_sizes.append(len(df))
+        return DummyModel().predict_dataframe(df)
+
+    batcher = MicroBatcher(predict, max_batch_size=8, max_wait=0.05)
+    batcher.start()
+    try:
+        futures = [
+            batcher.submit(pandas.DataFrame({"x": [i, i + 1]})) for i in range(10)
+        ]
+        results = [future.result(timeout=5) for future in futures]
+    finally:
+        batcher.stop()
+
+    for i, result in enumerate(results):
+        assert result["target"].tolist() == [2 * i, 2 * (i + 1)]
+    assert sum(batch_sizes) == 20
+    assert len(batch_sizes) < 10
+    assert max(batch_sizes) <= 8
+
+
+def test_micro_batcher_max_batch_size() -> None:
+    batch_sizes: List[int] = []
+
+    def predict(df: pandas.DataFrame) -> pandas.DataFrame:
+        batch_sizes.append(len(df))
+        return DummyModel().predict_dataframe(df)
+
+    batcher = MicroBatcher(predict, max_batch_size=8, max_wait=0.05)
+    futures = [batcher.submit(pandas.DataFrame({"x": [i] * 3})) for i in range(10)]
+    futures.append(batcher.submit(pandas.DataFrame({"x": [10] * 9})))
+    batcher.start()
+    try:
+        results = [future.result(timeout=5) for future in futures]
+    finally:
+        batcher.stop()
+
+    for i, result in enumerate(results):
+        assert result["target"].tolist() == [2 * i] * len(result)
+    # Batches stop before exceeding the limit, except for a larger request.
+    assert batch_sizes == [6] * 5 + [9]
+
+
+def test_micro_batcher_fails_only_malformed_requests() -> None:
+    def predict(df: pandas.DataFrame) -> pandas.DataFrame:
+        if (df["x"] < 0).any():
+            raise ValueError("x must not be negative")
+        return DummyModel().predict_dataframe(df)
+
+    batcher = MicroBatcher(predict, max_wait=0.05)
+    futures = [
+        batcher.submit(pandas.DataFrame({"x": [1]})),
+        batcher.submit(pandas.DataFrame({"x": [-2]})),
+        batcher.submit(pandas.DataFrame({"x": [3]})),
+    ]
+    batcher.start()
+    try:
+        assert futures[0].result(timeout=5)["target"].tolist() == [2]
+        assert isinstance(futures[1].exception(timeout=5), ValueError)
+        assert futures[2].result(timeout=5)["target"].tolist() == [6]
+    finally:
+        batcher.stop()
+
+
+def test_prediction_server() -> None:
+    model = DummyModel()
+    batcher = MicroBatcher(model.predict_dataframe)
+    server = create_server(model, batcher, port=0)  # type: ignore
+    port = _get_port(server)
+
+    batcher.start()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    def request(x: int) -> List[Dict[str, int]]:
+        req = urllib.request.Request(
+            f"http://127.0.0.1:{port}/predict",
+            data=json.dumps([{"x": x}]).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(req) as response:
+            return json.loads(response.read())  # type: ignore
+
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(request, range(8)))
+    finally:
+        server.shutdown()
+        server.server_close()
+        batcher.stop()
+
+    assert results == [[{"target": 2 * x}] for x in range(8)]
+
+
+def test_prediction_server_invalid_content_length() -> None:
+    model = DummyModel()
+    batcher = MicroBatcher(model.predict_dataframe)
+    server = create_server(model, batcher, port=0)  # type: ignore
+    port = _get_port(server)
+
+    batcher.start()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+        connection.putrequest("POST", "/predict")
+        connection.putheader("Content-Type", "application/json")
+        connection.putheader("Content-Length", "abc")
+        connection.endheaders()
+        status = connection.getresponse().status
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        batcher.stop()
+
+    assert status == 400
+
+
+class SklearnModel(Model):
+    def __init__(self, target_column: str, estimator: BaseEstimator) -> None:
+        super().__init__(target_column)
+        self._estimator = estimator
+
+    @property
+    def estimator(self) -> BaseEstimator:
+        return self._estimator
+
+
+def test_prediction_server_with_shuffled_columns() -> None:
+    data_path = FIXTURE_PATH / "data" / "train.csv"
+    model = SklearnModel("target", DecisionTreeClassifier(random_state=0))
+    X, y = model.load_data(data_path)
+    model.estimator.fit(X, y)
+
+    df = pandas.read_csv(data_path).drop(columns=["target"])
+    expected = model.predict_dataframe(df)["target"].tolist()
+
+    batcher = MicroBatcher(model.predict_dataframe, max_wait=0.05)
+    server = create_server(model, batcher, port=0)
+    port = _get_port(server)
+
+    batcher.start()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    def request(rows: List[Dict[str, Any]]) -> http.client.HTTPResponse:
+        req = urllib.request.Request(
+            f"http://127.0.0.1:{port}/predict",
+            data=json.dumps(rows).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            return urllib.request.urlopen(req)  # type: ignore
+        except urllib.error.HTTPError as e:
+            return e  # type: ignore
+
+    # Every other request has its keys in reverse order, and requests with
+    # different key orders share batches.
+    records = df.to_dict(orient="records")
+    shuffled = [
+        dict(reversed(list(record.items()))) if i % 2 else record
+        for i, record in enumerate(records)
+    ]
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            responses = list(executor.map(lambda row: request([row]), shuffled))
+        results = [json.loads(response.read())[0]["target"] for response in responses]
+
+        missing = request([{"alcohol": 1.0}])
+        unexpected = request([dict(records[0], color="red")])
+    finally:
+        server.shutdown()
+        server.server_close()
+        batcher.stop()
+
+    assert results == expected
+    assert missing.status == 400
+    assert "malic_acid" in json.loads(missing.read())["error"]
+    assert unexpected.status == 400
+    assert "color" in json.loads(unexpected.read())["error"]
@@ -0,0 +1,71 @@
+import tempfile
+from pathlib import Path
+
+import numpy
+import pandas
+import pytest
+
+from automlcli.models import Model
+from automlcli.shards import expand_data_path, get_shard_names
+
+FIXTURE_PATH = Path("tests/fixtures")
+
+
+def _write_shards(root: Path, df: pandas.DataFrame, num_shards: int) -> None:
+    shard_size = -(-len(df) // num_shards)
+    for i in range(num_shards):
+        shard_dir = root / f"dt={i:02d}"
+        shard_dir.mkdir(parents=True)
+        shard = df.iloc[i * shard_size : (i + 1) * shard_size]
+        shard.to_csv(shard_dir / "part-0.csv", index=False)
+    (root / "_SUCCESS").touch()
+
+
+def test_expand_data_path() -> None:
+    df = pandas.read_csv(FIXTURE_PATH / "data" / "train.csv")
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        root = Path(tempdir)
+        _write_shards(root, df, 3)
+        expected = [str(root / f"dt={i:02d}" / "part-0.csv") for i in range(3)]
+
+        assert expand_data_path(root) == expected
+        assert expand_data_path(f"{tempdir}/*/*.csv") == expected
+        assert expand_data_path(expected[::-1]) == expected[::-1]
+        assert expand_data_path(f"osfs://{tempdir}/") == [
+            f"osfs://{path}" for path in expected
+        ]
+        assert expand_data_path(f"osfs://{tempdir}/dt=0[01]/*.csv") == [
+            f"osfs://{path}" for path in expected[:2]
+        ]
+        assert expand_data_path(None) == []
+
+        with pytest.raises(FileNotFoundError):
+            expand_data_path(f"{tempdir}/*.parquet")
+
+
+def test_get_shard_names() -> None:
+    assert get_shard_names(["s3://b/x/dt=1/a.csv", "s3://b/x/dt=2/a.csv"]) == [
+        "dt=1/a.csv",
+        "dt=2/a.csv",
+    ]
+    assert get_shard_names(["data/train.csv"]) == ["train.csv"]
+
+
+def test_load_sharded_data() -> None:
+    data_path = FIXTURE_PATH / "data" / "train.csv"
+    df = pandas.read_csv(data_path)
+    model = Model(target_column="target", feature_dtype="auto")
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        _write_shards(Path(tempdir), df, 4)
+
+        pandas.testing.assert_frame_equal(model.load_dataframe(tempdir), df)
+
+        expected_X, expected_y = model.load_data(data_path)
+        X, y = model.load_data(tempdir)
+        numpy.testing.assert_array_equal(X, expected_X)
+        numpy.testing.assert_array_equal(y, expected_y)
+
+        chunks = list(model.iter_dataframes(tempdir, chunk_size=1000))
+        assert len(chunks) == 4
@@ -0,0 +1,31 @@
+import tempfile
+from pathlib import Path
+
+from automlcli.sync import DirectorySync
+
+
+def test_directory_sync_uploads_modified_files() -> None:
+    with tempfile.TemporaryDirectory() as local_dir, tempfile.TemporaryDirectory() as remote_dir:
+        local_path = Path(local_dir)
+        remote_path = Path(remote_dir)
+        (local_path / "logs").mkdir()
+        (local_path / "config.yaml").write_text("model: {}\n")
+        (local_path / "logs" / "train.log").write_text("epoch 1\n")
+
+        syncer = DirectorySync(
+            local_dir, f"osfs://{remote_dir}", workers=2, part_size=4
+        )
+        try:
+            assert syncer.sync() == 2
+            assert (remote_path / "config.yaml").read_text() == "model: {}\n"
+            assert (remote_path / "logs" / "train.log").read_text() == "epoch 1\n"
+
+            # Only files modified since the last sync are uploaded.
+            assert syncer.sync() == 0
+            (local_path / "logs" / "train.log").write_text("epoch 1\nepoch 2\n")
+            assert syncer.sync() == 1
+            assert (
+                remote_path / "logs" / "train.log"
+            ).read_text() == "epoch 1\nepoch 2\n"
+        finally:
+            syncer.close()
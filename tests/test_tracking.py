@@ -0,0 +1,87 @@
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Tuple
+
+from mlflow.tracking import MlflowClient
+
+from automlcli.tracking import MlflowLogger
+
+
+class FlakyClient:
+    def __init__(
+        self, client: MlflowClient, failures: int = 0, delay: float = 0.0
+    ) -> None:
+        self._client = client
+        self._failures = failures
+        self._delay = delay
+
+    def log_batch(self, *args: Any, **kwargs: Any) -> None:
+        if self._failures > 0:
+            self._failures -= 1
+            raise ConnectionError("tracking server is unavailable")
+        self._client.log_batch(*args, **kwargs)
+
+    def log_artifact(self, *args: Any, **kwargs: Any) -> None:
+        time.sleep(self._delay)
+        self._client.log_artifact(*args, **kwargs)
+
+
+def _create_run(tempdir: str) -> Tuple[MlflowClient, str]:
+    client = MlflowClient(tracking_uri=f"file:{tempdir}/mlruns")
+    experiment_id = client.create_experiment("test")
+    return client, client.create_run(experiment_id).info.run_id
+
+
+def test_mlflow_logger() -> None:
+    with tempfile.TemporaryDirectory() as tempdir:
+        client, run_id = _create_run(tempdir)
+
+        artifact_dir = Path(tempdir) / "workdir"
+        (artifact_dir / "model").mkdir(parents=True)
+        (artifact_dir / "metrics.json").write_text("{}")
+        (artifact_dir / "model" / "model.pkl").write_bytes(b"model")
+
+        mlflow_logger = MlflowLogger(
+            run_id,
+            FlakyClient(client, failures=1),
+            batch_interval=0.01,
+            retry_interval=0.01,
+        )
+        mlflow_logger.log_params({"config": {"model": {"type": "flaml"}}})
+        mlflow_logger.log_metrics({"best_loss": 0.5})
+        mlflow_logger.log_artifacts(artifact_dir)
+
+        # Artifacts are snapshotted, so the source can be removed right away.
+        (artifact_dir / "metrics.json").unlink()
+
+        assert mlflow_logger.close(timeout=30)
+
+        run = client.get_run(run_id)
+        assert run.data.params == {"config.model.type": "flaml"}
+        assert run.data.metrics == {"best_loss": 0.5}
+        assert {artifact.path for artifact in client.list_artifacts(run_id)} == {
+            "metrics.json",
+            "model",
+        }
+        assert [
+            artifact.path for artifact in client.list_artifacts(run_id, "model")
+        ] == ["model/model.pkl"]
+
+
+def test_mlflow_logger_gives_up_after_deadline() -> None:
+    with tempfile.TemporaryDirectory() as tempdir:
+        client, run_id = _create_run(tempdir)
+        (Path(tempdir) / "workdir").mkdir()
+        (Path(tempdir) / "workdir" / "model.pkl").write_bytes(b"model")
+
+        mlflow_logger = MlflowLogger(
+            run_id, FlakyClient(client, delay=10.0), batch_interval=0.01
+        )
+        mlflow_logger.log_metrics({"best_loss": 0.5})
+        mlflow_logger.log_artifacts(Path(tempdir) / "workdir")
+
+        start = time.monotonic()
+        assert not mlflow_logger.close(timeout=0.5)
+        assert time.monotonic() - start < 5.0
+        assert client.get_run(run_id).data.metrics == {"best_loss": 0.5}